@@ -0,0 +1,254 @@
+import numpy as np
+import pandas as pd
+
+from football_data import odds_decimais
+
+# Mercados disponíveis: coluna de odds e resultados (FTR) que vencem a aposta
+MERCADOS = {
+    '1 (Casa)': ('B365H', ['H']),
+    'X (Empate)': ('B365D', ['D']),
+    '2 (Visitante)': ('B365A', ['A']),
+    '1X (Casa ou Empate)': ('B365_1X', ['H', 'D']),
+    'X2 (Empate ou Visitante)': ('B365_X2', ['D', 'A']),
+    '12 (Casa ou Visitante)': ('B365_12', ['H', 'A']),
+}
+
+# Faixas de odds usadas na análise de lucratividade
+FAIXAS_ODDS = [1.01, 1.51, 2.01, 2.51, 3.01, 3.51, 4.01, 4.51, 5.01, 6.01, 7.01, 8.01, 9.01, 10.01, 11.01, 12.01, 13.01, 14.01, 15.01, float('inf')]
+ROTULOS_FAIXAS = ['1.01-1.5', '1.51-2.0', '2.01-2.5', '2.51-3.0', '3.01-3.5', '3.51-4.0', '4.01-4.5', '4.51-5.0', '5.01-6.0', '6.01-7.0', '7.01-8.0', '8.01-9.0', '9.01-10.0', '10.01-11.0', '11.01-12.0', '12.01-13.0', '13.01-14.0', '14.01-15.0', '15.0+']
+
+
+# Função para montar o vetor de odds e a máscara de apostas vencedoras de um mercado
+def odds_e_vitorias(data, mercado):
+    odds_col, resultados = MERCADOS[mercado]
+    odds = odds_decimais(data[odds_col]).to_numpy()
+    vitorias = data['FTR'].isin(resultados).to_numpy()
+    return odds, vitorias
+
+
+# Função para calcular o lucro/prejuízo de cada aposta com valor fixo
+def calcular_lucros(odds, vitorias, valor_aposta):
+    return np.where(vitorias, valor_aposta * (odds - 1), -valor_aposta)
+
+
+# Função para calcular o backtest com operações vetorizadas.
+# A evolução da banca é a soma acumulada sequencial dos lucros a partir da banca inicial,
+# o que reproduz exatamente a aposta a aposta do cálculo linha por linha.
+def calcular_backtest(data, mercado, banca_inicial, valor_aposta):
+    odds, vitorias = odds_e_vitorias(data, mercado)
+    lucros = calcular_lucros(odds, vitorias, valor_aposta)
+
+    evolucao_banca = np.cumsum(np.concatenate(([banca_inicial], lucros)))
+    banca = evolucao_banca[-1]
+
+    total_apostas = len(lucros)
+    apostas_ganhas = int(vitorias.sum())
+    apostas_perdidas = total_apostas - apostas_ganhas
+
+    roi = round(((banca - banca_inicial) / banca_inicial) * 100, 2)
+    return banca, total_apostas, apostas_ganhas, apostas_perdidas, roi, evolucao_banca
+
+
+# Função para classificar cada jogo na faixa de odds do mercado, sem alterar o DataFrame
+def faixas_de_odds(data, mercado):
+    odds_col = MERCADOS[mercado][0]
+    faixas = pd.cut(odds_decimais(data[odds_col]), bins=FAIXAS_ODDS, labels=ROTULOS_FAIXAS, include_lowest=True)
+    return faixas.rename('Faixa de Odds')
+
+
+# Função para calcular o backtest de todos os grupos de uma só vez.
+# `chaves` pode ser o nome de uma coluna, uma Series alinhada ao DataFrame (ex.: faixas de odds)
+# ou uma lista delas (ex.: ['Div', 'Temporada']). Jogos com chave vazia são ignorados.
+def backtest_agrupado(data, mercado, banca_inicial, valor_aposta, chaves):
+    if not isinstance(chaves, list):
+        chaves = [chaves]
+    chaves = [data[chave] if isinstance(chave, str) else chave for chave in chaves]
+
+    odds, vitorias = odds_e_vitorias(data, mercado)
+    lucros = pd.Series(calcular_lucros(odds, vitorias, valor_aposta), index=data.index)
+    vitorias = pd.Series(vitorias, index=data.index)
+
+    def agrupar(serie):
+        return serie.groupby(chaves, sort=False, observed=True)
+
+    # A banca inicial entra na primeira aposta de cada grupo. O cumsum do groupby usa soma compensada
+    # (Kahan) e pode diferir na última casa do float; o np.cumsum por grupo faz as mesmas adições, na mesma
+    # ordem, do backtest aposta a aposta (banca += lucro) e propaga NaN como ele.
+    lucros = lucros.where(agrupar(lucros).cumcount() > 0, lucros + banca_inicial)
+    evolucao = agrupar(lucros).transform(lambda serie: np.cumsum(serie.to_numpy()))
+
+    # Uma odd ausente em aposta vencedora invalida a banca do grupo, como no cálculo sequencial
+    banca_final = agrupar(evolucao).last().where(~agrupar(evolucao.isna()).any())
+    apostas_ganhas = agrupar(vitorias).sum()
+    total_apostas = agrupar(vitorias).size()
+
+    resultados = pd.DataFrame({
+        'Banca Final': banca_final,
+        'ROI': (((banca_final - banca_inicial) / banca_inicial) * 100).round(2),
+        'Apostas Ganhas': apostas_ganhas,
+        'Apostas Perdidas': total_apostas - apostas_ganhas,
+        'Zerou Banca': (agrupar(evolucao).min() <= 0) | (banca_inicial <= 0),
+    })
+    return resultados.reset_index()
+
+
+# Função para gerar a grade de odds da varredura (ex.: 1.10, 1.20, ..., 5.00)
+def grade_de_odds(odd_inicial, odd_final, passo):
+    return np.round(np.arange(odd_inicial, odd_final + passo / 2, passo), 2)
+
+
+# Função para avaliar de uma só vez todas as combinações de mercado x liga x faixa de odds.
+# Para cada mercado e liga as odds são ordenadas uma única vez; cada faixa [odd_min, odd_max]
+# da grade vira um intervalo contínuo (searchsorted) e o lucro sai das somas acumuladas,
+# sem refiltrar o DataFrame. A faixa é aplicada às odds do próprio mercado.
+def varredura_backtest(data, mercados, ligas, grade, banca_inicial, valor_aposta):
+    inicio, fim = np.triu_indices(len(grade), k=1)
+    odd_min, odd_max = grade[inicio], grade[fim]
+    divisoes = data['Div'].to_numpy()
+
+    resultados = []
+    for mercado in mercados:
+        odds, vitorias = odds_e_vitorias(data, mercado)
+        lucros = calcular_lucros(odds, vitorias, valor_aposta)
+
+        for liga in ligas:
+            mascara = ~np.isnan(odds)
+            if liga != 'Todas':
+                mascara &= divisoes == liga
+
+            ordem = np.argsort(odds[mascara], kind='stable')
+            odds_ordenadas = odds[mascara][ordem]
+            lucro_acumulado = np.concatenate(([0.0], np.cumsum(lucros[mascara][ordem])))
+            ganhas_acumuladas = np.concatenate(([0], np.cumsum(vitorias[mascara][ordem])))
+
+            i = np.searchsorted(odds_ordenadas, odd_min, side='left')
+            j = np.searchsorted(odds_ordenadas, odd_max, side='right')
+            total_apostas = j - i
+            lucro = lucro_acumulado[j] - lucro_acumulado[i]
+            apostas_ganhas = ganhas_acumuladas[j] - ganhas_acumuladas[i]
+
+            with np.errstate(invalid='ignore', divide='ignore'):
+                yield_apostas = np.where(total_apostas > 0, lucro / (total_apostas * valor_aposta) * 100, np.nan)
+
+            resultados.append(pd.DataFrame({
+                'Mercado': mercado,
+                'Liga': liga,
+                'Odd Mínima': odd_min,
+                'Odd Máxima': odd_max,
+                'Total de Apostas': total_apostas,
+                'Apostas Ganhas': apostas_ganhas,
+                'Apostas Perdidas': total_apostas - apostas_ganhas,
+                'Banca Final': banca_inicial + lucro,
+                'ROI': np.round(lucro / banca_inicial * 100, 2),
+                'Yield (%)': np.round(yield_apostas, 2),
+            }))
+
+    return pd.concat(resultados, ignore_index=True)
+
+
+# Planos de gestão de banca disponíveis no backtest
+PLANOS_GESTAO = ['Aposta Fixa', '% da Banca', 'Kelly Fracionado', 'Martingale']
+
+
+# Crescimento máximo da banca (múltiplo da banca inicial) nos planos proporcionais: em séries longas
+# o produto acumulado chegaria ao overflow do float64 (inf), então a simulação para ao atingi-lo
+LIMITE_CRESCIMENTO_BANCA = 1e12
+
+
+# Função para estimar a probabilidade justa de cada aposta pela taxa de acerto da sua faixa de odds,
+# contando apenas as apostas anteriores da mesma faixa (janela crescente, sem olhar o futuro).
+# A primeira aposta de cada faixa fica sem estimativa (NaN) e não recebe stake no Kelly.
+def probabilidade_por_faixa(data, mercado):
+    _, vitorias = odds_e_vitorias(data, mercado)
+    faixas = faixas_de_odds(data, mercado)
+    vitorias = pd.Series(vitorias, index=data.index, dtype='float64')
+    agrupado = vitorias.groupby(faixas, observed=True, sort=False)
+    acertos_anteriores = agrupado.cumsum() - vitorias
+    apostas_anteriores = agrupado.cumcount()
+    taxa = acertos_anteriores / apostas_anteriores.where(apostas_anteriores > 0)
+    return taxa.to_numpy(dtype='float64')
+
+
+# Função que simula a evolução da banca aposta a aposta para qualquer plano de gestão.
+# Os planos dependem da banca corrente, mas cada um tem forma fechada em arrays:
+# - Aposta Fixa e Martingale: banca = soma acumulada de (aposta x retorno);
+#   no Martingale a aposta dobra a cada derrota seguida (sequência calculada com maximum.accumulate);
+# - % da Banca e Kelly: banca = banca inicial x produto acumulado de (1 + fração x retorno),
+#   acumulado em escala logarítmica e interrompido em LIMITE_CRESCIMENTO_BANCA (evita overflow).
+# As paradas (stop loss e banca insuficiente) não alteram o caminho anterior a elas,
+# então basta localizar a primeira aposta bloqueada e cortar a série.
+# Retorna a evolução da banca, as apostas e a posição da aposta em que o limite de crescimento cortou a série
+# (None quando a série não foi cortada pelo limite).
+def simular_gestao(odds, vitorias, banca_inicial, plano, valor_aposta=10.0, percentual=2.0,
+                   fracao_kelly=0.25, prob_justa=None, stop_loss=0.0, parar_na_quebra=False):
+    retornos = np.where(vitorias, odds - 1, -1.0)
+    total = len(retornos)
+    corte_no_limite = None
+
+    if plano in ('Aposta Fixa', 'Martingale'):
+        if plano == 'Aposta Fixa':
+            apostas = np.full(total, float(valor_aposta))
+        else:
+            indices = np.arange(total)
+            ultima_vitoria = np.maximum.accumulate(np.where(vitorias, indices, -1))
+            derrotas_seguidas = indices - np.concatenate(([-1], ultima_vitoria[:-1])) - 1
+            apostas = np.ldexp(float(valor_aposta), np.minimum(derrotas_seguidas, 1000))
+            # Uma progressão não pode continuar sem banca para a próxima aposta
+            # (a página desativa a opção e avisa que no Martingale a parada é sempre aplicada)
+            parar_na_quebra = True
+        evolucao_banca = np.cumsum(np.concatenate(([banca_inicial], apostas * retornos)))
+    else:
+        if plano == '% da Banca':
+            fracoes = np.full(total, percentual / 100)
+        elif plano == 'Kelly Fracionado':
+            with np.errstate(invalid='ignore', divide='ignore'):
+                kelly = (prob_justa * odds - 1) / (odds - 1)
+            fracoes = np.clip(np.nan_to_num(kelly), 0, 1) * fracao_kelly
+        else:
+            raise ValueError(f'Plano de gestão desconhecido: {plano}')
+        variacao = np.where(fracoes > 0, fracoes * retornos, 0.0)
+        with np.errstate(divide='ignore'):
+            log_crescimento = np.cumsum(np.concatenate(([0.0], np.log1p(variacao))))
+        # A série é cortada na primeira aposta feita com a banca acima do limite de crescimento
+        limite = np.flatnonzero(log_crescimento[:-1] > np.log(LIMITE_CRESCIMENTO_BANCA))
+        if len(limite):
+            total = corte_no_limite = int(limite[0])
+            retornos, log_crescimento, fracoes = retornos[:total], log_crescimento[:total + 1], fracoes[:total]
+        evolucao_banca = banca_inicial * np.exp(log_crescimento)
+        apostas = fracoes * evolucao_banca[:-1]
+
+    banca_antes = evolucao_banca[:-1]
+    bloqueadas = np.zeros(total, dtype=bool)
+    if parar_na_quebra:
+        bloqueadas |= (apostas > banca_antes) | (banca_antes <= 0)
+    if stop_loss > 0:
+        bloqueadas |= banca_antes <= banca_inicial * (1 - stop_loss / 100)
+
+    if bloqueadas.any():
+        parada = int(np.argmax(bloqueadas))
+        evolucao_banca = evolucao_banca[:parada + 1]
+        apostas = apostas[:parada]
+        # A parada veio antes do ponto em que o limite cortaria a série
+        corte_no_limite = None
+
+    return evolucao_banca, apostas, corte_no_limite
+
+
+# Função para calcular o backtest com um plano de gestão de banca.
+# Retorna os mesmos valores de calcular_backtest (com 'Aposta Fixa' e sem paradas o resultado é idêntico)
+# e, por último, a posição em que o limite de crescimento cortou a série (None sem corte).
+def calcular_backtest_gestao(data, mercado, banca_inicial, plano, **parametros):
+    odds, vitorias = odds_e_vitorias(data, mercado)
+    if plano == 'Kelly Fracionado' and parametros.get('prob_justa') is None:
+        parametros['prob_justa'] = probabilidade_por_faixa(data, mercado)
+
+    evolucao_banca, apostas, corte_no_limite = simular_gestao(odds, vitorias, banca_inicial, plano, **parametros)
+    banca = evolucao_banca[-1]
+
+    realizadas = apostas > 0
+    total_apostas = int(realizadas.sum())
+    apostas_ganhas = int((realizadas & vitorias[:len(apostas)]).sum())
+    apostas_perdidas = total_apostas - apostas_ganhas
+
+    roi = round(((banca - banca_inicial) / banca_inicial) * 100, 2)
+    return banca, total_apostas, apostas_ganhas, apostas_perdidas, roi, evolucao_banca, corte_no_limite
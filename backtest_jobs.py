@@ -0,0 +1,126 @@
+import multiprocessing
+import os
+import shutil
+import tempfile
+import weakref
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+import streamlit as st
+
+from backtest import MERCADOS, calcular_lucros, odds_e_vitorias
+from football_data import get_football_dataset
+
+# Número de processos do pool: um por núcleo da máquina, ou menos se BACKTEST_MAX_PROCESSOS for definido
+NUCLEOS = os.cpu_count() or 1
+MAX_PROCESSOS = min(int(os.environ.get('BACKTEST_MAX_PROCESSOS', NUCLEOS)), NUCLEOS)
+
+# Colunas do dataset compartilhado (memmap dos arquivos .npy gravados pelo processo principal)
+# e odds ordenadas de cada processo do pool; as tarefas recebem apenas as configurações
+_colunas = {}
+_ordenacoes = {}
+
+
+# Função para gravar, uma única vez, as colunas usadas pelos backtests em arquivos .npy
+# (odds e vitórias de cada mercado e códigos das ligas)
+def _exportar_colunas(data, diretorio):
+    for indice, mercado in enumerate(MERCADOS):
+        odds, vitorias = odds_e_vitorias(data, mercado)
+        np.save(os.path.join(diretorio, f'odds_{indice}.npy'), odds)
+        np.save(os.path.join(diretorio, f'vitorias_{indice}.npy'), vitorias)
+    np.save(os.path.join(diretorio, 'ligas.npy'), data['Div'].cat.codes.to_numpy())
+    return list(data['Div'].cat.categories)
+
+
+# Função executada na inicialização de cada processo do pool: abre as colunas gravadas pelo processo
+# principal como memmap, sem carregar uma cópia do dataset por processo
+def _iniciar_processo(diretorio, ligas):
+    for nome in os.listdir(diretorio):
+        _colunas[nome[:-len('.npy')]] = np.load(os.path.join(diretorio, nome), mmap_mode='r')
+    _colunas['categorias_ligas'] = ligas
+
+
+# Função para obter (e guardar) as odds ordenadas de um mercado em uma liga
+def _ordenacao(mercado, liga):
+    chave = (mercado, liga)
+    if chave not in _ordenacoes:
+        indice = list(MERCADOS).index(mercado)
+        odds, vitorias = _colunas[f'odds_{indice}'], _colunas[f'vitorias_{indice}']
+        validos = ~np.isnan(odds)
+        if liga != 'Todas':
+            validos &= _colunas['ligas'] == _colunas['categorias_ligas'].index(liga)
+        posicoes = np.flatnonzero(validos)
+        ordem = posicoes[np.argsort(odds[posicoes], kind='stable')]
+        _ordenacoes[chave] = (odds[ordem], ordem, odds, vitorias)
+    return _ordenacoes[chave]
+
+
+# Função que roda um lote de backtests completos (com a evolução da banca) dentro do processo
+def _executar_lote(configs, banca_inicial, valor_aposta):
+    resultados = []
+    for config in configs:
+        odds_ordenadas, ordem, odds, vitorias = _ordenacao(config['Mercado'], config['Liga'])
+        i = np.searchsorted(odds_ordenadas, config['Odd Mínima'], side='left')
+        j = np.searchsorted(odds_ordenadas, config['Odd Máxima'], side='right')
+
+        # Jogos da faixa na ordem original do dataset, como no backtest da página
+        posicoes = np.sort(ordem[i:j])
+        lucros = calcular_lucros(odds[posicoes], vitorias[posicoes], valor_aposta)
+        evolucao_banca = np.cumsum(np.concatenate(([banca_inicial], lucros)))
+
+        apostas_ganhas = int(vitorias[posicoes].sum())
+        resultados.append({
+            **config,
+            'Total de Apostas': len(posicoes),
+            'Apostas Ganhas': apostas_ganhas,
+            'Apostas Perdidas': len(posicoes) - apostas_ganhas,
+            'Banca Final': evolucao_banca[-1],
+            'ROI': round(((evolucao_banca[-1] - banca_inicial) / banca_inicial) * 100, 2),
+            'Zerou Banca': bool((evolucao_banca <= 0).any()),
+            'Drawdown Máximo': float((np.maximum.accumulate(evolucao_banca) - evolucao_banca).max()),
+        })
+    return resultados
+
+
+# Função para obter o pool de processos compartilhado por todas as sessões.
+# O dataset compartilhado do processo principal é gravado uma vez em .npy e os processos o abrem por memmap;
+# o diretório temporário é apagado quando o pool sai do cache ou quando o processo termina.
+@st.cache_resource
+def obter_pool():
+    diretorio = tempfile.mkdtemp(prefix='backtest_')
+    ligas = _exportar_colunas(get_football_dataset(), diretorio)
+    contexto = multiprocessing.get_context('spawn')
+    pool = ProcessPoolExecutor(
+        max_workers=MAX_PROCESSOS, mp_context=contexto,
+        initializer=_iniciar_processo, initargs=(diretorio, ligas)
+    )
+    weakref.finalize(pool, shutil.rmtree, diretorio, ignore_errors=True)
+    return pool
+
+
+# Função para montar as configurações da grade: mercado x liga x faixa de odds
+def configs_da_grade(mercados, ligas, grade):
+    inicio, fim = np.triu_indices(len(grade), k=1)
+    return [
+        {'Mercado': mercado, 'Liga': liga, 'Odd Mínima': float(grade[i]), 'Odd Máxima': float(grade[j])}
+        for mercado in mercados
+        for liga in ligas
+        for i, j in zip(inicio, fim)
+    ]
+
+
+# Função para executar os backtests em paralelo, entregando os resultados à medida que os lotes terminam.
+# É um gerador: produz (fração concluída, resultados do lote). Se a execução da página for interrompida
+# (botão Cancelar ou novo rerun), o gerador é fechado e os lotes ainda não iniciados são cancelados.
+def executar_em_paralelo(configs, banca_inicial, valor_aposta, tamanho_lote=200):
+    pool = obter_pool()
+    futuros = [
+        pool.submit(_executar_lote, configs[i:i + tamanho_lote], banca_inicial, valor_aposta)
+        for i in range(0, len(configs), tamanho_lote)
+    ]
+    try:
+        for concluidos, futuro in enumerate(as_completed(futuros), start=1):
+            yield concluidos / len(futuros), futuro.result()
+    finally:
+        for futuro in futuros:
+            futuro.cancel()
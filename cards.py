@@ -0,0 +1,98 @@
+import streamlit as st
+
+# Cor padrão dos cards de resultados
+COR_PADRAO = '#061c96'
+
+
+# Função para montar o HTML de um card: título e uma linha por valor (a primeira linha em destaque)
+def card_html(titulo, linhas, cor=COR_PADRAO, raio='5px', cor_texto='white', tamanho_titulo=None):
+    estilo_titulo = f'color: {cor_texto}; margin-bottom: 5px;' + (f' font-size: {tamanho_titulo};' if tamanho_titulo else '')
+    paragrafos = ''.join(
+        f'<p style="color: {cor_texto}; font-size: {"24px" if i == 0 else "20px"}; margin: 0;">{linha}</p>'
+        for i, linha in enumerate(linhas)
+    )
+    return (
+        f'<div style="text-align: center; background-color: {cor}; padding: 10px; border-radius: {raio}; margin-bottom: 10px;">'
+        f'<h4 style="{estilo_titulo}">{titulo}</h4>{paragrafos}</div>'
+    )
+
+
+# Função para juntar vários cards em uma grade com o número de colunas informado
+def grade_html(cards, colunas):
+    return (
+        f'<div style="display: grid; grid-template-columns: repeat({colunas}, minmax(0, 1fr)); column-gap: 10px;">'
+        + ''.join(cards) + '</div>'
+    )
+
+
+# Função para exibir uma grade de cards em um único st.markdown (uma mensagem para o navegador por seção)
+def exibir_grade(cards, colunas):
+    if cards:
+        st.markdown(grade_html(cards, colunas), unsafe_allow_html=True)
+
+
+# Função para exibir o total de jogos/partidas filtrados em destaque
+def exibir_total(titulo, valor, raio='5px'):
+    st.markdown(
+        f'<div style="text-align: center; padding: 10px; background-color: {COR_PADRAO}; border-radius: {raio};">'
+        f'<h4 style="color: white; font-size: 24px">{titulo}</h4>'
+        f'<h1 style="color: white; font-size: 35px;">{valor}</h1></div>',
+        unsafe_allow_html=True
+    )
+
+
+# Função para montar os cards de mercados com 'Contagem', 'Porcentagem' e 'Odds Decimais'
+# (resultados, ambas marcam, gol nos dois tempos); itens é uma lista de (título, mercado)
+def cards_de_contagens(itens, raio='5px'):
+    return [
+        card_html(titulo, [
+            mercado['Contagem'],
+            f"{mercado['Porcentagem']:.2f}%",
+            f"Odd Justa: {mercado['Odds Decimais']:.2f}",
+        ], raio=raio)
+        for titulo, mercado in itens
+    ]
+
+
+# Função para montar os cards de placares exatos, com a cor proporcional à frequência
+def cards_de_placares(score_counts, raio='10px'):
+    if score_counts.empty:
+        return []
+
+    placares = score_counts['Score'].to_numpy()
+    frequencias = score_counts['Frequência'].to_numpy()
+    porcentagens = score_counts['Porcentagem'].to_numpy()
+    odds = score_counts['Odd'].to_numpy()
+    intensidades = (porcentagens / porcentagens.max() * 225).astype(int)
+
+    return [
+        f'<div style="text-align: center; background-color: rgb({250 - intensidade}, {intensidade}, 50); color: white; '
+        f'margin: 5px; font-size: 22px; border-radius: {raio}; padding: 10px;">'
+        f'<strong>{placar}</strong><br><span style="font-size: 18px;">Frequência: {frequencia}<br> '
+        f'{porcentagem:.2f}%<br> Odd: {odd:.2f} </span></div>'
+        for placar, frequencia, porcentagem, odd, intensidade in zip(placares, frequencias, porcentagens, odds, intensidades)
+    ]
+
+
+# Função para montar os cards de over ou under (nome = 'Over' ou 'Under') a partir do dicionário de linhas
+def cards_de_linhas(resultados, nome, cor, raio='5px'):
+    cards = []
+    for chave, linha in resultados.items():
+        if not chave.startswith(f'{nome}_'):
+            continue
+        cards.append(
+            f'<div style="background-color: {cor}; padding: 10px; border-radius: {raio}; text-align: center; margin: 10px;">'
+            f'<h3 style="font-size: 22px; margin: 0;">{nome} {chave.split("_")[1]}</h3>'
+            f'<p style="font-size: 18px; margin: 5px 0;">{linha["Ocorrência"]} jogos</p>'
+            f'<p style="font-size: 18px; margin: 5px 0;">{linha["Frequência (%)"]}%</p>'
+            f'<p style="font-size: 18px; margin: 5px 0;">Odd: {linha["Odds"]}</p></div>'
+        )
+    return cards
+
+
+# Função para montar cards de métricas (rótulo e valor com 2 casas); itens é uma lista de (rótulo, valor)
+def cards_de_metricas(itens, cor, raio='5px'):
+    return [
+        card_html(rotulo, [f'{valor:.2f}' if valor is not None else 'N/A'], cor=cor, raio=raio, tamanho_titulo='18px')
+        for rotulo, valor in itens
+    ]
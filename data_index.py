@@ -0,0 +1,98 @@
+import numpy as np
+import pandas as pd
+
+
+# Função para montar o índice ordenado das colunas de odds.
+# Para cada coluna guarda os valores ordenados e a permutação das linhas (posições),
+# de modo que qualquer faixa de odds vira um intervalo contínuo do índice.
+def build_odds_index(data, colunas):
+    indice = {}
+    for coluna in colunas:
+        valores = data[coluna].to_numpy()
+        ordem = np.argsort(valores, kind='stable')
+        indice[coluna] = (valores[ordem], ordem)
+    return indice
+
+
+# Função para obter as posições das linhas com odds entre odd_min e odd_max (inclusive) em O(log n)
+def positions_in_odds_range(indice, coluna, odd_min, odd_max):
+    valores, ordem = indice[coluna]
+    # Limites no mesmo tipo da coluna (float32), como na comparação direta com a coluna
+    tipo = valores.dtype.type
+    inicio = np.searchsorted(valores, tipo(odd_min), side='left')
+    fim = np.searchsorted(valores, tipo(odd_max), side='right')
+    return ordem[inicio:fim]
+
+
+# Função para manter apenas as posições cuja coluna está entre os valores selecionados.
+# Só as linhas já selecionadas são consultadas, sem percorrer o DataFrame inteiro.
+def filter_positions(data, posicoes, coluna, selecionados):
+    serie = data[coluna]
+    if isinstance(serie.dtype, pd.CategoricalDtype):
+        valores = serie.cat.codes.to_numpy()
+        selecionados = serie.cat.categories.get_indexer(list(selecionados))
+        selecionados = selecionados[selecionados >= 0]
+    else:
+        valores = serie.to_numpy()
+    return posicoes[np.isin(valores[posicoes], list(selecionados))]
+
+
+# Função para agrupar as posições das linhas por código (formato CSR: permutação + inícios)
+def _agrupar_posicoes(codigos, total_codigos):
+    ordem = np.argsort(codigos, kind='stable')
+    # Códigos -1 (equipe ausente) ficam no primeiro grupo e nunca são consultados
+    contagem = np.bincount(codigos + 1, minlength=total_codigos + 1)
+    inicios = np.concatenate(([0], np.cumsum(contagem)))
+    return ordem, inicios
+
+
+# Função para montar o índice invertido de equipes e confrontos.
+# Guarda, para cada equipe, as posições dos jogos como mandante e como visitante e,
+# para cada par não ordenado {A, B}, as posições de todos os confrontos entre elas.
+# Requer HomeTeam e AwayTeam categóricas com as mesmas categorias (ver football_data).
+def build_team_index(data):
+    categorias = data['HomeTeam'].cat.categories
+    total_equipes = len(categorias)
+    casa = data['HomeTeam'].cat.codes.to_numpy().astype('int64')
+    fora = data['AwayTeam'].cat.codes.to_numpy().astype('int64')
+
+    validos = (casa >= 0) & (fora >= 0)
+    chaves = np.minimum(casa, fora) * total_equipes + np.maximum(casa, fora)
+    posicoes_validas = np.flatnonzero(validos)
+    ordem_confrontos = posicoes_validas[np.argsort(chaves[validos], kind='stable')]
+
+    return {
+        'categorias': categorias,
+        'HomeTeam': _agrupar_posicoes(casa, total_equipes),
+        'AwayTeam': _agrupar_posicoes(fora, total_equipes),
+        'confrontos': (chaves[ordem_confrontos], ordem_confrontos),
+    }
+
+
+# Função para obter as posições (em ordem crescente) dos jogos das equipes como mandante ou visitante
+def team_positions(indice, coluna, equipes):
+    ordem, inicios = indice[coluna]
+    codigos = indice['categorias'].get_indexer(list(equipes))
+    partes = [ordem[inicios[codigo + 1]:inicios[codigo + 2]] for codigo in codigos if codigo >= 0]
+    if not partes:
+        return np.empty(0, dtype=ordem.dtype)
+    return np.sort(np.concatenate(partes))
+
+
+# Função para obter as posições (em ordem crescente) de todos os confrontos entre duas equipes
+def fixture_positions(indice, equipe_a, equipe_b):
+    codigo_a, codigo_b = indice['categorias'].get_indexer([equipe_a, equipe_b])
+    chaves, ordem = indice['confrontos']
+    if codigo_a < 0 or codigo_b < 0:
+        return np.empty(0, dtype=ordem.dtype)
+    chave = min(codigo_a, codigo_b) * len(indice['categorias']) + max(codigo_a, codigo_b)
+    inicio = np.searchsorted(chaves, chave, side='left')
+    fim = np.searchsorted(chaves, chave, side='right')
+    return ordem[inicio:fim]
+
+
+# Função para manter apenas as posições com a coluna de odds entre odd_min e odd_max
+def filter_positions_by_range(data, posicoes, coluna, odd_min, odd_max):
+    valores = data[coluna].to_numpy()[posicoes]
+    tipo = valores.dtype.type
+    return posicoes[(valores >= tipo(odd_min)) & (valores <= tipo(odd_max))]
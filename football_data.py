@@ -0,0 +1,146 @@
+import os
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from data_index import build_odds_index, build_team_index
+from football_stats import build_stats_cube
+from football_h2h import build_h2h_matrix
+
+# Arquivos de dados do futebol (football-data.co.uk, temporadas 2011-2024)
+ARQUIVO_CSV = 'FootballData.csv'
+ARQUIVO_PARQUET = 'FootballData.parquet'
+
+# Colunas de contagem (gols, finalizações, escanteios, faltas e cartões)
+COLUNAS_CONTAGEM = [
+    'FTHG', 'FTAG', 'HTHG', 'HTAG',
+    'HS', 'AS', 'HST', 'AST', 'HF', 'AF', 'HC', 'AC',
+    'HY', 'AY', 'HR', 'AR',
+]
+
+# Colunas carregadas no dataset compartilhado pelas páginas de futebol
+COLUNAS_DATASET = [
+    'Div', 'Date', 'HomeTeam', 'AwayTeam', 'FTHG', 'FTAG', 'FTR', 'HTHG', 'HTAG', 'HTR',
+    'HS', 'AS', 'HST', 'AST', 'HC', 'AC', 'HY', 'AY', 'HR', 'AR',
+    'B365H', 'B365D', 'B365A',
+]
+
+# Colunas de odds com índice ordenado para os filtros por faixa de odds
+COLUNAS_ODDS = ['B365H', 'B365D', 'B365A', 'B365_1X', 'B365_X2', 'B365_12']
+
+# Colunas com nomes de equipes, que compartilham as mesmas categorias
+COLUNAS_EQUIPES = ['HomeTeam', 'AwayTeam']
+
+
+# Função para definir o menor tipo inteiro que comporta a coluna de contagem
+def _tipo_contagem(serie):
+    serie = pd.to_numeric(serie, errors='coerce')
+    if serie.isna().any():
+        # Jogos sem a estatística preenchida: float32 mantém o NaN com metade do tamanho
+        return serie.astype('float32')
+    return pd.to_numeric(serie, downcast='integer')
+
+
+# Função para converter o CSV em um arquivo colunar e tipado (Parquet)
+def converter_csv_para_parquet(arquivo_csv=ARQUIVO_CSV, arquivo_parquet=ARQUIVO_PARQUET):
+    data = pd.read_csv(arquivo_csv, low_memory=False)
+
+    if 'Date' in data.columns:
+        data['Date'] = pd.to_datetime(data['Date'], dayfirst=True, errors='coerce')
+
+    # Casa e visitante usam a mesma lista de categorias para que os códigos sejam comparáveis
+    # Nomes ausentes continuam como NaN (e não viram uma categoria 'nan')
+    equipes = sorted(pd.Series(data[COLUNAS_EQUIPES].values.ravel('K')).dropna().astype(str).unique())
+    for coluna in COLUNAS_EQUIPES:
+        data[coluna] = pd.Categorical(data[coluna].astype(str).where(data[coluna].notna()), categories=equipes)
+
+    for coluna in data.columns:
+        if coluna in COLUNAS_EQUIPES or coluna == 'Date':
+            continue
+        if coluna in COLUNAS_CONTAGEM:
+            data[coluna] = _tipo_contagem(data[coluna])
+        elif pd.api.types.is_numeric_dtype(data[coluna]):
+            # Odds e demais colunas numéricas
+            data[coluna] = data[coluna].astype('float32')
+        else:
+            # Div, FTR, HTR, árbitro e demais textos repetitivos
+            data[coluna] = data[coluna].astype('category')
+
+    data.to_parquet(arquivo_parquet, index=False)
+    return data
+
+
+# Função para carregar o dataset de futebol lendo apenas as colunas necessárias
+def load_football_data(columns=None, arquivo_parquet=ARQUIVO_PARQUET, arquivo_csv=ARQUIVO_CSV):
+    # Conversão feita uma única vez (ou quando o CSV for atualizado)
+    if not os.path.exists(arquivo_parquet) or (
+        os.path.exists(arquivo_csv) and os.path.getmtime(arquivo_csv) > os.path.getmtime(arquivo_parquet)
+    ):
+        converter_csv_para_parquet(arquivo_csv, arquivo_parquet)
+
+    return pd.read_parquet(arquivo_parquet, columns=columns)
+
+
+# Função para recuperar as odds em float64 exatamente como publicadas no CSV
+def odds_decimais(serie):
+    # As odds são publicadas com até 3 casas decimais; o arredondamento desfaz o erro do float32
+    return np.round(serie.astype('float64'), 3)
+
+
+# Função para identificar a temporada (julho a junho) de cada jogo, ex.: '2019/2020'
+def temporada_da_data(datas):
+    inicio = (datas.dt.year - (datas.dt.month < 7)).astype('Int64')
+    temporada = inicio.astype(str) + '/' + (inicio + 1).astype(str)
+    return temporada.where(datas.notna()).astype('category')
+
+
+# Função para montar o dataset com as colunas derivadas (também usada pelos processos do pool)
+def build_football_dataset(arquivo_parquet=ARQUIVO_PARQUET, arquivo_csv=ARQUIVO_CSV):
+    data = load_football_data(columns=COLUNAS_DATASET, arquivo_parquet=arquivo_parquet, arquivo_csv=arquivo_csv)
+
+    data['Temporada'] = temporada_da_data(data['Date'])
+
+    # Odds do mercado de dupla chance, calculadas a partir das odds publicadas
+    casa, empate, fora = (odds_decimais(data[coluna]) for coluna in ['B365H', 'B365D', 'B365A'])
+    data['B365_1X'] = (1 / ((1 / casa) + (1 / empate))).round(2).astype('float32')  # Casa ou Empate
+    data['B365_X2'] = (1 / ((1 / empate) + (1 / fora))).round(2).astype('float32')  # Empate ou Visitante
+    data['B365_12'] = (1 / ((1 / casa) + (1 / fora))).round(2).astype('float32')  # Casa ou Visitante
+
+    return data
+
+
+# Função para carregar o dataset único do processo, compartilhado entre sessões e páginas.
+# O st.cache_resource entrega o mesmo objeto a todos (sem cópia), por isso o DataFrame
+# retornado não deve ser modificado: as páginas sempre filtram para um novo DataFrame.
+@st.cache_resource
+def get_football_dataset():
+    return build_football_dataset()
+
+
+# Função para obter o índice ordenado das odds do dataset compartilhado (montado uma vez por processo)
+@st.cache_resource
+def get_odds_index():
+    return build_odds_index(get_football_dataset(), COLUNAS_ODDS)
+
+
+# Função para obter o índice de equipes e confrontos do dataset compartilhado
+@st.cache_resource
+def get_team_index():
+    return build_team_index(get_football_dataset())
+
+
+# Função para obter o cubo de estatísticas (liga x faixa de odds) de uma coluna de odds do mando
+@st.cache_resource
+def get_stats_cube(coluna_odds):
+    return build_stats_cube(get_football_dataset(), coluna_odds)
+
+
+# Função para obter as matrizes de confrontos (mandante x visitante) por liga, montadas uma vez por processo
+@st.cache_resource
+def get_h2h_matrix():
+    return build_h2h_matrix(get_football_dataset())
+
+
+if __name__ == '__main__':
+    converter_csv_para_parquet()
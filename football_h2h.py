@@ -0,0 +1,138 @@
+import numpy as np
+import pandas as pd
+
+from football_stats import resultados_de_contagens
+
+# Medidas guardadas para cada par ordenado (mandante, visitante)
+MEDIDAS_H2H = ['Jogos', 'Vitórias Casa', 'Empates', 'Vitórias Visitante', 'Gols Casa', 'Gols Visitante', 'Over 2.5']
+
+# Rótulo da liga dos jogos sem Div
+SEM_LIGA = 'Sem liga'
+
+# Métricas disponíveis na visão de matriz da liga
+METRICAS_MATRIZ = ['Jogos', 'Vitórias Casa (%)', 'Empates (%)', 'Vitórias Visitante (%)', 'Média de Gols', 'Over 2.5 (%)']
+
+
+# Função para montar as matrizes de confrontos (mandante x visitante) de todas as ligas com um único groupby.
+# Também guarda o total de cada par ordenado somando as ligas, para consultas O(1) por dicionário.
+def build_h2h_matrix(data):
+    # Jogos sem liga ficam em uma liga com rótulo explícito (e entram nos totais dos pares)
+    ligas = list(data['Div'].cat.categories) + [SEM_LIGA]
+    divisoes = data['Div'].cat.codes.to_numpy()
+    divisoes = np.where(divisoes < 0, len(ligas) - 1, divisoes)
+
+    gols_casa = data['FTHG'].to_numpy(dtype='float64')
+    gols_fora = data['FTAG'].to_numpy(dtype='float64')
+
+    tabela = pd.DataFrame({
+        'Div': divisoes,
+        'Casa': data['HomeTeam'].cat.codes.to_numpy(),
+        'Fora': data['AwayTeam'].cat.codes.to_numpy(),
+        'Jogos': 1,
+        'Vitórias Casa': (data['FTR'] == 'H').to_numpy().astype('int64'),
+        'Empates': (data['FTR'] == 'D').to_numpy().astype('int64'),
+        'Vitórias Visitante': (data['FTR'] == 'A').to_numpy().astype('int64'),
+        'Gols Casa': np.nan_to_num(gols_casa),
+        'Gols Visitante': np.nan_to_num(gols_fora),
+        'Over 2.5': (gols_casa + gols_fora > 2.5).astype('int64'),
+    })
+    tabela = tabela[(tabela['Casa'] >= 0) & (tabela['Fora'] >= 0)]
+    agrupado = tabela.groupby(['Div', 'Casa', 'Fora'], sort=True)[MEDIDAS_H2H].sum().reset_index()
+
+    equipes = data['HomeTeam'].cat.categories
+
+    # Matriz densa por liga, com as equipes que jogaram a liga em alguma temporada
+    matrizes = {}
+    for codigo, grupo in agrupado.groupby('Div', sort=True):
+        codigos_equipes = np.union1d(grupo['Casa'].to_numpy(), grupo['Fora'].to_numpy())
+        linhas = np.searchsorted(codigos_equipes, grupo['Casa'].to_numpy())
+        colunas = np.searchsorted(codigos_equipes, grupo['Fora'].to_numpy())
+        matriz = np.zeros((len(codigos_equipes), len(codigos_equipes), len(MEDIDAS_H2H)))
+        matriz[linhas, colunas] = grupo[MEDIDAS_H2H].to_numpy(dtype='float64')
+        matrizes[ligas[codigo]] = {'equipes': list(equipes[codigos_equipes]), 'matriz': matriz}
+
+    # Total de cada par ordenado em todas as ligas
+    pares = agrupado.groupby(['Casa', 'Fora'], sort=False)[MEDIDAS_H2H].sum()
+    totais = {
+        (equipes[casa], equipes[fora]): valores
+        for (casa, fora), valores in zip(pares.index, pares.to_numpy(dtype='float64'))
+    }
+
+    return {'ligas': matrizes, 'pares': totais}
+
+
+# Função para consultar o par ordenado (mandante, visitante) em O(1); sem jogos retorna zeros
+def consultar_par(h2h, casa, fora):
+    return h2h['pares'].get((casa, fora), np.zeros(len(MEDIDAS_H2H)))
+
+
+# Função para resumir o confronto do ponto de vista da equipe A: com 'Todos' soma os dois mandos,
+# com 'Casa/Fora' considera apenas A como mandante
+def confronto_pela_matriz(h2h, equipe_a, equipe_b, filtro_local='Todos'):
+    jogos, vitorias_casa, empates, vitorias_fora, gols_casa, gols_fora, over = consultar_par(h2h, equipe_a, equipe_b)
+    resumo = {
+        'Jogos': jogos, f'Vitórias {equipe_a}': vitorias_casa, 'Empates': empates, f'Vitórias {equipe_b}': vitorias_fora,
+        f'Gols {equipe_a}': gols_casa, f'Gols {equipe_b}': gols_fora, 'Over 2.5': over,
+    }
+    if filtro_local == 'Todos':
+        jogos, vitorias_casa, empates, vitorias_fora, gols_casa, gols_fora, over = consultar_par(h2h, equipe_b, equipe_a)
+        resumo['Jogos'] += jogos
+        resumo[f'Vitórias {equipe_a}'] += vitorias_fora
+        resumo['Empates'] += empates
+        resumo[f'Vitórias {equipe_b}'] += vitorias_casa
+        resumo[f'Gols {equipe_a}'] += gols_fora
+        resumo[f'Gols {equipe_b}'] += gols_casa
+        resumo['Over 2.5'] += over
+    return resumo
+
+
+# Função para obter os resultados (no formato de resultados_de_contagens) e os gols do confronto direto
+# a partir da matriz, sem percorrer os jogos
+def resultados_do_confronto(h2h, equipe_a, equipe_b, filtro_local='Todos'):
+    confronto = confronto_pela_matriz(h2h, equipe_a, equipe_b, filtro_local)
+    total = int(confronto['Jogos'])
+    return {
+        'total': total,
+        'resultados': resultados_de_contagens(
+            [confronto[f'Vitórias {equipe_a}'], confronto['Empates'], confronto[f'Vitórias {equipe_b}']], total
+        ),
+        'gols': {equipe_a: confronto[f'Gols {equipe_a}'], equipe_b: confronto[f'Gols {equipe_b}']},
+    }
+
+
+# Função para montar a tabela de confrontos de uma rodada (lista de pares mandante, visitante)
+def resumo_rodada(h2h, jogos, filtro_local='Todos'):
+    linhas = []
+    for casa, fora in jogos:
+        confronto = confronto_pela_matriz(h2h, casa, fora, filtro_local)
+        total = confronto['Jogos']
+        linhas.append({
+            'Jogo': f'{casa} x {fora}',
+            'Confrontos': int(total),
+            'Vitórias Casa (%)': round(confronto[f'Vitórias {casa}'] / total * 100, 2) if total > 0 else np.nan,
+            'Empates (%)': round(confronto['Empates'] / total * 100, 2) if total > 0 else np.nan,
+            'Vitórias Visitante (%)': round(confronto[f'Vitórias {fora}'] / total * 100, 2) if total > 0 else np.nan,
+            'Média de Gols': round((confronto[f'Gols {casa}'] + confronto[f'Gols {fora}']) / total, 2) if total > 0 else np.nan,
+            'Over 2.5 (%)': round(confronto['Over 2.5'] / total * 100, 2) if total > 0 else np.nan,
+        })
+    return pd.DataFrame(linhas)
+
+
+# Função para montar a visão de matriz de uma liga (linhas: mandante, colunas: visitante) para uma métrica
+def matriz_da_liga(h2h, liga, metrica):
+    liga = h2h['ligas'][liga]
+    matriz = liga['matriz']
+    jogos = matriz[:, :, MEDIDAS_H2H.index('Jogos')]
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        if metrica == 'Jogos':
+            valores = jogos
+        elif metrica == 'Média de Gols':
+            valores = (matriz[:, :, MEDIDAS_H2H.index('Gols Casa')] + matriz[:, :, MEDIDAS_H2H.index('Gols Visitante')]) / jogos
+        else:
+            medida = metrica.replace(' (%)', '')
+            valores = matriz[:, :, MEDIDAS_H2H.index(medida)] / jogos * 100
+
+    if metrica != 'Jogos':
+        valores = np.round(np.where(jogos > 0, valores, np.nan), 2)
+    return pd.DataFrame(valores, index=pd.Index(liga['equipes'], name='Mandante'), columns=liga['equipes'])
@@ -0,0 +1,414 @@
+import numpy as np
+import pandas as pd
+
+from line_markets import mercado_de_linhas
+
+# Estatísticas com médias exibidas nas páginas de futebol
+COLUNAS_MEDIAS = ['FTHG', 'FTAG', 'HS', 'AS', 'HST', 'AST', 'HC', 'AC']
+
+# Resultados finais na ordem usada nos resumos
+RESULTADOS = ['H', 'D', 'A']
+
+# Placar máximo por equipe no histograma de placares (acima disso o placar é agrupado no limite)
+MAX_GOLS = 15
+TOTAL_PLACARES = (MAX_GOLS + 1) ** 2
+
+# Histogramas de estatísticas de contagem guardados no resumo: nome -> (colunas somadas, maior valor)
+# Valores acima do maior valor ficam no último bin, então as linhas até maior valor - 0.5 são exatas
+HISTOGRAMAS = {
+    'Escanteios': (['HC', 'AC'], 30),
+    'Escanteios Casa': (['HC'], 20),
+    'Escanteios Visitante': (['AC'], 20),
+    'Finalizações': (['HS', 'AS'], 60),
+    'Finalizações no Gol': (['HST', 'AST'], 30),
+    'Cartões': (['HY', 'AY', 'HR', 'AR'], 20),
+    'Cartões Casa': (['HY', 'HR'], 15),
+    'Cartões Visitante': (['AY', 'AR'], 15),
+}
+
+# Gols máximos por tempo no histograma conjunto 1º tempo x 2º tempo
+MAX_GOLS_TEMPO = 10
+TOTAL_TEMPOS = (MAX_GOLS_TEMPO + 1) ** 2
+
+# Estatísticas de gols, derivadas do histograma de placares e do histograma por tempo
+ESTATISTICAS_GOLS = ['Gols', 'Gols Casa', 'Gols Visitante', 'Gols 1º Tempo', 'Gols 2º Tempo']
+ESTATISTICAS_LINHAS = ESTATISTICAS_GOLS + list(HISTOGRAMAS)
+
+# Rótulos dos resultados (intervalo e final) na matriz HT/FT
+ROTULOS_RESULTADOS = ['Casa', 'Empate', 'Visitante']
+
+# Posições de cada medida dentro do vetor de resumo:
+# [jogos, H, D, A, somas das médias, jogos com a estatística preenchida, histograma de placares,
+#  matriz intervalo/final, histograma de gols 1º x 2º tempo, histogramas]
+_JOGOS = 0
+_RESULTADOS = slice(1, 4)
+_SOMAS = slice(4, 4 + len(COLUNAS_MEDIAS))
+_VALIDOS = slice(4 + len(COLUNAS_MEDIAS), 4 + 2 * len(COLUNAS_MEDIAS))
+_PLACARES = slice(4 + 2 * len(COLUNAS_MEDIAS), 4 + 2 * len(COLUNAS_MEDIAS) + TOTAL_PLACARES)
+_HT_FT = slice(_PLACARES.stop, _PLACARES.stop + len(RESULTADOS) ** 2)
+_TEMPOS = slice(_HT_FT.stop, _HT_FT.stop + TOTAL_TEMPOS)
+_HISTOGRAMAS = {}
+_inicio = _TEMPOS.stop
+for _nome, (_colunas, _maior) in HISTOGRAMAS.items():
+    _HISTOGRAMAS[_nome] = slice(_inicio, _inicio + _maior + 1)
+    _inicio += _maior + 1
+TAMANHO_RESUMO = _inicio
+
+# Faixas (buckets) de odds do cubo: [borda_i, borda_i+1)
+BORDAS_ODDS = np.concatenate((
+    [0.0],
+    np.round(np.arange(1.05, 3.0, 0.05), 2),
+    np.round(np.arange(3.0, 6.0, 0.1), 2),
+    np.arange(6.0, 15.0, 0.5),
+    np.arange(15.0, 50.0, 5.0),
+    [50.0, 100.0, np.inf],
+))
+
+
+# Função para calcular os vetores de resumo de várias células de uma só vez.
+# `celulas` indica a célula de cada jogo; todas as medidas saem de bincount, sem cópias do DataFrame.
+def _resumir_celulas(data, celulas, total_celulas):
+    resumo = np.zeros((total_celulas, TAMANHO_RESUMO))
+    resumo[:, _JOGOS] = np.bincount(celulas, minlength=total_celulas)
+
+    resultados = pd.Categorical(data['FTR'], categories=RESULTADOS).codes
+    validos = resultados >= 0
+    resumo[:, _RESULTADOS] = np.bincount(
+        celulas[validos] * len(RESULTADOS) + resultados[validos], minlength=total_celulas * len(RESULTADOS)
+    ).reshape(total_celulas, len(RESULTADOS))
+
+    for i, coluna in enumerate(COLUNAS_MEDIAS):
+        valores = data[coluna].to_numpy(dtype='float64')
+        preenchidos = ~np.isnan(valores)
+        resumo[:, _SOMAS.start + i] = np.bincount(celulas[preenchidos], weights=valores[preenchidos], minlength=total_celulas)
+        resumo[:, _VALIDOS.start + i] = np.bincount(celulas[preenchidos], minlength=total_celulas)
+
+    gols_casa = data['FTHG'].to_numpy(dtype='float64')
+    gols_fora = data['FTAG'].to_numpy(dtype='float64')
+    preenchidos = ~(np.isnan(gols_casa) | np.isnan(gols_fora))
+    placares = (np.clip(gols_casa[preenchidos], 0, MAX_GOLS).astype('int64') * (MAX_GOLS + 1)
+                + np.clip(gols_fora[preenchidos], 0, MAX_GOLS).astype('int64'))
+    resumo[:, _PLACARES] = np.bincount(
+        celulas[preenchidos] * TOTAL_PLACARES + placares, minlength=total_celulas * TOTAL_PLACARES
+    ).reshape(total_celulas, TOTAL_PLACARES)
+
+    # Intervalo/final: código do resultado do intervalo x 3 + código do resultado final
+    intervalo = pd.Categorical(data['HTR'], categories=RESULTADOS).codes
+    validos = (intervalo >= 0) & (resultados >= 0)
+    total_ht_ft = len(RESULTADOS) ** 2
+    resumo[:, _HT_FT] = np.bincount(
+        celulas[validos] * total_ht_ft + intervalo[validos] * len(RESULTADOS) + resultados[validos],
+        minlength=total_celulas * total_ht_ft
+    ).reshape(total_celulas, total_ht_ft)
+
+    # Gols do 1º tempo x gols do 2º tempo (final - intervalo)
+    gols_intervalo = data['HTHG'].to_numpy(dtype='float64') + data['HTAG'].to_numpy(dtype='float64')
+    gols_segundo = gols_casa + gols_fora - gols_intervalo
+    preenchidos = ~(np.isnan(gols_intervalo) | np.isnan(gols_segundo))
+    tempos = (np.clip(gols_intervalo[preenchidos], 0, MAX_GOLS_TEMPO).astype('int64') * (MAX_GOLS_TEMPO + 1)
+              + np.clip(gols_segundo[preenchidos], 0, MAX_GOLS_TEMPO).astype('int64'))
+    resumo[:, _TEMPOS] = np.bincount(
+        celulas[preenchidos] * TOTAL_TEMPOS + tempos, minlength=total_celulas * TOTAL_TEMPOS
+    ).reshape(total_celulas, TOTAL_TEMPOS)
+
+    for nome, (colunas, maior) in HISTOGRAMAS.items():
+        # A soma fica NaN quando alguma das colunas não foi preenchida
+        valores = sum(data[coluna].to_numpy(dtype='float64') for coluna in colunas)
+        preenchidos = ~np.isnan(valores)
+        valores = np.clip(valores[preenchidos], 0, maior).astype('int64')
+        resumo[:, _HISTOGRAMAS[nome]] = np.bincount(
+            celulas[preenchidos] * (maior + 1) + valores, minlength=total_celulas * (maior + 1)
+        ).reshape(total_celulas, maior + 1)
+
+    return resumo
+
+
+# Função para resumir os jogos de um DataFrame em um único vetor de resumo
+def resumir_jogos(data):
+    return _resumir_celulas(data, np.zeros(len(data), dtype='int64'), 1)[0]
+
+
+# Função para montar o cubo de estatísticas liga x faixa de odds de um mando ('Casa' ou 'Visitante').
+# Cada célula guarda o vetor de resumo dos seus jogos; qualquer combinação de ligas e faixa de odds
+# é respondida somando células (as faixas parcialmente cobertas são completadas com os jogos da borda).
+def build_stats_cube(data, coluna_odds):
+    bordas = BORDAS_ODDS.astype(data[coluna_odds].dtype)
+    ligas = data['Div'].cat.categories
+
+    odds = data[coluna_odds].to_numpy()
+    com_odds = ~np.isnan(odds)
+    faixas = np.searchsorted(bordas, odds[com_odds], side='right') - 1
+    # A posição 0 guarda os jogos sem liga, que só entram no filtro 'Todas'
+    codigos_liga = data['Div'].cat.codes.to_numpy()[com_odds].astype('int64') + 1
+
+    total_faixas = len(bordas) - 1
+    celulas = codigos_liga * total_faixas + faixas
+    medidas = _resumir_celulas(data[com_odds], celulas, (len(ligas) + 1) * total_faixas)
+
+    return {
+        'coluna_odds': coluna_odds,
+        'ligas': ligas,
+        'bordas': bordas,
+        'medidas': medidas.reshape(len(ligas) + 1, total_faixas, TAMANHO_RESUMO),
+    }
+
+
+# Função para consultar o cubo: ligas selecionadas (None = todas) e odds entre odd_min e odd_max
+def consultar_cubo(cubo, data, odds_index, ligas, odd_min, odd_max):
+    bordas = cubo['bordas']
+    tipo = bordas.dtype.type
+    odd_min, odd_max = tipo(odd_min), tipo(odd_max)
+
+    if ligas is None:
+        linhas_liga = slice(None)
+    else:
+        codigos = cubo['ligas'].get_indexer(list(ligas))
+        linhas_liga = codigos[codigos >= 0] + 1
+
+    # Faixas inteiramente dentro de [odd_min, odd_max]: primeira até ultima - 1
+    primeira = np.searchsorted(bordas, odd_min, side='left')
+    ultima = np.searchsorted(bordas, odd_max, side='right') - 1
+
+    valores, ordem = odds_index[cubo['coluna_odds']]
+    inicio = np.searchsorted(valores, odd_min, side='left')
+    fim = np.searchsorted(valores, odd_max, side='right')
+
+    if primeira < ultima:
+        resumo = cubo['medidas'][linhas_liga, primeira:ultima].sum(axis=(0, 1))
+        # Jogos das bordas, fora das faixas completas
+        inicio_cheio = np.searchsorted(valores, bordas[primeira], side='left')
+        fim_cheio = np.searchsorted(valores, bordas[ultima], side='left')
+        posicoes = np.concatenate((ordem[inicio:inicio_cheio], ordem[fim_cheio:fim]))
+    else:
+        resumo = np.zeros(TAMANHO_RESUMO)
+        posicoes = ordem[inicio:fim]
+
+    if ligas is not None:
+        codigos_linhas = data['Div'].cat.codes.to_numpy()[posicoes]
+        posicoes = posicoes[np.isin(codigos_linhas, linhas_liga - 1)]
+
+    return resumo + resumir_jogos(data.iloc[posicoes])
+
+
+# Função para obter o total de jogos do resumo
+def total_de_jogos(resumo):
+    return int(resumo[_JOGOS])
+
+
+# Função para contar os resultados (vitórias da casa, empates e vitórias do visitante)
+def resultados_do_resumo(resumo):
+    return resultados_de_contagens(resumo[_RESULTADOS], resumo[_JOGOS])
+
+
+# Função para montar o dicionário de resultados a partir das contagens (casa/A, empates, visitante/B)
+def resultados_de_contagens(contagens, total_games):
+    results = {}
+    for nome, contagem in zip(['Vitórias da Casa', 'Empates', 'Vitórias do Visitante'], contagens):
+        contagem = int(contagem)
+        results[nome] = {
+            'Contagem': contagem,
+            'Porcentagem': (contagem / total_games) * 100 if total_games > 0 else 0,
+            'Odds Decimais': 1 / (contagem / total_games) if contagem > 0 else 0,
+        }
+    return results
+
+
+# Função para obter as médias das estatísticas (NaN quando não há jogos com a estatística)
+def medias_do_resumo(resumo):
+    with np.errstate(invalid='ignore', divide='ignore'):
+        medias = resumo[_SOMAS] / resumo[_VALIDOS]
+    return dict(zip(COLUNAS_MEDIAS, medias))
+
+
+# Função para obter o histograma de placares (linhas: gols da casa, colunas: gols do visitante)
+def placares_do_resumo(resumo):
+    return resumo[_PLACARES].reshape(MAX_GOLS + 1, MAX_GOLS + 1)
+
+
+# Função para montar a tabela de frequência dos placares
+def frequencias_de_placares(resumo):
+    placares = placares_do_resumo(resumo)
+    gols_casa, gols_fora = np.nonzero(placares)
+    frequencias = placares[gols_casa, gols_fora].astype('int64')
+
+    score_counts = pd.DataFrame({
+        'Score': [f'{casa}x{fora}' for casa, fora in zip(gols_casa, gols_fora)],
+        'Frequência': frequencias,
+    })
+    score_counts = score_counts.sort_values(by='Frequência', ascending=False, kind='stable').reset_index(drop=True)
+    score_counts['Porcentagem'] = (score_counts['Frequência'] / resumo[_JOGOS]) * 100
+    score_counts['Odd'] = 100 / score_counts['Porcentagem']
+    return score_counts
+
+
+# Função para calcular as goleadas (4 ou mais gols do vencedor) a partir dos placares
+def goleadas_do_resumo(resumo):
+    placares = placares_do_resumo(resumo)
+    gols_casa, gols_fora = np.indices(placares.shape)
+    total_jogos = resumo[_JOGOS]
+
+    freq_casa = int(placares[(gols_casa >= 4) & (gols_casa > gols_fora)].sum())
+    freq_fora = int(placares[(gols_fora >= 4) & (gols_fora > gols_casa)].sum())
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        prob_casa = freq_casa / total_jogos
+        prob_fora = freq_fora / total_jogos
+
+    odds_casa = 1 / prob_casa if prob_casa > 0 else float('inf')
+    odds_fora = 1 / prob_fora if prob_fora > 0 else float('inf')
+
+    return {
+        'Frequência Goleada Casa': freq_casa,
+        'Probabilidade Goleada Casa': prob_casa,
+        'Odds Goleada Casa': odds_casa,
+        'Frequência Goleada Visitante': freq_fora,
+        'Probabilidade Goleada Visitante Ajustada': prob_fora,
+        'Odds Goleada Visitante Ajustada': odds_fora
+    }
+
+
+# Função para obter o histograma conjunto de gols (linhas: 1º tempo, colunas: 2º tempo)
+def tempos_do_resumo(resumo):
+    return resumo[_TEMPOS].reshape(MAX_GOLS_TEMPO + 1, MAX_GOLS_TEMPO + 1)
+
+
+# Função para obter o histograma de uma estatística de contagem (índice = valor da estatística)
+def histograma_do_resumo(resumo, estatistica):
+    if estatistica == 'Gols 1º Tempo':
+        return tempos_do_resumo(resumo).sum(axis=1)
+    if estatistica == 'Gols 2º Tempo':
+        return tempos_do_resumo(resumo).sum(axis=0)
+    if estatistica in ESTATISTICAS_GOLS:
+        placares = placares_do_resumo(resumo)
+        if estatistica == 'Gols Casa':
+            return placares.sum(axis=1)
+        if estatistica == 'Gols Visitante':
+            return placares.sum(axis=0)
+        gols_casa, gols_fora = np.indices(placares.shape)
+        return np.bincount((gols_casa + gols_fora).ravel(), weights=placares.ravel())
+    return resumo[_HISTOGRAMAS[estatistica]]
+
+
+# Função para calcular over e under de gols (0.5 a 7.5) a partir dos placares
+def over_under_do_resumo(resumo):
+    mercado = mercado_de_linhas(histograma_do_resumo(resumo, 'Gols'), [0.5, 1.5, 2.5, 3.5, 4.5, 5.5, 6.5, 7.5])
+
+    resultados_over_under_gols = {}
+    for linha in mercado.to_dict('records'):
+        for nome in ['Over', 'Under']:
+            resultados_over_under_gols[f"{nome}_{linha['Linha']}"] = {
+                'Ocorrência': int(linha[nome]),
+                'Frequência (%)': float(linha[f'{nome} (%)']),
+                'Odds': float(linha[f'Odd {nome}']) if linha[f'Odd {nome}'] > 0 else 0
+            }
+    return resultados_over_under_gols
+
+
+# Função para montar um mercado de Sim/Não no mesmo formato dos resultados
+def _mercado_sim_nao(sim, total):
+    mercado = {}
+    for nome, contagem in [('Sim', int(sim)), ('Não', int(total - sim))]:
+        mercado[nome] = {
+            'Contagem': contagem,
+            'Porcentagem': (contagem / total) * 100 if total > 0 else 0,
+            'Odds Decimais': total / contagem if contagem > 0 else 0,
+        }
+    return mercado
+
+
+# Função para calcular o mercado de ambas marcam (BTTS) a partir dos placares
+def ambas_marcam(resumo):
+    placares = placares_do_resumo(resumo)
+    return _mercado_sim_nao(placares[1:, 1:].sum(), placares.sum())
+
+
+# Função para calcular o mercado de gol nos dois tempos a partir do histograma por tempo
+def gol_nos_dois_tempos(resumo):
+    tempos = tempos_do_resumo(resumo)
+    return _mercado_sim_nao(tempos[1:, 1:].sum(), tempos.sum())
+
+
+# Função para montar as matrizes intervalo/final (9 resultados): frequência (%) e odd justa
+def ht_ft_do_resumo(resumo):
+    matriz = resumo[_HT_FT].reshape(len(RESULTADOS), len(RESULTADOS))
+    total = matriz.sum()
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        frequencias = matriz / total
+        odds = np.where(matriz > 0, 1 / frequencias, 0)
+
+    indice = pd.Index(ROTULOS_RESULTADOS, name='Intervalo / Final')
+    return (
+        pd.DataFrame(np.round(frequencias * 100, 2), index=indice, columns=ROTULOS_RESULTADOS),
+        pd.DataFrame(np.round(odds, 2), index=indice, columns=ROTULOS_RESULTADOS),
+    )
+
+
+# Função para calcular o handicap asiático (linhas inteiras e x.5) da equipe da casa pela diferença de gols.
+# Nas linhas inteiras o empate no handicap devolve a aposta, então a odd justa desconsidera a devolução.
+def handicap_asiatico(resumo, linhas=None):
+    if linhas is None:
+        linhas = np.arange(-3.0, 3.5, 0.5)
+    linhas = np.asarray(linhas, dtype='float64')
+
+    placares = placares_do_resumo(resumo)
+    gols_casa, gols_fora = np.indices(placares.shape)
+    diferencas = np.arange(-MAX_GOLS, MAX_GOLS + 1)
+    histograma = np.bincount((gols_casa - gols_fora + MAX_GOLS).ravel(), weights=placares.ravel(), minlength=len(diferencas))
+    total = histograma.sum()
+
+    ajustado = diferencas[None, :] + linhas[:, None]
+    vitoria = (ajustado > 0) @ histograma
+    devolucao = (ajustado == 0) @ histograma
+    derrota = (ajustado < 0) @ histograma
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        odd_casa = np.where(vitoria > 0, (total - devolucao) / vitoria, 0)
+        odd_fora = np.where(derrota > 0, (total - devolucao) / derrota, 0)
+        return pd.DataFrame({
+            'Handicap Casa': linhas,
+            'Vitória Casa (%)': np.round(vitoria / total * 100, 2),
+            'Devolução (%)': np.round(devolucao / total * 100, 2),
+            'Vitória Visitante (%)': np.round(derrota / total * 100, 2),
+            'Odd Justa Casa': np.round(odd_casa, 2),
+            'Odd Justa Visitante': np.round(odd_fora, 2),
+        })
+
+
+# Função para resumir os confrontos diretos entre as equipes A e B: cada jogo é atribuído de uma vez
+# (vitória de A, empate ou vitória de B) e os recortes por temporada e por mando saem de um único groupby
+def resumo_confrontos(data, equipe_a, equipe_b):
+    a_em_casa = (data['HomeTeam'] == equipe_a).to_numpy()
+    a_fora = (data['AwayTeam'] == equipe_a).to_numpy()
+    b_em_casa = (data['HomeTeam'] == equipe_b).to_numpy()
+    b_fora = (data['AwayTeam'] == equipe_b).to_numpy()
+    casa_venceu = (data['FTR'] == 'H').to_numpy()
+    fora_venceu = (data['FTR'] == 'A').to_numpy()
+    empatou = (data['FTR'] == 'D').to_numpy()
+
+    vitoria_a = (a_em_casa & casa_venceu) | (a_fora & fora_venceu)
+    vitoria_b = ~vitoria_a & ((b_em_casa & casa_venceu) | (b_fora & fora_venceu))
+    empate = ~vitoria_a & ~vitoria_b & empatou
+
+    gols_casa = data['FTHG'].to_numpy(dtype='float64')
+    gols_fora = data['FTAG'].to_numpy(dtype='float64')
+
+    tabela = pd.DataFrame({
+        'Jogos': np.ones(len(data), dtype='int64'),
+        f'Vitórias {equipe_a}': vitoria_a.astype('int64'),
+        'Empates': empate.astype('int64'),
+        f'Vitórias {equipe_b}': vitoria_b.astype('int64'),
+        f'Gols {equipe_a}': np.where(a_em_casa, gols_casa, gols_fora),
+        f'Gols {equipe_b}': np.where(a_em_casa, gols_fora, gols_casa),
+    })
+    # Jogos sem data ficam em um grupo com rótulo explícito (e não 'nan')
+    temporadas = np.where(data['Temporada'].isna().to_numpy(), 'Sem temporada', data['Temporada'].astype(str).to_numpy())
+    mandos = np.where(a_em_casa, f'{equipe_a} em casa', f'{equipe_b} em casa')
+
+    agrupado = tabela.groupby([temporadas, mandos]).sum()
+    agrupado.index.names = ['Temporada', 'Mando']
+
+    return {
+        'por_temporada': agrupado.groupby(level='Temporada').sum().reset_index(),
+        'por_mando': agrupado.groupby(level='Mando').sum().reset_index(),
+    }
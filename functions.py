@@ -1,6 +1,142 @@
-from nba_api.stats.endpoints import playergamelog, commonplayerinfo,  CommonTeamRoster, PlayerGameLog
+import json
+import os
+import sqlite3
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import closing
+from datetime import date
+
+import pandas as pd
+
+from nba_api.stats.endpoints import commonplayerinfo, CommonTeamRoster, PlayerGameLog
 from nba_api.stats.static import players
 
+# Cache em disco das respostas do nba_api (SQLite), chaveado por endpoint e parâmetros
+ARQUIVO_CACHE_NBA = os.environ.get('NBA_CACHE_PATH', 'nba_cache.sqlite')
+
+# Validade (em segundos) de cada classe de dado; temporadas encerradas nunca expiram (None)
+TTL_TEMPORADA_ATUAL = 10 * 60
+TTL_INFO_JOGADOR = 24 * 60 * 60
+
+# Limites das requisições ao stats.nba.com (compartilhados por todas as sessões do processo)
+MAX_REQUISICOES_SIMULTANEAS = 8
+INTERVALO_MINIMO_REQUISICOES = 0.05  # segundos entre o início de duas requisições
+TENTATIVAS_NBA_API = 3
+ESPERA_INICIAL_RETENTATIVA = 1.0  # dobra a cada nova tentativa
+
+_pool_nba = ThreadPoolExecutor(max_workers=MAX_REQUISICOES_SIMULTANEAS)
+_trava_taxa = threading.Lock()
+_proxima_requisicao = 0.0
+_trava_em_andamento = threading.Lock()
+_em_andamento = {}
+
+
+# Função para verificar o modo offline: com NBA_OFFLINE=1 só as respostas já gravadas no cache são usadas
+def modo_offline():
+    return os.environ.get('NBA_OFFLINE', '0') == '1'
+
+
+# Função para identificar o ano de início da temporada atual (a temporada da NBA começa em outubro)
+def ano_temporada_atual(hoje=None):
+    hoje = hoje or date.today()
+    return hoje.year if hoje.month >= 10 else hoje.year - 1
+
+
+# Função para definir a validade da resposta de uma temporada ('2023-24' ou 2023)
+def ttl_da_temporada(season):
+    if int(str(season)[:4]) < ano_temporada_atual():
+        return None
+    return TTL_TEMPORADA_ATUAL
+
+
+# Função para abrir o banco do cache (uma conexão por chamada, seguro entre threads do Streamlit)
+def _conectar_cache():
+    conexao = sqlite3.connect(ARQUIVO_CACHE_NBA, timeout=30)
+    conexao.execute(
+        'CREATE TABLE IF NOT EXISTS respostas ('
+        'chave TEXT PRIMARY KEY, endpoint TEXT, parametros TEXT, salvo_em REAL, conteudo TEXT)'
+    )
+    return conexao
+
+
+# Função para consultar um endpoint do nba_api passando pelo cache em disco.
+# Retorna a lista de DataFrames da resposta, como endpoint.get_data_frames().
+def consultar_nba_api(endpoint, ttl=None, **parametros):
+    # Parâmetros como texto: o mesmo id vindo como int ou numpy.int64 gera a mesma chave
+    parametros_json = json.dumps({nome: str(valor) for nome, valor in parametros.items()}, sort_keys=True)
+    chave = f'{endpoint.__name__}:{parametros_json}'
+
+    with closing(_conectar_cache()) as conexao, conexao:
+        linha = conexao.execute('SELECT salvo_em, conteudo FROM respostas WHERE chave = ?', (chave,)).fetchone()
+
+    if linha is not None and (modo_offline() or ttl is None or time.time() - linha[0] < ttl):
+        # Cada conjunto foi gravado com headers e linhas (data_set.get_dict()), o mesmo formato dos DataFrames da API
+        return [pd.DataFrame(dados['data'], columns=dados['headers']) for dados in json.loads(linha[1])]
+
+    if modo_offline():
+        raise LookupError(f'Resposta não encontrada no cache offline do nba_api: {chave}')
+
+    # Requisições iguais em andamento (de qualquer sessão) esperam a primeira em vez de repetir a chamada
+    with _trava_em_andamento:
+        futuro = _em_andamento.get(chave)
+        responsavel = futuro is None
+        if responsavel:
+            futuro = Future()
+            _em_andamento[chave] = futuro
+    if not responsavel:
+        return [df.copy() for df in futuro.result()]
+
+    try:
+        resposta = _requisitar_com_retentativas(endpoint, parametros)
+        conteudo = [data_set.get_dict() for data_set in resposta.data_sets]
+
+        with closing(_conectar_cache()) as conexao, conexao:
+            conexao.execute(
+                'INSERT OR REPLACE INTO respostas (chave, endpoint, parametros, salvo_em, conteudo) VALUES (?, ?, ?, ?, ?)',
+                (chave, endpoint.__name__, parametros_json, time.time(), json.dumps(conteudo))
+            )
+        data_frames = resposta.get_data_frames()
+        futuro.set_result(data_frames)
+    except Exception as erro:
+        futuro.set_exception(erro)
+        raise
+    finally:
+        with _trava_em_andamento:
+            _em_andamento.pop(chave, None)
+    return [df.copy() for df in data_frames]
+
+
+# Função para chamar um endpoint do nba_api sem passar pelo cache em disco, com o mesmo limite de taxa e
+# as mesmas novas tentativas; para dados que já têm armazenamento próprio (ex.: a base Parquet da liga)
+def requisitar_nba_api(endpoint, **parametros):
+    if modo_offline():
+        raise LookupError(f'Requisição ao nba_api indisponível no modo offline: {endpoint.__name__}')
+    return _requisitar_com_retentativas(endpoint, parametros).get_data_frames()
+
+
+# Função para respeitar o intervalo mínimo global entre requisições ao stats.nba.com
+def _aguardar_limite_de_taxa():
+    global _proxima_requisicao
+    with _trava_taxa:
+        agora = time.monotonic()
+        inicio = max(agora, _proxima_requisicao)
+        _proxima_requisicao = inicio + INTERVALO_MINIMO_REQUISICOES
+    time.sleep(max(0.0, inicio - agora))
+
+
+# Função para chamar o endpoint com limite de taxa e novas tentativas com espera exponencial
+def _requisitar_com_retentativas(endpoint, parametros):
+    for tentativa in range(TENTATIVAS_NBA_API):
+        _aguardar_limite_de_taxa()
+        try:
+            return endpoint(**parametros)
+        except Exception:
+            if tentativa == TENTATIVAS_NBA_API - 1:
+                raise
+            time.sleep(ESPERA_INICIAL_RETENTATIVA * 2 ** tentativa)
+
+
 # Função para buscar jogadores
 def search_players(active_only=False):
     all_players = players.get_players()
@@ -9,14 +145,27 @@ def search_players(active_only=False):
         return active_players
     else:
         return all_players
-    
+
 # Função para obter o roster da equipe selecionada
 def get_team_roster(team_id, season):
-    roster = CommonTeamRoster(team_id=team_id, season=season)
-    roster_data = roster.get_data_frames()[0]
-    return roster_data
+    return consultar_nba_api(CommonTeamRoster, ttl_da_temporada(season), team_id=team_id, season=season)[0]
 
 # Função para obter os dados de jogo de um jogador
 def get_player_gamelog(player_id, season):
-    gamelog = PlayerGameLog(player_id=player_id, season=season)
-    return gamelog.get_data_frames()[0]
\ No newline at end of file
+    return consultar_nba_api(PlayerGameLog, ttl_da_temporada(season), player_id=player_id, season=season)[0]
+
+# Função para obter as informações cadastrais de um jogador (inclui primeira e última temporada)
+def get_player_info(player_id):
+    return consultar_nba_api(commonplayerinfo.CommonPlayerInfo, TTL_INFO_JOGADOR, player_id=player_id)[0]
+
+# Função para buscar os jogos de vários jogadores ao mesmo tempo (pool de threads com limite de taxa).
+# Jogadores cuja busca falhar ficam com um DataFrame vazio.
+def get_roster_gamelogs(player_ids, season):
+    def buscar(player_id):
+        try:
+            return get_player_gamelog(player_id, season)
+        except Exception:
+            return pd.DataFrame()
+
+    player_ids = list(player_ids)
+    return dict(zip(player_ids, _pool_nba.map(buscar, player_ids)))
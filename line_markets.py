@@ -0,0 +1,53 @@
+import numpy as np
+import pandas as pd
+
+
+# Função para obter os limites inteiros de cada linha de uma estatística de contagem: under = valores <= abaixo
+# e over = valores > acima. Em linhas x.5 os dois limites são iguais; numa linha inteira x o valor exato x fica
+# entre eles e devolve a aposta (push / devolução).
+def limites_das_linhas(linhas):
+    linhas = np.asarray(linhas, dtype='float64')
+    return np.ceil(linhas) - 1, np.floor(linhas)
+
+
+# Função para calcular a odd justa de um lado da linha. A devolução não é ganho nem perda, então a odd
+# considera só os resultados decididos (lado + outro lado); sem nenhuma ocorrência a odd fica `sem_odd`.
+def odd_justa(lado, outro_lado, sem_odd=0):
+    lado = np.asarray(lado, dtype='float64')
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return np.where(lado > 0, (lado + outro_lado) / lado, sem_odd)
+
+
+# Função para calcular over/devolução/under de todas as linhas (inteiras e x.5) de uma estatística de contagem
+# a partir do histograma acumulado (índice = valor da estatística). Linhas abaixo de zero são 100% over e
+# linhas no último valor do histograma ou acima dele não têm over.
+def mercado_de_linhas(histograma, linhas=None):
+    histograma = np.asarray(histograma)
+    if linhas is None:
+        linhas = np.arange(1, 2 * len(histograma) - 2) / 2
+    linhas = np.asarray(linhas, dtype='float64')
+
+    total = histograma.sum()
+    # acumulado[k + 1] = jogos com valor <= k; acumulado[0] = 0
+    acumulado = np.concatenate(([0], np.cumsum(histograma)))
+    abaixo, acima = limites_das_linhas(linhas)
+    under = acumulado[np.clip(abaixo + 1, 0, len(histograma)).astype('int64')]
+    over = total - acumulado[np.clip(acima + 1, 0, len(histograma)).astype('int64')]
+    devolucao = total - over - under
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        frequencia_over = over / total
+        frequencia_devolucao = devolucao / total
+        frequencia_under = under / total
+
+    return pd.DataFrame({
+        'Linha': linhas,
+        'Over': over.astype('int64'),
+        'Over (%)': np.round(frequencia_over * 100, 2),
+        'Odd Over': np.round(odd_justa(over, under), 2),
+        'Devolução': devolucao.astype('int64'),
+        'Devolução (%)': np.round(frequencia_devolucao * 100, 2),
+        'Under': under.astype('int64'),
+        'Under (%)': np.round(frequencia_under * 100, 2),
+        'Odd Under': np.round(odd_justa(under, over), 2),
+    })
@@ -0,0 +1,75 @@
+import numpy as np
+
+# Métodos de reamostragem da sequência de apostas
+METODOS_REAMOSTRAGEM = ['Bootstrap', 'Ordem Embaralhada']
+
+# Orçamento de elementos simulados (reamostragens x apostas) por execução: o custo é proporcional a ele
+# (cerca de 0,4 s para 20 milhões). Amostras grandes recebem menos reamostragens, nunca menos que o mínimo.
+ORCAMENTO_ELEMENTOS = 20_000_000
+MIN_REAMOSTRAGENS = 100
+
+
+# Função para reamostrar a sequência de lucros das apostas e medir ROI, quebra e drawdown.
+# Cada lote é uma matriz (reamostragens x apostas): a banca de todas as simulações sai de uma
+# única soma acumulada por linha. O tamanho do lote respeita `limite_elementos` para manter a
+# memória limitada, independentemente do número de reamostragens. O número de reamostragens é reduzido
+# para caber em `orcamento_elementos`; o valor efetivo volta em 'Reamostragens'.
+# - Bootstrap: sorteia as apostas com reposição (incerteza do ROI);
+# - Ordem Embaralhada: mantém as apostas e muda só a ordem (o ROI é o mesmo, mudam quebra e drawdown).
+def reamostrar_backtest(lucros, banca_inicial, reamostragens=10000, metodo='Bootstrap',
+                        limite_elementos=2_000_000, orcamento_elementos=ORCAMENTO_ELEMENTOS, semente=None):
+    lucros = np.asarray(lucros, dtype='float64')
+    lucros = lucros[~np.isnan(lucros)]
+    total_apostas = len(lucros)
+    gerador = np.random.default_rng(semente)
+    if total_apostas > 0:
+        reamostragens = min(reamostragens, max(MIN_REAMOSTRAGENS, orcamento_elementos // total_apostas))
+
+    roi = np.empty(reamostragens)
+    drawdown = np.empty(reamostragens)
+    quebrou = np.empty(reamostragens, dtype=bool)
+    if total_apostas == 0:
+        roi[:], drawdown[:], quebrou[:] = 0.0, 0.0, banca_inicial <= 0
+        return {'ROI': roi, 'Drawdown Máximo': drawdown, 'Quebrou': quebrou, 'Reamostragens': reamostragens}
+
+    tamanho_lote = max(1, limite_elementos // total_apostas)
+    for inicio in range(0, reamostragens, tamanho_lote):
+        fim = min(inicio + tamanho_lote, reamostragens)
+        if metodo == 'Bootstrap':
+            caminhos = lucros[gerador.integers(0, total_apostas, size=(fim - inicio, total_apostas), dtype=np.int32)]
+        elif metodo == 'Ordem Embaralhada':
+            # Embaralhamento no próprio lote (sem uma segunda matriz)
+            caminhos = np.tile(lucros, (fim - inicio, 1))
+            gerador.permuted(caminhos, axis=1, out=caminhos)
+        else:
+            raise ValueError(f'Método de reamostragem desconhecido: {metodo}')
+
+        np.cumsum(caminhos, axis=1, out=caminhos)
+        caminhos += banca_inicial
+
+        roi[inicio:fim] = (caminhos[:, -1] - banca_inicial) / banca_inicial * 100
+        quebrou[inicio:fim] = (caminhos.min(axis=1) <= 0) | (banca_inicial <= 0)
+
+        # Pico da banca (incluindo a banca inicial) menos a banca atual
+        picos = np.maximum.accumulate(caminhos, axis=1)
+        np.maximum(picos, banca_inicial, out=picos)
+        np.subtract(picos, caminhos, out=picos)
+        drawdown[inicio:fim] = picos.max(axis=1)
+
+    return {'ROI': roi, 'Drawdown Máximo': drawdown, 'Quebrou': quebrou, 'Reamostragens': reamostragens}
+
+
+# Função para resumir as reamostragens em intervalos de confiança e probabilidade de quebra
+def resumir_reamostragem(resultado, confianca=0.95):
+    cauda = (1 - confianca) / 2 * 100
+    roi_inferior, roi_mediano, roi_superior = np.percentile(resultado['ROI'], [cauda, 50, 100 - cauda])
+    drawdown_mediano, drawdown_superior = np.percentile(resultado['Drawdown Máximo'], [50, 100 - cauda])
+    return {
+        'ROI Inferior': roi_inferior,
+        'ROI Mediano': roi_mediano,
+        'ROI Superior': roi_superior,
+        'Probabilidade de ROI Positivo (%)': (resultado['ROI'] > 0).mean() * 100,
+        'Probabilidade de Quebra (%)': resultado['Quebrou'].mean() * 100,
+        'Drawdown Mediano': drawdown_mediano,
+        'Drawdown Superior': drawdown_superior,
+    }
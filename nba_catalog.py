@@ -0,0 +1,104 @@
+import unicodedata
+from bisect import bisect_left
+from collections import Counter, defaultdict
+
+import streamlit as st
+from nba_api.stats.static import players, teams
+
+# Tamanho dos pedaços de texto (n-gramas) usados na busca aproximada
+TAMANHO_NGRAMA = 3
+
+
+# Função para normalizar nomes na busca: minúsculas e sem acentos ('Jokić' -> 'jokic')
+def normalizar_nome(nome):
+    nome = unicodedata.normalize('NFKD', str(nome))
+    return ''.join(letra for letra in nome if not unicodedata.combining(letra)).lower().strip()
+
+
+# Função para quebrar um nome normalizado em n-gramas (com bordas, para valorizar o início das palavras)
+def _ngramas(nome):
+    texto = f' {nome} '
+    return {texto[i:i + TAMANHO_NGRAMA] for i in range(max(1, len(texto) - TAMANHO_NGRAMA + 1))}
+
+
+# Função para montar o catálogo indexado a partir da lista estática do nba_api.
+# Guarda id -> registro, nome -> id, os nomes já ordenados e um índice de n-gramas para a busca aproximada.
+def build_catalog(registros, campo_nome='full_name'):
+    por_id = {registro['id']: registro for registro in registros}
+    # Registros sem nome ficam só no índice por id (e não viram um nome 'none'/'nan' na busca)
+    registros = [registro for registro in registros if isinstance(registro.get(campo_nome), str)]
+    # Nomes repetidos (homônimos) ficam com o primeiro registro, dando preferência aos ativos
+    por_nome = {}
+    for registro in sorted(registros, key=lambda registro: not registro.get('is_active', True)):
+        por_nome.setdefault(normalizar_nome(registro[campo_nome]), registro['id'])
+
+    # Nomes normalizados ordenados: a busca por prefixo é uma busca binária
+    prefixos = sorted(por_nome.items())
+
+    ngramas = defaultdict(list)
+    for nome, identificador in por_nome.items():
+        for ngrama in _ngramas(nome):
+            ngramas[ngrama].append(identificador)
+
+    return {
+        'por_id': por_id,
+        'por_nome': por_nome,
+        'nomes': sorted(registro[campo_nome] for registro in registros),
+        'nomes_ativos': sorted(registro[campo_nome] for registro in registros if registro.get('is_active', True)),
+        'prefixos': [nome for nome, _ in prefixos],
+        'ids_prefixos': [identificador for _, identificador in prefixos],
+        'ngramas': dict(ngramas),
+        'campo_nome': campo_nome,
+    }
+
+
+# Função para obter o id pelo nome exato (sem diferenciar maiúsculas e acentos); None se não existir
+def id_pelo_nome(catalogo, nome):
+    return catalogo['por_nome'].get(normalizar_nome(nome))
+
+
+# Função para buscar os nomes que começam com o texto informado
+def buscar_por_prefixo(catalogo, texto, apenas_ativos=False, limite=10):
+    texto = normalizar_nome(texto)
+    inicio = bisect_left(catalogo['prefixos'], texto)
+    encontrados = []
+    for nome, identificador in zip(catalogo['prefixos'][inicio:], catalogo['ids_prefixos'][inicio:]):
+        if not nome.startswith(texto) or len(encontrados) >= limite:
+            break
+        registro = catalogo['por_id'][identificador]
+        if not apenas_ativos or registro.get('is_active', True):
+            encontrados.append(registro[catalogo['campo_nome']])
+    return encontrados
+
+
+# Função para a busca aproximada: ordena pelos n-gramas em comum com o texto (tolera erros de digitação
+# e buscas pelo sobrenome); os nomes que começam com o texto vêm primeiro
+def buscar_nomes(catalogo, texto, apenas_ativos=False, limite=10):
+    encontrados = buscar_por_prefixo(catalogo, texto, apenas_ativos, limite)
+
+    nome_buscado = normalizar_nome(texto)
+    ngramas_buscados = _ngramas(nome_buscado)
+    pontos = Counter()
+    for ngrama in ngramas_buscados:
+        pontos.update(catalogo['ngramas'].get(ngrama, []))
+
+    for identificador, comuns in pontos.most_common():
+        if len(encontrados) >= limite or comuns < len(ngramas_buscados) / 3:
+            break
+        registro = catalogo['por_id'][identificador]
+        nome = registro[catalogo['campo_nome']]
+        if (not apenas_ativos or registro.get('is_active', True)) and nome not in encontrados:
+            encontrados.append(nome)
+    return encontrados
+
+
+# Função para obter o catálogo de jogadores, montado uma vez por processo
+@st.cache_resource
+def get_player_catalog():
+    return build_catalog(players.get_players())
+
+
+# Função para obter o catálogo de equipes, montado uma vez por processo
+@st.cache_resource
+def get_team_catalog():
+    return build_catalog(teams.get_teams())
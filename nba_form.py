@@ -0,0 +1,57 @@
+import numpy as np
+import pandas as pd
+
+# Estatísticas acompanhadas nas médias e tendências de forma
+ESTATISTICAS_FORMA = ['PTS', 'AST', 'REB', 'FG3M', 'FG3A', 'STL', 'BLK', 'TOV', 'MIN']
+
+
+# Função para preparar a carreira (jogos em ordem cronológica) com temporada, mando e adversário
+def preparar_carreira(logs):
+    carreira = logs.sort_values('GAME_DATE', kind='stable').reset_index(drop=True)
+    confronto = carreira['MATCHUP'].astype(str)
+
+    # SEASON_ID no formato da API: '22023' -> temporada '2023-24'
+    ano = carreira['SEASON_ID'].astype(str).str[-4:].astype(int)
+    carreira['Temporada'] = ano.astype(str) + '-' + (ano + 1).astype(str).str[-2:]
+    carreira['Mando'] = np.where(confronto.str.contains(' vs. ', regex=False), 'Casa', 'Fora')
+    carreira['Adversário'] = confronto.str[-3:]
+    return carreira
+
+
+# Função para calcular médias móveis de várias janelas de uma vez: uma única soma acumulada
+# serve para todas as janelas (média da janela = diferença entre duas posições da soma / tamanho).
+# Retorna {janela: DataFrame}, com NaN enquanto ainda não há jogos suficientes para a janela.
+def medias_moveis(jogos, janelas, stats=ESTATISTICAS_FORMA):
+    valores = jogos[stats].to_numpy(dtype='float64')
+    acumulado = np.vstack([np.zeros((1, len(stats))), np.cumsum(valores, axis=0)])
+    total = len(valores)
+
+    medias = {}
+    for janela in janelas:
+        media = np.full((total, len(stats)), np.nan)
+        if 0 < janela <= total:
+            media[janela - 1:] = (acumulado[janela:] - acumulado[:-janela]) / janela
+        medias[janela] = pd.DataFrame(media, columns=stats, index=jogos.index)
+    return medias
+
+
+# Função para calcular a forma com média exponencial (jogos recentes pesam mais; meia-vida em jogos)
+def forma_exponencial(jogos, meia_vida, stats=ESTATISTICAS_FORMA):
+    return jogos[stats].astype('float64').ewm(halflife=meia_vida).mean()
+
+
+# Função para resumir a média geral e as médias dos últimos jogos de cada janela (linhas: 'Temporada Total',
+# 'Últimos N Jogos'); janelas maiores que o número de jogos ficam com NaN
+def resumo_de_forma(jogos, janelas, stats=ESTATISTICAS_FORMA):
+    linhas = {'Temporada Total': jogos[stats].astype('float64').mean()}
+    for janela, medias in medias_moveis(jogos, janelas, stats).items():
+        linhas[f'Últimos {janela} Jogos'] = medias.iloc[-1] if len(medias) else pd.Series(np.nan, index=stats)
+    return pd.DataFrame(linhas).T.round(1)
+
+
+# Função para calcular as médias por recorte da carreira ('Mando', 'Adversário' ou 'Temporada')
+def divisoes(carreira, por, stats=ESTATISTICAS_FORMA):
+    agrupado = carreira.groupby(por, sort=True)
+    tabela = agrupado[stats].mean().round(1)
+    tabela.insert(0, 'Jogos', agrupado.size())
+    return tabela
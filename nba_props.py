@@ -0,0 +1,107 @@
+import numpy as np
+import pandas as pd
+from scipy import stats
+
+from line_markets import limites_das_linhas, odd_justa, mercado_de_linhas
+
+# Estatísticas com mercado de props e as combinações mais comuns das casas de apostas
+ESTATISTICAS_PROPS = ['PTS', 'REB', 'AST', 'FG3M', 'STL', 'BLK', 'TOV']
+COMBOS_PROPS = {
+    'PTS+REB+AST': ['PTS', 'REB', 'AST'],
+    'PTS+AST': ['PTS', 'AST'],
+    'REB+AST': ['REB', 'AST'],
+}
+MERCADOS_PROPS = ESTATISTICAS_PROPS + list(COMBOS_PROPS)
+
+
+# Função para obter os valores de um mercado em cada jogo (combinações são a soma das estatísticas).
+# Em float: jogos com alguma estatística em branco (NaN no log da liga) ficam NaN e são descartados por quem usa.
+def valores_do_mercado(jogos, mercado):
+    return jogos[COMBOS_PROPS.get(mercado, [mercado])].to_numpy(dtype='float64').sum(axis=1)
+
+
+# Função para calcular over/devolução/under de todas as linhas (inteiras e x.5) de um mercado de uma vez:
+# o histograma dos valores acumulado é a distribuição empírica (Over x.5 = jogos com x+1 ou mais)
+def linhas_do_mercado(jogos, mercado, linhas=None):
+    valores = valores_do_mercado(jogos, mercado)
+    histograma = np.bincount(valores[~np.isnan(valores)].astype('int64'), minlength=1)
+    return mercado_de_linhas(histograma, linhas)
+
+
+# Função para montar a tabela de linhas de todos os mercados (uma linha por mercado e linha de aposta)
+def tabela_de_linhas(jogos, mercados=MERCADOS_PROPS):
+    tabela = pd.concat({mercado: linhas_do_mercado(jogos, mercado) for mercado in mercados}, names=['Mercado'])
+    return tabela.reset_index(level='Mercado').reset_index(drop=True)
+
+
+# Meia-vida (em jogos) do peso de recência nas distribuições ajustadas
+MEIA_VIDA_PROJECAO = 10
+
+
+# Função para ajustar uma distribuição de contagem por jogador com peso de recência (meia-vida em jogos).
+# Média e variância ponderadas saem de somas por jogador (np.bincount), sem laço por jogador:
+# variância <= média usa Poisson; acima disso, binomial negativa com a mesma média e variância.
+def ajustar_distribuicoes(jogos, mercado, meia_vida=MEIA_VIDA_PROJECAO, chave='PLAYER_ID'):
+    jogos = jogos.sort_values([chave, 'GAME_DATE'], ascending=[True, False], kind='stable')
+    valores = valores_do_mercado(jogos, mercado)
+    preenchidos = ~np.isnan(valores)
+    jogos, valores = jogos[preenchidos], valores[preenchidos]
+    codigos, jogadores = pd.factorize(jogos[chave], sort=True)
+
+    # Idade de cada jogo (0 = mais recente do jogador) e peso exponencial
+    idade = jogos.groupby(chave, sort=False).cumcount().to_numpy()
+    pesos = 0.5 ** (idade / meia_vida)
+
+    total = len(jogadores)
+    soma_pesos = np.bincount(codigos, weights=pesos, minlength=total)
+    soma_pesos_quadrado = np.bincount(codigos, weights=pesos ** 2, minlength=total)
+    media = np.bincount(codigos, weights=pesos * valores, minlength=total) / soma_pesos
+    variancia = np.bincount(codigos, weights=pesos * valores ** 2, minlength=total) / soma_pesos - media ** 2
+
+    # Correção do viés da variância ponderada pelo número efetivo de jogos
+    jogos_efetivos = soma_pesos ** 2 / soma_pesos_quadrado
+    with np.errstate(invalid='ignore', divide='ignore'):
+        variancia = np.where(jogos_efetivos > 1, variancia * jogos_efetivos / (jogos_efetivos - 1), 0.0)
+
+    return pd.DataFrame({
+        chave: jogadores,
+        'Jogos': np.bincount(codigos, minlength=total),
+        'Média Ponderada': media,
+        'Variância': variancia,
+        'Distribuição': np.where(variancia > media, 'Binomial Negativa', 'Poisson'),
+    })
+
+
+# Função para calcular over, devolução e under de todas as linhas para todos os jogadores ajustados de uma vez
+# (matrizes jogadores x linhas avaliadas em uma única chamada vetorizada do scipy). Os limites das linhas são os
+# mesmos do mercado empírico: numa linha inteira x, over = P(X > x), under = P(X < x) e P(X = x) é devolução.
+def probabilidades_das_linhas(ajustes, linhas):
+    media = ajustes['Média Ponderada'].to_numpy()[:, None]
+    variancia = ajustes['Variância'].to_numpy()[:, None]
+    linhas = np.asarray(linhas, dtype='float64')
+    abaixo, acima = (limite[None, :] for limite in limites_das_linhas(linhas))
+
+    binomial_negativa = variancia > media
+    with np.errstate(invalid='ignore', divide='ignore'):
+        r = np.where(binomial_negativa, media ** 2 / (variancia - media), 1.0)
+        p = np.where(binomial_negativa, r / (r + media), 0.5)
+        over = np.where(binomial_negativa, stats.nbinom.sf(acima, r, p), stats.poisson.sf(acima, media))
+        under = np.where(binomial_negativa, stats.nbinom.cdf(abaixo, r, p), stats.poisson.cdf(abaixo, media))
+    devolucao = np.where(acima > abaixo, np.clip(1 - over - under, 0, 1), 0.0)
+
+    return tuple(pd.DataFrame(valores, index=ajustes.index, columns=linhas) for valores in [over, devolucao, under])
+
+
+# Função para precificar uma linha para vários jogadores (elenco inteiro ou liga) em uma chamada:
+# probabilidade e odd justa de over, devolução e under pela distribuição ajustada
+def precificar_linha(jogos, mercado, linha, meia_vida=MEIA_VIDA_PROJECAO):
+    ajustes = ajustar_distribuicoes(jogos, mercado, meia_vida)
+    over, devolucao, under = (tabela.iloc[:, 0].to_numpy() for tabela in probabilidades_das_linhas(ajustes, [linha]))
+    ajustes['Over (%)'] = np.round(over * 100, 2)
+    ajustes['Odd Over'] = np.round(odd_justa(over, under, sem_odd=np.nan), 2)
+    ajustes['Devolução (%)'] = np.round(devolucao * 100, 2)
+    ajustes['Under (%)'] = np.round(under * 100, 2)
+    ajustes['Odd Under'] = np.round(odd_justa(under, over, sem_odd=np.nan), 2)
+    ajustes['Média Ponderada'] = ajustes['Média Ponderada'].round(2)
+    ajustes['Variância'] = ajustes['Variância'].round(2)
+    return ajustes
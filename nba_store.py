@@ -0,0 +1,215 @@
+import os
+import sys
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+from nba_api.stats.endpoints import LeagueGameLog
+
+from functions import requisitar_nba_api, ano_temporada_atual, TTL_TEMPORADA_ATUAL
+
+# Base local dos jogos da liga (LeagueGameLog por jogador), um arquivo Parquet por temporada
+DIRETORIO_LOGS_NBA = os.environ.get('NBA_STORE_PATH', 'nba_gamelogs')
+
+# Arquivo local (CSV ou Parquet no formato do LeagueGameLog) que substitui a API, ex.: em testes
+ARQUIVO_FIXTURE_NBA = os.environ.get('NBA_FIXTURE_PATH')
+
+# Colunas de texto repetitivo guardadas como categorias
+COLUNAS_CATEGORICAS_NBA = ['SEASON_ID', 'PLAYER_NAME', 'TEAM_ABBREVIATION', 'TEAM_NAME', 'MATCHUP', 'WL']
+
+# Temporadas carregadas ao mesmo tempo ao montar a carreira de um jogador
+MAX_TEMPORADAS_SIMULTANEAS = 4
+
+_pool_temporadas = ThreadPoolExecutor(max_workers=MAX_TEMPORADAS_SIMULTANEAS)
+_trava_travas = threading.Lock()
+_travas_temporadas = defaultdict(threading.Lock)
+
+# Momento em que cada temporada entrou no cache de get_league_gamelogs (para saber se ainda está lá)
+_temporadas_no_cache = {}
+
+
+# Função para padronizar a temporada no formato da API: 2023, '2023' ou '2023-24' -> '2023-24'
+def temporada_nba(season):
+    ano = int(str(season)[:4])
+    return f'{ano}-{str(ano + 1)[-2:]}'
+
+
+# Função para montar o caminho do arquivo de uma temporada
+def arquivo_da_temporada(season):
+    return os.path.join(DIRETORIO_LOGS_NBA, f'{temporada_nba(season)}.parquet')
+
+
+# Função para buscar os jogos da liga de uma temporada (a partir de data_inicial, se informada)
+def _buscar_logs_da_liga(season, data_inicial=None):
+    season = temporada_nba(season)
+
+    if ARQUIVO_FIXTURE_NBA:
+        if ARQUIVO_FIXTURE_NBA.endswith('.parquet'):
+            logs = pd.read_parquet(ARQUIVO_FIXTURE_NBA)
+        else:
+            logs = pd.read_csv(ARQUIVO_FIXTURE_NBA)
+        logs = logs[logs['SEASON_ID'].astype(str).str[-4:] == season[:4]]
+        if data_inicial is not None:
+            logs = logs[pd.to_datetime(logs['GAME_DATE']) >= data_inicial]
+        return logs
+
+    parametros = {'player_or_team_abbreviation': 'P', 'season': season}
+    if data_inicial is not None:
+        parametros['date_from_nullable'] = data_inicial.strftime('%m/%d/%Y')
+    # O arquivo Parquet da temporada já é o cache: a resposta não é guardada também no SQLite
+    return requisitar_nba_api(LeagueGameLog, **parametros)[0]
+
+
+# Função para tipar os jogos e ordená-los por jogador (jogos mais recentes primeiro, como o PlayerGameLog)
+def _tipar_logs(logs):
+    logs = logs.copy()
+    logs['GAME_DATE'] = pd.to_datetime(logs['GAME_DATE'])
+    for coluna in logs.columns:
+        if coluna == 'GAME_DATE':
+            continue
+        if coluna in COLUNAS_CATEGORICAS_NBA:
+            # Textos ausentes continuam como NaN (e não viram uma categoria 'nan')
+            logs[coluna] = logs[coluna].astype(str).where(logs[coluna].notna()).astype('category')
+        elif coluna == 'GAME_ID':
+            logs[coluna] = logs[coluna].astype(str)
+        elif pd.api.types.is_float_dtype(logs[coluna]):
+            logs[coluna] = logs[coluna].astype('float32')
+        else:
+            # Contagens em int16 no mínimo: as somas de estatísticas (ex.: PTS+REB+AST) não estouram o tipo
+            logs[coluna] = pd.to_numeric(logs[coluna], downcast='integer')
+            if logs[coluna].dtype.itemsize < 2:
+                logs[coluna] = logs[coluna].astype('int16')
+
+    logs = logs.sort_values(['PLAYER_ID', 'GAME_DATE'], ascending=[True, False], kind='stable')
+    return logs.reset_index(drop=True)
+
+
+# Função para gravar o arquivo da temporada sem expor um arquivo incompleto a outras sessões
+def _gravar_temporada(logs, season):
+    os.makedirs(DIRETORIO_LOGS_NBA, exist_ok=True)
+    arquivo = arquivo_da_temporada(season)
+    temporario = f'{arquivo}.{threading.get_ident()}.tmp'
+    logs.to_parquet(temporario, index=False)
+    os.replace(temporario, arquivo)
+
+
+# Função para ingerir uma temporada na base local. Temporadas encerradas são baixadas uma única vez;
+# na temporada atual só os jogos a partir do último dia gravado são buscados de novo (atualização incremental).
+def ingerir_temporada(season):
+    arquivo = arquivo_da_temporada(season)
+    atual = int(str(season)[:4]) >= ano_temporada_atual()
+
+    # Uma trava por temporada: temporadas diferentes são ingeridas em paralelo
+    with _trava_travas:
+        trava = _travas_temporadas[temporada_nba(season)]
+
+    with trava:
+        if os.path.exists(arquivo) and (not atual or time.time() - os.path.getmtime(arquivo) < TTL_TEMPORADA_ATUAL):
+            return arquivo
+
+        if not os.path.exists(arquivo):
+            _gravar_temporada(_tipar_logs(_buscar_logs_da_liga(season)), season)
+            return arquivo
+
+        # O último dia gravado é buscado de novo: jogos daquele dia podem ter terminado depois da última ingestão
+        logs = pd.read_parquet(arquivo)
+        ultimo_dia = logs['GAME_DATE'].max() if not logs.empty else None
+        novos = _buscar_logs_da_liga(season, ultimo_dia)
+        if not novos.empty:
+            logs = pd.concat([logs, _tipar_logs(novos)], ignore_index=True)
+            logs = _tipar_logs(logs.drop_duplicates(['PLAYER_ID', 'GAME_ID'], keep='last'))
+        _gravar_temporada(logs, season)
+    return arquivo
+
+
+# Função para carregar os jogos da liga de uma temporada com o índice de jogadores (posições por PLAYER_ID)
+def carregar_logs_da_liga(season):
+    logs = pd.read_parquet(ingerir_temporada(season))
+    return {'logs': logs, 'ids': logs['PLAYER_ID'].to_numpy()}
+
+
+# Função para obter os jogos da liga de uma temporada, compartilhados entre sessões.
+# O ttl faz a temporada atual passar pela atualização incremental periodicamente.
+# `_base` (fora da chave do cache) permite preencher o cache com uma temporada já carregada.
+@st.cache_resource(ttl=TTL_TEMPORADA_ATUAL)
+def get_league_gamelogs(season, _base=None):
+    _temporadas_no_cache[season] = time.monotonic()
+    return _base if _base is not None else carregar_logs_da_liga(temporada_nba(season))
+
+
+# Função para verificar se a temporada ainda está no cache de get_league_gamelogs (carregada dentro do ttl)
+def temporada_no_cache(season):
+    carregada = _temporadas_no_cache.get(season)
+    return carregada is not None and time.monotonic() - carregada < TTL_TEMPORADA_ATUAL
+
+
+# Função para montar uma base no formato da base da liga a partir das respostas do PlayerGameLog
+# ({player_id: DataFrame}), para quando a temporada não está disponível na base local (ex.: modo offline)
+def base_dos_gamelogs(gamelogs, nomes):
+    partes = [
+        logs.rename(columns={'Player_ID': 'PLAYER_ID', 'Game_ID': 'GAME_ID'}).assign(
+            PLAYER_NAME=nomes.get(player_id), GAME_DATE=pd.to_datetime(logs['GAME_DATE'], format='%b %d, %Y')
+        )
+        for player_id, logs in gamelogs.items() if not logs.empty
+    ]
+    logs = _tipar_logs(pd.concat(partes, ignore_index=True)) if partes else pd.DataFrame({'PLAYER_ID': [], 'PLAYER_NAME': []})
+    return {'logs': logs, 'ids': logs['PLAYER_ID'].to_numpy()}
+
+
+# Função para recortar os jogos de um jogador pelo índice ordenado (busca binária, sem percorrer a liga)
+def logs_do_jogador(base, player_id):
+    inicio = np.searchsorted(base['ids'], player_id, side='left')
+    fim = np.searchsorted(base['ids'], player_id, side='right')
+    return base['logs'].iloc[inicio:fim].reset_index(drop=True)
+
+
+# Função para obter os jogos de vários jogadores (ex.: todo o elenco), no formato {player_id: DataFrame}
+def logs_do_elenco(base, player_ids):
+    return {player_id: logs_do_jogador(base, player_id) for player_id in player_ids}
+
+
+# Função para montar todos os jogos da carreira de um jogador (ordem cronológica).
+# Custo: cada temporada da carreira é o log da liga inteira (~26 mil jogos); uma temporada ainda fora da
+# base local é baixada por completo, então a primeira carreira de um veterano pode levar vários downloads.
+# Só as temporadas fora do cache são lidas, em paralelo e sem o Streamlit (as threads do pool não têm
+# contexto de sessão); o cache compartilhado é preenchido depois, na thread da sessão.
+def logs_da_carreira(player_id, seasons):
+    seasons = [temporada_nba(season) for season in seasons]
+    faltando = [season for season in seasons if not temporada_no_cache(season)]
+    bases = dict(zip(faltando, _pool_temporadas.map(carregar_logs_da_liga, faltando)))
+    partes = [logs_do_jogador(get_league_gamelogs(season, _base=bases.get(season)), player_id) for season in seasons]
+    partes = [parte for parte in partes if not parte.empty]
+    if not partes:
+        return pd.DataFrame()
+    carreira = pd.concat(partes, ignore_index=True)
+    return carreira.sort_values('GAME_DATE', kind='stable').reset_index(drop=True)
+
+
+# Função para encontrar os jogadores da liga com a estatística >= linha em pelo menos min_pct% dos jogos.
+# Com player_ids (ex.: o elenco de uma equipe) só esses jogadores entram, recortados pelo índice ordenado.
+def jogadores_acima_da_linha(base, column, threshold, min_pct, min_jogos=1, player_ids=None):
+    logs = base['logs']
+    if player_ids is not None:
+        logs = pd.concat([logs.iloc[:0]] + [logs_do_jogador(base, player_id) for player_id in player_ids], ignore_index=True)
+    agrupado = (logs[column] >= threshold).groupby(logs['PLAYER_ID'], sort=False)
+    tabela = pd.DataFrame({'Total Jogos': agrupado.size(), 'Frequência': agrupado.sum()})
+    tabela['Porcentagem'] = (tabela['Frequência'] / tabela['Total Jogos'] * 100).round(1)
+    tabela['Odds'] = (tabela['Total Jogos'] / tabela['Frequência'].where(tabela['Frequência'] > 0)).round(2)
+    valores = logs[column].astype('float64').groupby(logs['PLAYER_ID'], sort=False)
+    tabela['Média'] = valores.mean().round(1)
+    tabela['Desvio Padrão'] = valores.std().round(2)
+
+    tabela = tabela[(tabela['Total Jogos'] >= min_jogos) & (tabela['Porcentagem'] >= min_pct)]
+    nomes = logs.drop_duplicates('PLAYER_ID').set_index('PLAYER_ID')['PLAYER_NAME']
+    tabela.insert(0, 'Jogador', nomes.reindex(tabela.index).astype(str).to_numpy())
+    return tabela.sort_values('Porcentagem', ascending=False).reset_index(drop=True)
+
+
+if __name__ == '__main__':
+    # Ingestão em lote das temporadas informadas, ex.: python nba_store.py 2022-23 2023-24
+    for season in sys.argv[1:] or [ano_temporada_atual()]:
+        print(ingerir_temporada(season))
@@ -1,26 +1,18 @@
 import streamlit as st
 import pandas as pd
+import numpy as np
+from contextlib import closing
 import matplotlib.pyplot as plt
 import plotly.express as px
+from football_data import get_football_dataset, get_odds_index
+from data_index import positions_in_odds_range, filter_positions
+from backtest import (MERCADOS, PLANOS_GESTAO, LIMITE_CRESCIMENTO_BANCA, calcular_backtest_gestao, calcular_lucros, odds_e_vitorias,
+                      backtest_agrupado, faixas_de_odds, grade_de_odds, varredura_backtest)
+from montecarlo import METODOS_REAMOSTRAGEM, ORCAMENTO_ELEMENTOS, reamostrar_backtest, resumir_reamostragem
+from backtest_jobs import configs_da_grade, executar_em_paralelo
 
-# Carregar os dados do CSV
-@st.cache_data
-def load_data():
-    data = pd.read_csv('FootballData.csv')
-
-    # Adicionar novas colunas para o mercado de dupla chance
-    data['B365_1X'] = 1 / ((1 / data['B365H']) + (1 / data['B365D']))  # Casa ou Empate
-    data['B365_X2'] = 1 / ((1 / data['B365D']) + (1 / data['B365A']))  # Empate ou Visitante
-    data['B365_12'] = 1 / ((1 / data['B365H']) + (1 / data['B365A']))  # Casa ou Visitante
-
-    # Arredondar as novas colunas para duas casas decimais
-    data['B365_1X'] = data['B365_1X'].round(2)
-    data['B365_X2'] = data['B365_X2'].round(2)
-    data['B365_12'] = data['B365_12'].round(2)
-
-    return data
-
-data = load_data()
+data = get_football_dataset()
+odds_index = get_odds_index()
 
 st.sidebar.header('Filtros dos Dados')
 # Filtro de ligas (com opção "Todas")
@@ -31,23 +23,19 @@ ligas_selecionadas = st.sidebar.multiselect(
     default='Todas'
 )
 
-# Lógica de seleção de ligas
-if 'Todas' in ligas_selecionadas:
-    data_filtrada = data
-else:
-    data_filtrada = data[data['Div'].isin(ligas_selecionadas)]
-
-
 tipo_aposta = st.sidebar.radio("Seleção da Equipe para filtro das Odds:", ('Casa','Empate', 'Visitante'), horizontal=True)
 odd_min = st.sidebar.number_input('Odd Mínima', min_value=1.01, max_value=50.0, value=1.01)
 odd_max = st.sidebar.number_input('Odd Máxima', min_value=1.02, max_value=100.0, value=100.0)
-    
-if tipo_aposta == 'Casa':
-    data_filtrada = data_filtrada[(data_filtrada['B365H'] >= odd_min) & (data_filtrada['B365H'] <= odd_max)]
-elif tipo_aposta == 'Empate':
-    data_filtrada = data_filtrada[(data_filtrada['B365D'] >= odd_min) & (data_filtrada['B365D'] <= odd_max)]
-elif tipo_aposta == 'Visitante':
-    data_filtrada = data_filtrada[(data_filtrada['B365A'] >= odd_min) & (data_filtrada['B365A'] <= odd_max)]
+
+# Faixa de odds pelo índice ordenado, cruzada com as ligas selecionadas
+colunas_filtro = {'Casa': 'B365H', 'Empate': 'B365D', 'Visitante': 'B365A'}
+posicoes = positions_in_odds_range(odds_index, colunas_filtro[tipo_aposta], odd_min, odd_max)
+
+# Lógica de seleção de ligas
+if 'Todas' not in ligas_selecionadas:
+    posicoes = filter_positions(data, posicoes, 'Div', ligas_selecionadas)
+
+data_filtrada = data.iloc[np.sort(posicoes)]
 
 # Cálculo da odd média com base nos valores de odd mínima e máxima inseridos
 odd_media = (odd_min + odd_max) / 2
@@ -66,73 +54,38 @@ mercado_aposta = st.sidebar.radio("Selecione a opção de aposta:",
 banca_inicial = st.sidebar.number_input('Banca Inicial', value=1000.0)
 valor_aposta = st.sidebar.number_input('Valor da Aposta Fixa', value=10.0)
 
+# Gestão de banca (plano de apostas)
+plano_gestao = st.sidebar.radio('Gestão de Banca', PLANOS_GESTAO)
+parametros_gestao = {'valor_aposta': valor_aposta}
+if plano_gestao == '% da Banca':
+    parametros_gestao['percentual'] = st.sidebar.number_input('% da Banca por Aposta', min_value=0.1, max_value=100.0, value=2.0)
+elif plano_gestao == 'Kelly Fracionado':
+    parametros_gestao['fracao_kelly'] = st.sidebar.number_input('Fração de Kelly', min_value=0.01, max_value=1.0, value=0.25)
+    st.sidebar.caption('Probabilidade justa estimada pela taxa de acerto das apostas anteriores da mesma faixa de odds (sem usar resultados futuros).')
+elif plano_gestao == 'Martingale':
+    st.sidebar.caption('A aposta fixa é a aposta inicial, dobrada a cada derrota seguida.')
+parametros_gestao['stop_loss'] = st.sidebar.number_input('Stop Loss (% da banca inicial, 0 = desativado)', min_value=0.0, max_value=100.0, value=0.0)
+# No Martingale a parada é sempre aplicada: a progressão não continua sem banca para a próxima aposta
+parametros_gestao['parar_na_quebra'] = st.sidebar.checkbox(
+    'Parar quando a banca não cobrir a aposta', value=plano_gestao == 'Martingale', disabled=plano_gestao == 'Martingale',
+    help='Sempre ativo no Martingale.' if plano_gestao == 'Martingale' else None
+)
 
-# Função para calcular o backtest
-def calcular_backtest(data, mercado, banca_inicial, valor_aposta):
-    banca = banca_inicial
-    total_apostas = 0
-    apostas_ganhas = 0
-    apostas_perdidas = 0
-    evolucao_banca = [banca_inicial]  # Lista para registrar a evolução da banca
-
-    for index, row in data.iterrows():
-        odd = 0
-        resultado = row['FTR']  # FTR: Full Time Result (H, D, A)
-        
-        # Definir a odd com base no mercado escolhido
-        if mercado == '1 (Casa)':
-            odd = row['B365H']
-            aposta_vencedora = (resultado == 'H')  # H = vitória do time da casa
-        elif mercado == 'X (Empate)':
-            odd = row['B365D']
-            aposta_vencedora = (resultado == 'D')  # D = empate
-        elif mercado == '2 (Visitante)':
-            odd = row['B365A']
-            aposta_vencedora = (resultado == 'A')  # A = vitória do time visitante
-        elif mercado == '1X (Casa ou Empate)':
-            odd = row['B365_1X']
-            aposta_vencedora = (resultado == 'H' or resultado == 'D')  # Casa ou Empate
-        elif mercado == 'X2 (Empate ou Visitante)':
-            odd = row['B365_X2']
-            aposta_vencedora = (resultado == 'D' or resultado == 'A')  # Empate ou Visitante
-        elif mercado == '12 (Casa ou Visitante)':
-            odd = row['B365_12']
-            aposta_vencedora = (resultado == 'H' or resultado == 'A')  # Casa ou Visitante
-
-        # Realizar a aposta
-        if aposta_vencedora:
-            ganho = valor_aposta * (odd - 1)
-            banca += ganho
-            apostas_ganhas += 1
-        else:
-            banca -= valor_aposta
-            apostas_perdidas += 1
-
-        total_apostas += 1
-        evolucao_banca.append(banca)  # Registrar a banca após cada aposta
+# Reamostragem (Monte Carlo) para os intervalos de confiança
+st.sidebar.header('Intervalos de Confiança')
+reamostragens = st.sidebar.number_input('Reamostragens (Monte Carlo)', min_value=100, max_value=100000, value=10000, step=1000)
+metodo_reamostragem = st.sidebar.radio('Método de Reamostragem', METODOS_REAMOSTRAGEM)
 
-    roi = round(((banca - banca_inicial) / banca_inicial) * 100, 2)
-    return banca, total_apostas, apostas_ganhas, apostas_perdidas, roi, evolucao_banca
 
 # Função para analisar a lucratividade por liga
 def analisar_lucratividade_por_liga(data, mercado, banca_inicial, valor_aposta):
-    ligas = data['Div'].unique()
-    resultados = []
-    
-    for liga in ligas:
-        data_liga = data[data['Div'] == liga]
-        banca_final, total_apostas, apostas_ganhas, apostas_perdidas, roi, evolucao_banca = calcular_backtest(
-            data_liga, mercado, banca_inicial, valor_aposta)
-        resultados.append({
-            'Liga': liga,
-            'Banca Final': banca_final,
-            'ROI': roi,
-            'Apostas Ganhas': apostas_ganhas,
-            'Apostas Perdidas': apostas_perdidas,
-            'Zerou Banca': any(b <= 0 for b in evolucao_banca)
-        })
-    
-    return pd.DataFrame(resultados)
+    resultados = backtest_agrupado(data, mercado, banca_inicial, valor_aposta, 'Div')
+    return resultados.rename(columns={'Div': 'Liga'})
+
+# Função para analisar a lucratividade por liga e temporada
+def analisar_lucratividade_por_temporada(data, mercado, banca_inicial, valor_aposta):
+    resultados = backtest_agrupado(data, mercado, banca_inicial, valor_aposta, ['Div', 'Temporada'])
+    return resultados.rename(columns={'Div': 'Liga'})
 
 # Função para estilizar a tabela de lucratividade
 def estilizar_lucratividade(df_lucratividade):
@@ -202,49 +155,9 @@ def plot_lucratividade_por_liga(df_lucratividade):
 
 # Função para calcular a lucratividade por faixa de odds
 def calcular_lucratividade_por_faixa(data, mercado, banca_inicial, valor_aposta):
-    # Escolher a coluna de odds com base no mercado selecionado
-    if mercado == '1 (Casa)':
-        odds_col = 'B365H'
-    elif mercado == 'X (Empate)':
-        odds_col = 'B365D'
-    elif mercado == '2 (Visitante)':
-        odds_col = 'B365A'
-    elif mercado == '1X (Casa ou Empate)':
-        odds_col = 'B365_1X'
-    elif mercado == 'X2 (Empate ou Visitante)':
-        odds_col = 'B365_X2'
-    elif mercado == '12 (Casa ou Visitante)':
-        odds_col = 'B365_12'
-
-    # Definir faixas de odds
-    bins = [1.01, 1.51, 2.01, 2.51, 3.01, 3.51, 4.01, 4.51, 5.01, 6.01, 7.01, 8.01, 9.01, 10.01, 11.01, 12.01, 13.01, 14.01, 15.01, float('inf')]
-    labels = ['1.01-1.5', '1.51-2.0', '2.01-2.5', '2.51-3.0', '3.01-3.5', '3.51-4.0', '4.01-4.5', '4.51-5.0', '5.01-6.0', '6.01-7.0', '7.01-8.0', '8.01-9.0', '9.01-10.0', '10.01-11.0', '11.01-12.0', '12.01-13.0', '13.01-14.0', '14.01-15.0', '15.0+']
-
-
-    # Aplicar as faixas à coluna de odds
-    data['Faixa de Odds'] = pd.cut(data[odds_col], bins=bins, labels=labels, include_lowest=True)
-    
-    # Inicializar resultados
-    resultados = []
-    
-    for faixa in data['Faixa de Odds'].unique():
-        # Filtrar os dados por faixa
-        data_faixa = data[data['Faixa de Odds'] == faixa]
-        
-        if not data_faixa.empty:
-            # Aplicar o backtest na faixa
-            banca_final, total_apostas, apostas_ganhas, apostas_perdidas, roi, evolucao_banca = calcular_backtest(
-                data_faixa, mercado, banca_inicial, valor_aposta
-            )
-            resultados.append({
-                'Faixa de Odds': str(faixa),  # Convertendo o intervalo para string
-                'Banca Final': banca_final,
-                'ROI': roi,
-                'Apostas Ganhas': apostas_ganhas,
-                'Apostas Perdidas': apostas_perdidas,
-            })
-    
-    return pd.DataFrame(resultados)
+    resultados = backtest_agrupado(data, mercado, banca_inicial, valor_aposta, faixas_de_odds(data, mercado))
+    resultados['Faixa de Odds'] = resultados['Faixa de Odds'].astype(str)
+    return resultados
 
 
 # Função para plotar a lucratividade por faixa de odds
@@ -254,16 +167,45 @@ def plot_lucratividade_por_faixa(df_lucratividade):
                  title='Lucratividade por Faixa de Odds')
     st.plotly_chart(fig)
 
+# Função para plotar o mapa de calor do ROI por faixa de odds da varredura
+def plot_mapa_varredura(df_varredura, mercado, liga):
+    df_mapa = df_varredura[(df_varredura['Mercado'] == mercado) & (df_varredura['Liga'] == liga)]
+    mapa = df_mapa.pivot(index='Odd Mínima', columns='Odd Máxima', values='ROI')
+    fig = px.imshow(mapa, color_continuous_scale='RdYlGn', color_continuous_midpoint=0, aspect='auto',
+                    labels={'color': 'ROI'}, title=f'ROI por Faixa de Odds - {mercado} - {liga}')
+    st.plotly_chart(fig)
+
+# Função para exibir o resumo e as distribuições da reamostragem
+def plot_reamostragem(resultado, resumo):
+    col1, col2, col3, col4 = st.columns(4)
+    col1.metric('ROI (IC 95%)', f"{resumo['ROI Inferior']:.2f}% a {resumo['ROI Superior']:.2f}%")
+    col2.metric('Probabilidade de ROI Positivo', f"{resumo['Probabilidade de ROI Positivo (%)']:.1f}%")
+    col3.metric('Probabilidade de Quebra', f"{resumo['Probabilidade de Quebra (%)']:.1f}%")
+    col4.metric('Drawdown Máximo (mediana / 97,5%)', f"{resumo['Drawdown Mediano']:.2f} / {resumo['Drawdown Superior']:.2f}")
+
+    col1, col2 = st.columns(2)
+    with col1:
+        fig = px.histogram(x=resultado['ROI'], nbins=50, title='Distribuição do ROI', labels={'x': 'ROI (%)'})
+        st.plotly_chart(fig)
+    with col2:
+        fig = px.histogram(x=resultado['Drawdown Máximo'], nbins=50, title='Distribuição do Drawdown Máximo',
+                           labels={'x': 'Drawdown Máximo'})
+        st.plotly_chart(fig)
+
 # --- Aplicar o Backtest ---
 if st.button('Aplicar Backtest'):
 
     if len(data_filtrada) == 0:
         st.write("Sem dados para aplicar o Backtest. Verifique os filtros e aplique o Backtest novamente.")
     elif len(data_filtrada) >= 1 :
-        banca_final, total_apostas, apostas_ganhas, apostas_perdidas, roi, evolucao_banca = calcular_backtest(
-        data_filtrada, mercado_aposta, banca_inicial, valor_aposta
+        banca_final, total_apostas, apostas_ganhas, apostas_perdidas, roi, evolucao_banca, corte_no_limite = calcular_backtest_gestao(
+        data_filtrada, mercado_aposta, banca_inicial, plano_gestao, **parametros_gestao
     )
     
+        if corte_no_limite is not None:
+            st.warning(f"A banca passou de {LIMITE_CRESCIMENTO_BANCA:.0e}x a banca inicial e a simulação parou depois de "
+                       f"{corte_no_limite} das {len(data_filtrada)} apostas. Os resultados abaixo cobrem apenas as apostas até esse ponto.")
+
         # Exibição dos resultados com retângulos coloridos e fonte preta
         st.subheader('Resultados do Backtest')
 
@@ -290,6 +232,24 @@ if st.button('Aplicar Backtest'):
         # Mostrar a evolução da banca
         st.line_chart(evolucao_banca)
 
+        # Intervalos de confiança por reamostragem da sequência de apostas (aposta fixa)
+        st.subheader('Intervalos de Confiança (Monte Carlo)')
+        st.caption('A reamostragem usa sempre a aposta fixa, independentemente do plano de gestão selecionado.')
+        odds, vitorias = odds_e_vitorias(data_filtrada, mercado_aposta)
+        resultado_reamostragem = reamostrar_backtest(
+            calcular_lucros(odds, vitorias, valor_aposta), banca_inicial, reamostragens, metodo_reamostragem
+        )
+        # O número efetivo de reamostragens é sempre exibido: amostras grandes são reduzidas pelo orçamento
+        if resultado_reamostragem['Reamostragens'] < reamostragens:
+            st.caption(f"Reamostragens: {resultado_reamostragem['Reamostragens']} (de {reamostragens} pedidas), "
+                       f"para manter a simulação dentro do orçamento de {ORCAMENTO_ELEMENTOS:,} apostas simuladas.")
+        else:
+            st.caption(f"Reamostragens: {resultado_reamostragem['Reamostragens']}.")
+        plot_reamostragem(resultado_reamostragem, resumir_reamostragem(resultado_reamostragem))
+
+        if plano_gestao != 'Aposta Fixa':
+            st.caption('As análises por liga, temporada e faixa de odds abaixo usam a aposta fixa.')
+
         df_lucratividade = analisar_lucratividade_por_liga(data_filtrada, mercado_aposta, banca_inicial, valor_aposta)
         #st.table(df_lucratividade)
     
@@ -297,6 +257,11 @@ if st.button('Aplicar Backtest'):
         plot_lucratividade_por_liga(df_lucratividade) 
         st.dataframe(estilizar_lucratividade(df_lucratividade))
 
+        # Tabela de lucratividade por liga e temporada
+        st.subheader('Lucratividade por Liga e Temporada')
+        df_lucratividade_temporada = analisar_lucratividade_por_temporada(data_filtrada, mercado_aposta, banca_inicial, valor_aposta)
+        st.dataframe(estilizar_lucratividade(df_lucratividade_temporada))
+
         # Plotar gráficos adicionais
         st.subheader('Distribuição das Odds')
         plot_distribuicao_odds(data_filtrada)
@@ -313,4 +278,61 @@ if st.button('Aplicar Backtest'):
         plot_lucratividade_por_faixa(df_lucratividade_faixa)
 
         # Exibir a tabela de lucratividade por faixa de odds
-        st.dataframe(df_lucratividade_faixa)
\ No newline at end of file
+        st.dataframe(df_lucratividade_faixa)
+
+
+# --- Varredura de Estratégias ---
+st.header('Varredura de Estratégias')
+st.write("Avalie de uma só vez todos os mercados, ligas e faixas de odds. A faixa é aplicada às odds do próprio mercado.")
+
+col1, col2 = st.columns(2)
+with col1:
+    mercados_varredura = st.multiselect('Mercados', options=list(MERCADOS), default=list(MERCADOS))
+    ligas_varredura = st.multiselect('Ligas (Todas = ligas somadas)', options=ligas, default=ligas)
+with col2:
+    odd_inicial = st.number_input('Odd Inicial da Grade', min_value=1.01, value=1.10, step=0.05)
+    odd_final = st.number_input('Odd Final da Grade', min_value=1.02, value=5.0, step=0.05)
+    passo_odds = st.number_input('Passo da Grade', min_value=0.01, value=0.10, step=0.05)
+
+executar_paralelo = st.checkbox('Backtest completo em paralelo (inclui Zerou Banca e Drawdown Máximo)')
+
+if st.button('Aplicar Varredura'):
+    grade = grade_de_odds(odd_inicial, odd_final, passo_odds)
+    if not mercados_varredura or not ligas_varredura or len(grade) < 2:
+        st.write("Selecione ao menos um mercado, uma liga e uma grade com duas ou mais odds.")
+    elif executar_paralelo:
+        configs = configs_da_grade(mercados_varredura, ligas_varredura, grade)
+
+        # Clicar em Cancelar interrompe esta execução e os lotes pendentes são descartados
+        st.button('Cancelar Varredura')
+        progresso = st.progress(0.0)
+        parcial = st.empty()
+
+        resultados = []
+        melhores = []
+        with closing(executar_em_paralelo(configs, banca_inicial, valor_aposta)) as execucao:
+            for fracao, lote in execucao:
+                resultados.extend(lote)
+                melhores = sorted(melhores + lote, key=lambda resultado: resultado['ROI'], reverse=True)[:10]
+                progresso.progress(fracao, text=f'{len(resultados)} de {len(configs)} backtests concluídos')
+                parcial.dataframe(pd.DataFrame(melhores), hide_index=True)
+
+        parcial.empty()
+        st.session_state['varredura'] = pd.DataFrame(resultados)
+    else:
+        st.session_state['varredura'] = varredura_backtest(
+            data, mercados_varredura, ligas_varredura, grade, banca_inicial, valor_aposta
+        )
+
+if 'varredura' in st.session_state:
+    df_varredura = st.session_state['varredura']
+
+    col1, col2 = st.columns(2)
+    mercado_mapa = col1.selectbox('Mercado do Mapa', df_varredura['Mercado'].unique())
+    liga_mapa = col2.selectbox('Liga do Mapa', df_varredura['Liga'].unique())
+    plot_mapa_varredura(df_varredura, mercado_mapa, liga_mapa)
+
+    st.subheader('Ranking das Estratégias')
+    minimo_apostas = st.number_input('Mínimo de Apostas', min_value=1, value=100, step=10)
+    ranking = df_varredura[df_varredura['Total de Apostas'] >= minimo_apostas].sort_values(by='ROI', ascending=False)
+    st.dataframe(ranking.head(50), hide_index=True)
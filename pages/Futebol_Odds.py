@@ -1,71 +1,51 @@
 import streamlit as st
 import pandas as pd
-
-# Função para carregar dados CSV
-@st.cache_data
-def load_data(file):
-    data = pd.read_csv(file)
-    data['Score'] = data['FTHG'].astype(str) + 'x' + data['FTAG'].astype(str)
-
-    data['Goleada'] = 0
-    
-    goleada_casa = (data['FTHG'] >= 4) & (data['FTHG'] > data['FTAG'])
-    goleada_fora = (data['FTAG'] >= 4) & (data['FTAG'] > data['FTHG'])
-    
-    data.loc[goleada_casa, 'Goleada'] = 1
-    data.loc[goleada_fora, 'Goleada'] = 2
-
-    return data
-
-# Função para filtrar os dados por odds
-def filter_data_by_odds(data, min_odds, max_odds, team_type):
-    if team_type == 'Casa':
-        filtered_data = data[(data['B365H'] >= min_odds) & (data['B365H'] <= max_odds)]
-    else:
-        filtered_data = data[(data['B365A'] >= min_odds) & (data['B365A'] <= max_odds)]
-    return filtered_data
-
-# Função para filtrar por ligas
-def filter_data_by_leagues(data, selected_leagues):
+import numpy as np
+from football_data import get_football_dataset, get_odds_index, get_team_index, get_stats_cube
+from data_index import filter_positions, filter_positions_by_range, team_positions
+from football_stats import (consultar_cubo, resumir_jogos, total_de_jogos, resultados_do_resumo, medias_do_resumo,
+                            frequencias_de_placares, goleadas_do_resumo, over_under_do_resumo,
+                            ESTATISTICAS_LINHAS, histograma_do_resumo, ambas_marcam, handicap_asiatico,
+                            ht_ft_do_resumo, gol_nos_dois_tempos)
+from line_markets import mercado_de_linhas
+from cards import card_html, exibir_grade, exibir_total, cards_de_contagens, cards_de_placares, cards_de_linhas, cards_de_metricas
+
+# Função para cruzar as posições com as ligas selecionadas
+def filter_positions_by_leagues(data, positions, selected_leagues):
     if 'Todas' in selected_leagues or not selected_leagues:
-        return data
+        return positions
     else:
-        filtered_data = data[data['Div'].isin(selected_leagues)]
-        return filtered_data
+        return filter_positions(data, positions, 'Div', selected_leagues)
 
 
-# Função para filtrar por equipe
-def filter_data_by_teams(data, selected_teams, team_type):
-    if 'Todas' in selected_teams or not selected_teams:
-        return data
+# Função para obter as posições dos jogos das equipes selecionadas (índice de equipes)
+def filter_positions_by_teams(team_index, selected_teams, team_type):
+    if team_type == 'Casa':
+        return team_positions(team_index, 'HomeTeam', selected_teams)
     else:
-        if team_type == 'Casa':
-            filtered_data = data[data['HomeTeam'].isin(selected_teams)]
-        else:
-            filtered_data = data[data['AwayTeam'].isin(selected_teams)]
-        return filtered_data
+        return team_positions(team_index, 'AwayTeam', selected_teams)
 
 
 # Função para calcular estatísticas adicionais
-def calculate_additional_stats(data, team_type):
+def calculate_additional_stats(medias, team_type):
     if team_type == 'Casa':
-        goals_for = data['FTHG'].mean()
-        goals_against = data['FTAG'].mean()
-        shots_total = data['HS'].mean()
-        shots_on_target = data['HST'].mean()
-        corners = data['HC'].mean()
-        shots_conceded_total = data['AS'].mean()
-        shots_conceded_on_target = data['AST'].mean()
-        corners_conceded = data['AC'].mean()
+        goals_for = medias['FTHG']
+        goals_against = medias['FTAG']
+        shots_total = medias['HS']
+        shots_on_target = medias['HST']
+        corners = medias['HC']
+        shots_conceded_total = medias['AS']
+        shots_conceded_on_target = medias['AST']
+        corners_conceded = medias['AC']
     else:
-        goals_for = data['FTAG'].mean()
-        goals_against = data['FTHG'].mean()
-        shots_total = data['AS'].mean()
-        shots_on_target = data['AST'].mean()
-        corners = data['AC'].mean()
-        shots_conceded_total = data['HS'].mean()
-        shots_conceded_on_target = data['HST'].mean()
-        corners_conceded = data['HC'].mean()
+        goals_for = medias['FTAG']
+        goals_against = medias['FTHG']
+        shots_total = medias['AS']
+        shots_on_target = medias['AST']
+        corners = medias['AC']
+        shots_conceded_total = medias['HS']
+        shots_conceded_on_target = medias['HST']
+        corners_conceded = medias['HC']
 
     finishing_efficiency = (shots_on_target / shots_total) * 100 if shots_total > 0 else 0
     shots_per_goal = shots_total / goals_for if goals_for > 0 else 0
@@ -97,73 +77,13 @@ def calculate_additional_stats(data, team_type):
     return stats
 
 
-# Função para contar os resultados
-def count_results(data):
-    total_games = len(data)
-    home_wins = len(data[data['FTR'] == 'H'])
-    draws = len(data[data['FTR'] == 'D'])
-    away_wins = len(data[data['FTR'] == 'A'])
-
-    results = {
-        'Vitórias da Casa': {
-            'Contagem': home_wins,
-            'Porcentagem': (home_wins / total_games) * 100 if total_games > 0 else 0,
-            'Odds Decimais': 1 / (home_wins / total_games) if home_wins > 0 else 0
-        },
-        'Empates': {
-            'Contagem': draws,
-            'Porcentagem': (draws / total_games) * 100 if total_games > 0 else 0,
-            'Odds Decimais': 1 / (draws / total_games) if draws > 0 else 0
-        },
-        'Vitórias do Visitante': {
-            'Contagem': away_wins,
-            'Porcentagem': (away_wins / total_games) * 100 if total_games > 0 else 0,
-            'Odds Decimais': 1 / (away_wins / total_games) if away_wins > 0 else 0
-        },
-    }
-    return results
-
-def count_score_frequencies(data):
-    score_counts = data['Score'].value_counts().reset_index()
-    score_counts.columns = ['Score', 'Frequência']
-    score_counts['Porcentagem'] = (score_counts['Frequência'] / len(data)) * 100
-    score_counts['Odd'] = 100 / score_counts['Porcentagem']  
-    return score_counts
-
-def criar_colunas_over_under_gols(data):
-    # Criar a coluna 'Total Gols'
-    data['Total Gols'] = data['FTHG'] + data['FTAG']
-    
-    # Criar colunas de Over e Under Gols de 0.5 até 7.5
-    for over in [0.5, 1.5, 2.5, 3.5, 4.5, 5.5, 6.5, 7.5]:
-        data[f'Over_{over}'] = (data['Total Gols'] > over).astype(int)
-        data[f'Under_{over}'] = (data['Total Gols'] < over).astype(int)
-    
-    return data
-
-def analisar_over_under_gols(data):
-    resultados_over_under_gols = {}
-    total_jogos = len(data)
-    
-    for over in [0.5, 1.5, 2.5, 3.5, 4.5, 5.5, 6.5, 7.5]:
-        resultados_over_under_gols[f'Over_{over}'] = {
-            'Ocorrência': data[f'Over_{over}'].sum(),
-            'Frequência (%)': round(data[f'Over_{over}'].mean() * 100,2),
-            'Odds': round(1 / data[f'Over_{over}'].mean(), 2) if data[f'Over_{over}'].mean() > 0 else 0
-        }
-        resultados_over_under_gols[f'Under_{over}'] = {
-            'Ocorrência': data[f'Under_{over}'].sum(),
-            'Frequência (%)': round(data[f'Under_{over}'].mean() * 100,2),
-            'Odds': round(1 / data[f'Under_{over}'].mean(), 2) if data[f'Under_{over}'].mean() > 0 else 0
-        }
-    
-    return resultados_over_under_gols
-
 st.set_page_config(layout="wide")
 st.title('Análise de Futebol Pré Live com Odds')
 st.subheader('Dados das temporadas entre 2011-2024')
 
-data = load_data('FootballData.csv')
+data = get_football_dataset()
+odds_index = get_odds_index()
+team_index = get_team_index()
 
 # Sidebar
 with st.sidebar:
@@ -178,8 +98,9 @@ with st.sidebar:
     if 'Todas' in selected_leagues or not selected_leagues:
         teams = ['Todas'] + sorted(data['HomeTeam'].unique().tolist() if team_type == 'Casa' else data['AwayTeam'].unique().tolist())
     else:
-        filtered_data_leagues = filter_data_by_leagues(data, selected_leagues)
-        teams = ['Todas'] + sorted(filtered_data_leagues['HomeTeam'].unique().tolist() if team_type == 'Casa' else filtered_data_leagues['AwayTeam'].unique().tolist())
+        league_positions = filter_positions_by_leagues(data, np.arange(len(data)), selected_leagues)
+        team_column = data['HomeTeam'] if team_type == 'Casa' else data['AwayTeam']
+        teams = ['Todas'] + sorted(team_column.iloc[league_positions].unique().tolist())
 
     selected_teams = st.multiselect('Selecione uma ou mais equipes', teams, default=['Todas'])
 
@@ -190,222 +111,84 @@ with st.sidebar:
     st.sidebar.write(f"Odd Média do Filtro: {odd_media:.2f}")
 
     
-# Filtrando os dados
-filtered_data = filter_data_by_leagues(data, selected_leagues)
-filtered_data = filter_data_by_teams(filtered_data, selected_teams, team_type)
-filtered_data = filter_data_by_odds(filtered_data, min_odds, max_odds,team_type)
-results = count_results(filtered_data)
-additional_stats = calculate_additional_stats(filtered_data, team_type)
-
-# Função para exibir uma métrica com cores personalizadas
-def colored_metric(label, value, color):
-    value_display = f"{value:.2f}" if value is not None else "N/A"
-    st.markdown(
-        f"""
-        <div style="text-align: center;background-color: {color}; padding: 10px; border-radius: 5px; margin-bottom: 10px;">
-            <h5 style="color: white;font-size: 18px; margin-bottom: 5px;">{label}</h5>
-            <p style="color: white; font-size: 22px; margin: 0;">{value_display}</p>
-        </div>
-        """,
-        unsafe_allow_html=True
-    )
-
-def create_metric(title, value, frequency, odds, color):
-    return f"""
-    <div style="background-color: {color}; padding: 10px; border-radius: 5px;text-align: center; width: 240px; height: 180px; margin: 10px; padding: 10px;">
-        <h3 style="font-size: 22px; margin: 0;">{title}</h3>
-        <p style="font-size: 18px; margin: 5px 0;">{value} jogos</p>
-        <p style="font-size: 18px; margin: 5px 0;">{frequency}</p>
-        <p style="font-size: 18px; margin: 5px 0;">Odd: {odds}</p>
-    </div>
-    """
-
-def display_score_results(score_counts):
-
-    st.subheader('Frequências dos Resultados Corretos')
-
-    # Cria colunas para exibir os resultados em uma grade horizontal
-    num_cols = 5  # Número de colunas na grade
-    num_rows = (len(score_counts) + num_cols - 1) // num_cols  # Calcula o número de linhas necessárias
-
-    cols = st.columns(num_cols)  # Cria as colunas para exibir os resultados
-
-    # Calcula a intensidade de cor com base na porcentagem máxima
-    max_percentage = score_counts['Porcentagem'].max()
-
-    for i in range(num_rows):
-        for j in range(num_cols):
-            index = i * num_cols + j
-            if index < len(score_counts):
-                score = score_counts.iloc[index]['Score']
-                frequency = score_counts.iloc[index]['Frequência']
-                percentage = score_counts.iloc[index]['Porcentagem']
-                odd = score_counts.iloc[index]['Odd']
-
-                # Calcula a cor com base na porcentagem
-                color_intensity = int((percentage / max_percentage) * 225)
-                color = f'rgb({250 - color_intensity}, {color_intensity}, 50)'
-
-                with cols[j]:
-                    st.markdown(
-                        f"""
-                        <div style="text-align: center; background-color: {color}; color: white; width: 200px; height: 160px; 
-                        text-align: center; justify-content: center; margin: 5px; font-size: 22px; border-radius: 10px; padding: 10px;">
-                            <strong>{score}</strong><br>
-                            <span style="font-size: 18px;">Frequência: {frequency}<br> {percentage:.2f}%<br> Odd: {odd:.2f} </span>
-                        </div>
-                        """,
-                        unsafe_allow_html=True
-                    )
-
-def calcularGoleada(df):
-  
-    total_jogos = len(df)
-
-    freq_casa = (df['Goleada'] == 1).sum()
-    freq_fora = (df['Goleada'] == 2).sum()
-    
-    prob_casa = freq_casa / total_jogos
-    prob_fora = freq_fora / total_jogos
-    
-    odds_casa = 1 / prob_casa if prob_casa > 0 else float('inf')
-    odds_fora = 1 / prob_fora if prob_fora > 0 else float('inf')
-
-       
-    return {
-        'Frequência Goleada Casa': freq_casa,
-        'Probabilidade Goleada Casa': prob_casa,
-        'Odds Goleada Casa': odds_casa,
-        'Frequência Goleada Visitante': freq_fora,
-        'Probabilidade Goleada Visitante Ajustada': prob_fora,
-        'Odds Goleada Visitante Ajustada': odds_fora
-    }
-
-def exibirGoleada(probabilidades):
-    
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        st.markdown(
-        f"""
-        <div style="text-align: center; background-color: #061c96; padding: 10px; border-radius: 5px; margin-bottom: 10px;">
-            <h4 style="color: white; margin-bottom: 5px;"> Goleada da Casa</h4>
-            <p style="color: white; font-size: 24px; margin: 0;">{probabilidades['Frequência Goleada Casa']}</p>
-            <p style="color: white;font-size: 20px; margin: 0;"> {probabilidades['Probabilidade Goleada Casa']:.2%}</p>
-            <p style="color: white;font-size: 20px; margin: 0;"> Odd Justa: {probabilidades['Odds Goleada Casa']:.2f}</p>
-        </div>
-        """,
-        unsafe_allow_html=True
-    )
-    
-    with col2:
-        st.markdown(
-        f"""
-        <div style="text-align: center; background-color: #061c96; padding: 10px; border-radius: 5px; margin-bottom: 10px;">
-            <h4 style="color: white; margin-bottom: 5px;"> Goleada Visitante</h4>
-            <p style="color: white; font-size: 24px; margin: 0;">{probabilidades['Frequência Goleada Visitante']}</p>
-            <p style="color: white;font-size: 20px; margin: 0;"> {probabilidades['Probabilidade Goleada Visitante Ajustada']:.2%}</p>
-            <p style="color: white;font-size: 20px; margin: 0;"> Odd Justa: {probabilidades['Odds Goleada Visitante Ajustada']:.2f}</p>
-        </div>
-        """,
-        unsafe_allow_html=True
-    )
+# Filtrando os dados: sem equipes selecionadas a análise sai do cubo pré-agregado (liga x faixa de odds);
+# com equipes partimos dos jogos delas (índice de equipes) e resumimos apenas essas linhas
+odds_column = 'B365H' if team_type == 'Casa' else 'B365A'
+if 'Todas' in selected_teams or not selected_teams:
+    ligas_cubo = None if 'Todas' in selected_leagues or not selected_leagues else selected_leagues
+    resumo = consultar_cubo(get_stats_cube(odds_column), data, odds_index, ligas_cubo, min_odds, max_odds)
+else:
+    positions = filter_positions_by_teams(team_index, selected_teams, team_type)
+    positions = filter_positions_by_range(data, positions, odds_column, min_odds, max_odds)
+    positions = filter_positions_by_leagues(data, positions, selected_leagues)
+    resumo = resumir_jogos(data.iloc[np.sort(positions)])
+results = resultados_do_resumo(resumo)
+additional_stats = calculate_additional_stats(medias_do_resumo(resumo), team_type)
 
 # Exibir o total de jogos filtrados em uma métrica destacada
-total_games = len(filtered_data)
-st.markdown(f"""
-    <div style="text-align: center; padding: 10px; background-color: #061c96; border-radius: 5px;">
-        <h4 style="color: white;;font-size: 24px">Total de Jogos Filtrados</h4>
-        <h1 style="color: white;; font-size: 35px;">{total_games}</h1>
-    </div>
-""", unsafe_allow_html=True)
+exibir_total('Total de Jogos Filtrados', total_de_jogos(resumo))
 
 # Exibir Resultados com uma apresentação melhorada
 st.subheader("Resultados para Análise")
-
-# Criar colunas para exibir os resultados horizontalmente
-col1, col2, col3 = st.columns(3)
-
-with col1:
-    st.markdown(
-        f"""
-        <div style="text-align: center; background-color: #061c96; padding: 10px; border-radius: 5px; margin-bottom: 10px;">
-            <h4 style="color: white; margin-bottom: 5px;">Vitórias da Casa</h4>
-            <p style="color: white; font-size: 24px; margin: 0;">{results['Vitórias da Casa']['Contagem']}</p>
-            <p style="color: white;font-size: 20px; margin: 0;"> {results['Vitórias da Casa']['Porcentagem']:.2f}%</p>
-            <p style="color: white;font-size: 20px; margin: 0;"> Odd Justa: {results['Vitórias da Casa']['Odds Decimais']:.2f}</p>
-        </div>
-        """,
-        unsafe_allow_html=True
-    )
-
-with col2:
-    st.markdown(
-        f"""
-        <div style="text-align: center;background-color:#061c96; padding: 10px; border-radius: 5px; margin-bottom: 10px;">
-            <h4 style="color: white; margin-bottom: 5px;">Empates</h4>
-            <p style="color: white; font-size: 24px; margin: 0;"> {results['Empates']['Contagem']}</p>
-            <p style="color: white;font-size: 20px; margin: 0;"> {results['Empates']['Porcentagem']:.2f}%</p>
-            <p style="color: white; font-size: 20px; margin: 0;"> Odd Justa: {results['Empates']['Odds Decimais']:.2f}</p>
-        </div>
-        """,
-        unsafe_allow_html=True
-    )
-
-with col3:
-    st.markdown(
-        f"""
-        <div style="text-align: center;background-color: #061c96; padding: 10px; border-radius: 5px; margin-bottom: 10px;">
-            <h4 style="color: white; margin-bottom: 5px;">Vitórias do Visitante</h4>
-            <p style="color: white; font-size: 24px; margin: 0;"> {results['Vitórias do Visitante']['Contagem']}</p>
-            <p style="color: white;font-size: 20px; margin: 0;">  {results['Vitórias do Visitante']['Porcentagem']:.2f}%</p>
-            <p style="color: white;font-size: 20px; margin: 0;"> Odd Justa: {results['Vitórias do Visitante']['Odds Decimais']:.2f}</p>
-        </div>
-        """,
-        unsafe_allow_html=True
-    )
-
+exibir_grade(cards_de_contagens([(nome, results[nome]) for nome in ['Vitórias da Casa', 'Empates', 'Vitórias do Visitante']]), 3)
 
 st.subheader('Analise de Goleadas')
-goleadas = calcularGoleada(filtered_data)
-exibirGoleada(goleadas)
+goleadas = goleadas_do_resumo(resumo)
+exibir_grade([
+    card_html('Goleada da Casa', [
+        goleadas['Frequência Goleada Casa'],
+        f"{goleadas['Probabilidade Goleada Casa']:.2%}",
+        f"Odd Justa: {goleadas['Odds Goleada Casa']:.2f}",
+    ]),
+    card_html('Goleada Visitante', [
+        goleadas['Frequência Goleada Visitante'],
+        f"{goleadas['Probabilidade Goleada Visitante Ajustada']:.2%}",
+        f"Odd Justa: {goleadas['Odds Goleada Visitante Ajustada']:.2f}",
+    ]),
+], 2)
 
 # Calcular e exibir a tabela de resultados mais frequentes
-score_counts = count_score_frequencies(filtered_data)
-display_score_results(score_counts)
+st.subheader('Frequências dos Resultados Corretos')
+exibir_grade(cards_de_placares(frequencias_de_placares(resumo)), 5)
 
-OverGolsdata = criar_colunas_over_under_gols(filtered_data)
-resultados_over_under_gols = analisar_over_under_gols(OverGolsdata)
+resultados_over_under_gols = over_under_do_resumo(resumo)
 
 st.header('Análise de Over e Under Gols')
 
 # Seção de Over Gols
 st.subheader('Análise de Over Gols')
-cols_over = st.columns(4)
-for i, over in enumerate([0.5, 1.5, 2.5, 3.5, 4.5, 5.5, 6.5, 7.5]):
-    with cols_over[i % 4]:  # Distribuindo as colunas em múltiplas linhas
-        color = "#04b846"  # Gradiente de cor
-        st.markdown(create_metric(
-            f"Over {over}",
-            f"{resultados_over_under_gols[f'Over_{over}']['Ocorrência']}",
-            f"{resultados_over_under_gols[f'Over_{over}']['Frequência (%)']}%",
-            f"{resultados_over_under_gols[f'Over_{over}']['Odds']}",
-            color
-        ), unsafe_allow_html=True)
+exibir_grade(cards_de_linhas(resultados_over_under_gols, 'Over', "#04b846"), 4)
 
 # Seção de Under Gols
 st.subheader('Análise de Under Gols')
-cols_under = st.columns(4)
-for i, under in enumerate([0.5, 1.5, 2.5, 3.5, 4.5, 5.5, 6.5, 7.5]):
-    with cols_under[i % 4]:  # Distribuindo as colunas em múltiplas linhas
-        color = "#FF6347"  # Gradiente de cor
-        st.markdown(create_metric(
-            f"Under {under}",
-            f"{resultados_over_under_gols[f'Under_{under}']['Ocorrência']}",
-            f"{resultados_over_under_gols[f'Under_{under}']['Frequência (%)']}%",
-            f"{resultados_over_under_gols[f'Under_{under}']['Odds']}",
-            color
-        ), unsafe_allow_html=True)
+exibir_grade(cards_de_linhas(resultados_over_under_gols, 'Under', "#FF6347"), 4)
+
+# Mercados de linhas: over/under de qualquer estatística de contagem, ambas marcam e handicap asiático
+st.header('Mercados de Linhas')
+estatistica = st.selectbox('Selecione a estatística', ESTATISTICAS_LINHAS, key='estatistica_linhas')
+st.dataframe(mercado_de_linhas(histograma_do_resumo(resumo, estatistica)), hide_index=True)
+
+st.subheader('Ambas Marcam')
+btts = ambas_marcam(resumo)
+exibir_grade(cards_de_contagens([(f'Ambas Marcam: {opcao}', btts[opcao]) for opcao in ['Sim', 'Não']]), 2)
+
+st.subheader('Handicap Asiático (diferença de gols, linha do mandante)')
+st.dataframe(handicap_asiatico(resumo), hide_index=True)
+
+# Intervalo / Final (HT/FT): as linhas de gols de cada tempo estão em Mercados de Linhas
+st.header('Análise de Intervalo / Final (HT/FT)')
+frequencias_ht_ft, odds_ht_ft = ht_ft_do_resumo(resumo)
+col1, col2 = st.columns(2)
+with col1:
+    st.markdown('**Frequência (%)**')
+    st.dataframe(frequencias_ht_ft)
+with col2:
+    st.markdown('**Odd Justa**')
+    st.dataframe(odds_ht_ft)
+
+st.subheader('Gol nos Dois Tempos')
+gol_dois_tempos = gol_nos_dois_tempos(resumo)
+exibir_grade(cards_de_contagens([(f'Gol nos Dois Tempos: {opcao}', gol_dois_tempos[opcao]) for opcao in ['Sim', 'Não']]), 2)
 
 # Exibir Métricas Ofensivas e Defensivas
 st.header("Médias de Ataque e Defesa")
@@ -416,35 +199,35 @@ col1, col2, col3 = st.columns([1, 1, 1])
 # Ofensivas
 with col1:
     st.markdown("**Ataque**")
-    st.markdown("<div style='display: flex; flex-direction: column;'>", unsafe_allow_html=True)
-    colored_metric("Média de Gols Feitos", additional_stats['Média de Gols Feitos'], "#04b846")
-    colored_metric("Média de Finalizações", additional_stats['Média de Finalizações'], "#04b846")
-    colored_metric("Média de Finalizações no Gol", additional_stats['Média de Finalizações no Gol'], "#04b846")
-    colored_metric("Eficiência de Finalização (%) (no gol/total finalizações)", additional_stats['Eficiência de Finalização (%)'], "#04b846")
-    colored_metric("Média de Finalizações para 1 Gol", additional_stats['Média de Finalizações por Gol'], "#04b846")
-    colored_metric("Médias de Finalizações em  Gol para 1 Gol", additional_stats['Médias de Finalizações No Gol Por Gol'], "#04b846")
-    colored_metric("Média de Escanteios a favor", additional_stats['Média de Escanteios'], "#04b846")
-    st.markdown("</div>", unsafe_allow_html=True)
+    exibir_grade(cards_de_metricas([
+        ("Média de Gols Feitos", additional_stats['Média de Gols Feitos']),
+        ("Média de Finalizações", additional_stats['Média de Finalizações']),
+        ("Média de Finalizações no Gol", additional_stats['Média de Finalizações no Gol']),
+        ("Eficiência de Finalização (%) (no gol/total finalizações)", additional_stats['Eficiência de Finalização (%)']),
+        ("Média de Finalizações para 1 Gol", additional_stats['Média de Finalizações por Gol']),
+        ("Médias de Finalizações em  Gol para 1 Gol", additional_stats['Médias de Finalizações No Gol Por Gol']),
+        ("Média de Escanteios a favor", additional_stats['Média de Escanteios']),
+    ], "#04b846"), 1)
 
 # Defensivas
 with col2:
     st.markdown("**Defesa**")
-    st.markdown("<div style='display: flex; flex-direction: column;'>", unsafe_allow_html=True)
-    colored_metric("Média de Gols Sofridos", additional_stats['Média de Gols Sofridos'], "#FF6347")
-    colored_metric("Média de Finalizações Sofridas", additional_stats['Média de Finalizações Sofridas'], "#FF6347")
-    colored_metric("Média de Finalizações no Gol Sofridas", additional_stats['Média de Finalizações no Gol Sofridas'], "#FF6347")
-    colored_metric("Eficiência de Finalização do Adversário (%) (no gol/total finalizações)", additional_stats['Eficiência Defensiva (%)'], "#FF6347")     
-    colored_metric("Médias de Finalizações Sofridas para 1 Gol Sofrido", additional_stats['Média de Chutes Sofridos por Gol'], "#FF6347")
-    colored_metric("Médias de Finalizações Sofridas em Gol para 1 Gol Sofrido", additional_stats['Média de Chutes no Gol Sofridos por Gol'], "#FF6347")
-    colored_metric("Média de Escanteios contra", additional_stats['Média de Escanteios Sofridos'], "#FF6347")
-    st.markdown("</div>", unsafe_allow_html=True)
+    exibir_grade(cards_de_metricas([
+        ("Média de Gols Sofridos", additional_stats['Média de Gols Sofridos']),
+        ("Média de Finalizações Sofridas", additional_stats['Média de Finalizações Sofridas']),
+        ("Média de Finalizações no Gol Sofridas", additional_stats['Média de Finalizações no Gol Sofridas']),
+        ("Eficiência de Finalização do Adversário (%) (no gol/total finalizações)", additional_stats['Eficiência Defensiva (%)']),
+        ("Médias de Finalizações Sofridas para 1 Gol Sofrido", additional_stats['Média de Chutes Sofridos por Gol']),
+        ("Médias de Finalizações Sofridas em Gol para 1 Gol Sofrido", additional_stats['Média de Chutes no Gol Sofridos por Gol']),
+        ("Média de Escanteios contra", additional_stats['Média de Escanteios Sofridos']),
+    ], "#FF6347"), 1)
 
 with col3:
     st.markdown("**Totais**")
-    st.markdown("<div style='display: flex; flex-direction: column;'>", unsafe_allow_html=True)
-    colored_metric("Média de Gols Totais", additional_stats['Média de Gols Totais'], "#4503ad")
-    colored_metric("Médias de Escanteios Totais", additional_stats['Médias de Escanteios Totais'], "#4503ad")
-    st.markdown("</div>", unsafe_allow_html=True)
+    exibir_grade(cards_de_metricas([
+        ("Média de Gols Totais", additional_stats['Média de Gols Totais']),
+        ("Médias de Escanteios Totais", additional_stats['Médias de Escanteios Totais']),
+    ], "#4503ad"), 1)
 
 
 
@@ -3,6 +3,7 @@ import gspread as gs
 import streamlit as st
 from google.oauth2.service_account import Credentials
 import plotly.express as px
+from cards import card_html, exibir_grade, exibir_total
 
 credentials_json = {
     "type": st.secrets["type"],
@@ -88,42 +89,13 @@ a_odd = result_odds.get("A", 0)
 
 st.header("Análise de Resultados da MLB 2023 e 2024 (incluindo Playoffs)")
 
-st.markdown(f"""
-    <div style="text-align: center; padding: 10px; background-color: #061c96; border-radius: 25px;">
-        <h4 style="color: white;;font-size: 24px">Total de Jogos Filtrados</h4>
-        <h1 style="color: white;; font-size: 35px;">{total_games}</h1>
-    </div>
-""", unsafe_allow_html=True)
+exibir_total('Total de Jogos Filtrados', total_games, raio='25px')
 
 st.subheader("Resultados")
-
-col1, col2 = st.columns(2)
-    
-with col1:
-        st.markdown(
-        f"""
-        <div style="text-align: center; background-color: #061c96; padding: 10px; border-radius: 25px; margin-bottom: 10px;">
-            <h4 style="color: white; margin-bottom: 5px;"> Vitórias Home</h4>
-            <p style="color: white; font-size: 24px; margin: 0;">{h_freq}</p>
-            <p style="color: white;font-size: 20px; margin: 0;"> {h_perc:.2f} %</p>
-            <p style="color: white;font-size: 20px; margin: 0;"> Odd Justa: {h_odd:.2f}</p>
-        </div>
-        """,
-        unsafe_allow_html=True
-    )
-    
-with col2:
-        st.markdown(
-        f"""
-        <div style="text-align: center; background-color: #061c96; padding: 10px; border-radius: 25px; margin-bottom: 10px;">
-            <h4 style="color: white; margin-bottom: 5px;"> Vitórias Away</h4>
-            <p style="color: white; font-size: 24px; margin: 0;">{a_freq}</p>
-            <p style="color: white;font-size: 20px; margin: 0;"> {a_perc:.2f} %</p>
-            <p style="color: white;font-size: 20px; margin: 0;"> Odd Justa: {a_odd:.2f}</p>
-        </div>
-        """,
-        unsafe_allow_html=True
-    )
+exibir_grade([
+    card_html('Vitórias Home', [h_freq, f"{h_perc:.2f} %", f"Odd Justa: {h_odd:.2f}"], raio='25px'),
+    card_html('Vitórias Away', [a_freq, f"{a_perc:.2f} %", f"Odd Justa: {a_odd:.2f}"], raio='25px'),
+], 2)
 
 # Analisando handicap
 total_handicap, positive_handicap, negative_handicap = analyze_handicap(filtered_data)
@@ -137,30 +109,10 @@ else: st.subheader("Não há jogos filtrados com esses critérios. Revise seus f
 
 st.subheader("Handicaps")
 
-col1, col2 = st.columns(2)
-    
-with col1:
-        st.markdown(
-        f"""
-        <div style="text-align: center; background-color: #061c96; padding: 10px; border-radius: 25px; margin-bottom: 10px;">
-            <h4 style="color: white; margin-bottom: 5px;"> Handicap - </h4>
-            <p style="color: white; font-size: 24px; margin: 0;">{negative_handicap}</p>
-            <p style="color: white; font-size: 24px; margin: 0;">{neg_porcent:.2f} %</p>
-        </div>
-        """,
-        unsafe_allow_html=True
-    )
-with col2:
-        st.markdown(
-        f"""
-        <div style="text-align: center; background-color: #061c96; padding: 10px; border-radius: 25px; margin-bottom: 10px;">
-            <h4 style="color: white; margin-bottom: 5px;"> Handicap + </h4>
-            <p style="color: white; font-size: 24px; margin: 0;">{positive_handicap}</p>
-            <p style="color: white; font-size: 24px; margin: 0;">{pos_porcent:.2f} %</p>
-        </div>
-        """,
-        unsafe_allow_html=True
-    )
+exibir_grade([
+    card_html('Handicap -', [negative_handicap, f"{neg_porcent:.2f} %"], raio='25px'),
+    card_html('Handicap +', [positive_handicap, f"{pos_porcent:.2f} %"], raio='25px'),
+], 2)
     
 # Exibir análise de handicap
 st.write("### Gráfico de Handicap")
@@ -1,47 +1,23 @@
 import streamlit as st
-from nba_api.stats.endpoints import playergamelog, commonplayerinfo
-from nba_api.stats.static import players
 import pandas as pd
 import numpy as np
-
-# Função para buscar jogadores
-def search_players(active_only=False):
-    all_players = players.get_players()
-    if active_only:
-        active_players = [player for player in all_players if player['is_active']]
-        return active_players
-    else:
-        return all_players
-
-# Função para buscar o ID do jogador pelo nome completo
-def get_player_id(player_name, player_list):
-    player = [player for player in player_list if player['full_name'].lower() == player_name.lower()]
-    if player:
-        return player[0]['id']
-    else:
-        return None
+from functions import get_player_info
+from nba_store import logs_da_carreira, temporada_nba
+from nba_form import ESTATISTICAS_FORMA, preparar_carreira, medias_moveis, forma_exponencial, resumo_de_forma, divisoes
+from nba_props import MERCADOS_PROPS, tabela_de_linhas
+from nba_catalog import get_player_catalog, id_pelo_nome, buscar_nomes
 
 # Função para buscar as temporadas do jogador
 def get_player_seasons(player_id):
-    info = commonplayerinfo.CommonPlayerInfo(player_id=player_id)
-    seasons = info.get_data_frames()[0]['FROM_YEAR'].values[0], info.get_data_frames()[0]['TO_YEAR'].values[0]
+    info = get_player_info(player_id)
+    seasons = info['FROM_YEAR'].values[0], info['TO_YEAR'].values[0]
     return list(range(int(seasons[0]), int(seasons[1]) + 1))
 
-# Função para buscar os boxscores
-def get_player_boxscores(player_id, season):
-    gamelog = playergamelog.PlayerGameLog(player_id=player_id, season=season)
-    df = gamelog.get_data_frames()[0]  # Converte para DataFrame
-    df["GAME_DATE"] = pd.to_datetime(df["GAME_DATE"])
-    df = df.sort_values(by="GAME_DATE", ascending=True)
-    return df
-
-# Função para calcular médias
-def calculate_averages(df, columns):
-    return df[columns].mean()
-
-# Função para calcular médias dos últimos 5 ou 10 jogos
-def calculate_last_n_games_average(df, columns, n):
-    return df[columns].tail(n).mean()
+# Função para carregar os jogos do jogador nas temporadas informadas de uma vez (em paralelo, da base local),
+# para que a troca de temporada não faça uma nova busca
+def get_player_career(player_id, seasons):
+    career = logs_da_carreira(player_id, seasons)
+    return preparar_carreira(career) if not career.empty else career
 
 # Streamlit interface
 st.title("Análise de Jogadores da NBA")
@@ -49,17 +25,20 @@ st.title("Análise de Jogadores da NBA")
 # Checkbox para selecionar se deseja exibir apenas jogadores ativos
 active_only = st.checkbox("Mostrar apenas jogadores ativos", value=True)
 
-# Buscar lista de todos os jogadores (com base no checkbox)
-nba_players = search_players(active_only=active_only)
+# Catálogo de jogadores indexado (carregado uma vez por processo), com os nomes já ordenados
+player_catalog = get_player_catalog()
+player_names = player_catalog['nomes_ativos'] if active_only else player_catalog['nomes']
 
-# Lista de nomes dos jogadores
-player_names = sorted([player['full_name'] for player in nba_players])
+# Busca aproximada pelo nome (prefixo ou n-gramas), opcional
+search_text = st.text_input("Buscar jogador (nome ou parte do nome)")
+if search_text:
+    player_names = buscar_nomes(player_catalog, search_text, apenas_ativos=active_only, limite=20) or player_names
 
 # Campo de seleção de jogador
 selected_player_name = st.selectbox("Selecione um jogador", player_names)
 
 # Buscar o ID do jogador selecionado
-player_id = get_player_id(selected_player_name, nba_players)
+player_id = id_pelo_nome(player_catalog, selected_player_name)
 
 if player_id:
     # Buscar as temporadas disponíveis para o jogador
@@ -70,8 +49,16 @@ if player_id:
     
     season = st.selectbox("Selecione a temporada", available_seasons)
 
-    # Buscar os boxscores do jogador na temporada selecionada
-    df = get_player_boxscores(player_id, str(season))
+    # Carreira completa sob demanda: cada temporada exige o log de jogos da liga inteira
+    load_career = st.checkbox(
+        "Carregar a carreira completa", value=False,
+        help="Baixa o log de jogos da liga inteira de cada temporada do jogador (temporadas já na base local não são baixadas de novo)."
+    )
+    loaded_seasons = available_seasons if load_career else [season]
+
+    # Jogos das temporadas carregadas e os da temporada selecionada
+    career = get_player_career(player_id, loaded_seasons)
+    df = career[career['Temporada'] == temporada_nba(season)] if not career.empty else career
 
     if not df.empty:
         # Exibir número de partidas disputadas na temporada
@@ -86,94 +73,67 @@ if player_id:
         st.subheader(f"Frequência de {selected_stat}")
         st.bar_chart(df[selected_stat].value_counts().sort_index())
 
-        # Definir as faixas de pontos
-        point_thresholds = [5, 10, 15, 20, 25, 30, 35, 40]  # Faixas de 5 em 5 até 40
-        games_in_ranges = []
-
-        # Calcular a quantidade de jogos em cada faixa
-        for threshold in point_thresholds:
-            count = df[df['PTS'] >= threshold].shape[0]
-            games_in_ranges.append(count)
+        # Linhas de props: todas as linhas de todas as estatísticas e combinações calculadas de uma vez
+        st.subheader("Linhas de Props na Temporada")
+        prop_lines = tabela_de_linhas(df)
+        prop_market = st.selectbox("Selecione o mercado", MERCADOS_PROPS)
+        st.dataframe(prop_lines[prop_lines['Mercado'] == prop_market].drop(columns='Mercado'), hide_index=True)
 
-        # Criar um DataFrame para exibir os resultados
-        ranges_df = pd.DataFrame({
-            'Faixa de Pontos': [f"{threshold}+" for threshold in point_thresholds],
-            'Jogos': games_in_ranges,
-        })
+        # Médias da temporada e dos últimos jogos de cada janela (qualquer tamanho)
+        windows = sorted(st.multiselect("Janelas de jogos recentes", [3, 5, 10, 15, 20, 30], default=[3, 5, 10]))
+        form_summary = resumo_de_forma(df, windows, stats_options)
+        season_averages = form_summary.loc['Temporada Total']
 
-        # Calcular a frequência relativa
-        total_games = df.shape[0]
-        ranges_df['Frequência Relativa (%)'] = (ranges_df['Jogos'] / total_games * 100).round(1)
-        ranges_df['Odds'] = (100 / ranges_df['Frequência Relativa (%)']).round(2)
-        ranges_df.set_index('Faixa de Pontos', inplace=True)
-               
-        # Médias da temporada
-        season_averages = calculate_averages(df, stats_options).round(1)       
-
-        # Médias dos últimos 3 jogos
-        if total_games >= 3:           
-            last_3_games_avg = calculate_last_n_games_average(df, stats_options, 3).round(1)
-        else:
-            st.write("Menos de 3 jogos disputados na temporada.")
-
-        # Médias dos últimos 5 jogos
-        if total_games >= 5:
-            
-            last_5_games_avg = calculate_last_n_games_average(df, stats_options, 5).round(1)
-           
-        else:
-            st.write("Menos de 5 jogos disputados na temporada.")
-
-        # Médias dos últimos 10 jogos
-        if total_games >= 10:
-            last_10_games_avg = calculate_last_n_games_average(df, stats_options, 10).round(1)
-        else:
-            st.write("Menos de 10 jogos disputados na temporada.")
+        for window in windows:
+            if total_games < window:
+                st.write(f"Menos de {window} jogos disputados na temporada.")
 
         # Exibir médias gerais e últimas médias de forma mais visual
         st.subheader("Médias Gerais e Recente dos Jogos")
 
-        # Criar colunas para mostrar as médias
-        col1, col2, col3, col4 = st.columns(4)
+        # Uma coluna para a temporada e uma para cada janela
+        columns = st.columns(len(windows) + 1)
 
-        # Exibir as médias da temporada
-        with col1:
+        with columns[0]:
             st.subheader("Temporada Total")
             for stat in stats_options:
                 st.metric(label=stat, value=season_averages[stat])
 
-        # Exibir as médias dos últimos 3 jogos (se houver)
-        if total_games >= 3:
-            with col2:
-                st.subheader("Últimos 3 Jogos")
-                for stat in stats_options:
-                    delta_value = (last_3_games_avg[stat] - season_averages[stat]).round(1)
-                    st.metric(label=stat, value=last_3_games_avg[stat], delta=delta_value)
-        else:
-            col2.write("Menos de 3 jogos.")
-
-        # Exibir as médias dos últimos 5 jogos (se houver)
-        if total_games >= 5:
-            with col3:
-                st.subheader("Últimos 5 Jogos")
-                for stat in stats_options:
-                    delta_value = (last_5_games_avg[stat] - season_averages[stat]).round(1)
-                    st.metric(label=stat, value=last_5_games_avg[stat], delta=delta_value)
-        else:
-            col3.write("Menos de 5 jogos.")
-
-        # Exibir as médias dos últimos 10 jogos (se houver)
-        if total_games >= 10:
-            with col4:
-                st.subheader("Últimos 10 Jogos")
-                for stat in stats_options:
-                    delta_value = (last_10_games_avg[stat] - season_averages[stat]).round(1)
-                    st.metric(label=stat, value=last_10_games_avg[stat], delta=delta_value)
-        else:
-            col4.write("Menos de 10 jogos.")
+        for column, window in zip(columns[1:], windows):
+            if total_games >= window:
+                window_averages = form_summary.loc[f'Últimos {window} Jogos']
+                with column:
+                    st.subheader(f"Últimos {window} Jogos")
+                    for stat in stats_options:
+                        delta_value = round(window_averages[stat] - season_averages[stat], 1)
+                        st.metric(label=stat, value=window_averages[stat], delta=delta_value)
+            else:
+                column.write(f"Menos de {window} jogos.")
 
         #st.dataframe(df)  
     else:
         st.write(f"Sem dados disponíveis para a temporada {season}.")
+
+    if not career.empty:
+        # Tendência de forma ao longo das temporadas carregadas (a carreira inteira, se marcada)
+        st.header(f"Tendência de Forma {'na Carreira' if load_career else 'na Temporada'} ({len(career)} jogos)")
+        trend_stat = st.selectbox("Estatística da tendência", ESTATISTICAS_FORMA, key='trend_stat')
+        trend_window = st.number_input("Janela da média móvel (jogos)", min_value=1, value=10, step=1)
+        half_life = st.number_input("Meia-vida da média exponencial (jogos)", min_value=1, value=5, step=1)
+
+        trend = pd.DataFrame({
+            f'Média Móvel ({trend_window} jogos)': medias_moveis(career, [trend_window], [trend_stat])[trend_window][trend_stat],
+            'Média Exponencial': forma_exponencial(career, half_life, [trend_stat])[trend_stat],
+        })
+        trend.index = career['GAME_DATE']
+        st.line_chart(trend)
+
+        # Recortes da carreira: temporada, mando e adversário
+        st.subheader("Médias por Temporada")
+        st.dataframe(divisoes(career, 'Temporada').sort_index(ascending=False))
+        st.subheader("Médias em Casa e Fora")
+        st.dataframe(divisoes(career, 'Mando'))
+        st.subheader("Médias por Adversário")
+        st.dataframe(divisoes(career, 'Adversário'))
 else:
     st.write(f"Erro ao buscar o jogador {selected_player_name}.")
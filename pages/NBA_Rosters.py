@@ -1,9 +1,10 @@
 import streamlit as st
 import pandas as pd
-from nba_api.stats.static import teams
-from nba_api.stats.endpoints import CommonTeamRoster, PlayerGameLog
 from functions import get_team_roster as getTeamRoster
-from functions import get_player_gamelog as playerGamelog
+from functions import get_roster_gamelogs
+from nba_catalog import get_team_catalog, id_pelo_nome
+from nba_props import linhas_do_mercado, precificar_linha
+from nba_store import get_league_gamelogs, base_dos_gamelogs, logs_do_jogador, logs_do_elenco, jogadores_acima_da_linha
 
 # Função para obter o roster da equipe selecionada
 # def get_team_roster(team_id, season):
@@ -20,6 +21,8 @@ from functions import get_player_gamelog as playerGamelog
 def calculate_over_analysis(data, column, total_games, threshold):
     over_count = (data[column] >= threshold).sum()
     std_dev = data[column].std()  # Cálculo do desvio padrão
+    # Distribuição ajustada (Poisson / binomial negativa); 'threshold ou mais' é o over da linha threshold - 0.5
+    fitted = precificar_linha(data, column, threshold - 0.5).iloc[0]
     
     freq_df = pd.DataFrame({
         'Total Jogos': [total_games],
@@ -27,6 +30,8 @@ def calculate_over_analysis(data, column, total_games, threshold):
         'Porcentagem': [(over_count / total_games * 100).round(1)],
         'Odds': [(total_games / over_count).round(2) if over_count > 0 else None],
         'Desvio Padrão': [std_dev.round(2)],  # Adiciona o desvio padrão à tabela
+        'Porcentagem Ajustada': [fitted['Over (%)']],
+        'Odds Ajustadas': [fitted['Odd Over']],
     })
     return freq_df
 
@@ -40,16 +45,16 @@ def display_styled_table(data):
             <strong>{row['Frequência']} ocorrências</strong><br>
             <strong>{row['Porcentagem']}%</strong> <br>
             <strong>Odd: {row['Odds']} </strong> <br>
-            <strong>Desvio Padrão <br> {row['Desvio Padrão']}</strong> 
+            <strong>Desvio Padrão <br> {row['Desvio Padrão']}</strong> <br>
+            <strong>Ajustada: {row['Porcentagem Ajustada']}% (Odd: {row['Odds Ajustadas']})</strong>
         </div>
         '''
     styled_table += '</div>'
     st.markdown(styled_table, unsafe_allow_html=True)
 
 
-# Obter as equipes da NBA
-nba_teams = teams.get_teams()
-team_names = {team['full_name']: team['id'] for team in nba_teams}
+# Obter as equipes da NBA (catálogo indexado, carregado uma vez por processo)
+team_catalog = get_team_catalog()
 
 # Título da página
 st.title("Análise de Jogadores da NBA")
@@ -58,10 +63,10 @@ st.title("Análise de Jogadores da NBA")
 selected_season = st.sidebar.selectbox("Selecione uma temporada",options=['2024-25','2023-24','2022-23','2021-22'])
 
 # Selecionar uma equipe
-selected_team = st.sidebar.selectbox("Selecione uma equipe da NBA", options=list(sorted(team_names.keys())))
+selected_team = st.sidebar.selectbox("Selecione uma equipe da NBA", options=team_catalog['nomes'])
 
 # Obter o ID da equipe selecionada
-team_id = team_names[selected_team]
+team_id = id_pelo_nome(team_catalog, selected_team)
 
 # Obter o roster da equipe
 roster_data = getTeamRoster(team_id, selected_season)
@@ -70,8 +75,18 @@ roster_data = getTeamRoster(team_id, selected_season)
 selected_player = st.sidebar.selectbox("Selecione um jogador", options=sorted(roster_data['PLAYER'].tolist()))
 player_id = roster_data.loc[roster_data['PLAYER'] == selected_player, 'PLAYER_ID'].values[0]
 
-# Obter os dados de jogo do jogador
-gamelog_data = playerGamelog(player_id, selected_season)
+# Obter os dados de jogo a partir da base local da liga. Sem a base da temporada (ex.: API indisponível
+# ou modo offline), os jogos do elenco inteiro vêm do PlayerGameLog em cache, buscados em paralelo
+nomes_elenco = roster_data.set_index('PLAYER_ID')['PLAYER']
+try:
+    league_gamelogs = get_league_gamelogs(selected_season)
+    base_elenco = league_gamelogs
+except Exception:
+    league_gamelogs = None
+    base_elenco = base_dos_gamelogs(get_roster_gamelogs(roster_data['PLAYER_ID'], selected_season), nomes_elenco)
+    st.warning(f"Base da liga indisponível para {selected_season}: usando os jogos do elenco salvos no cache do nba_api.")
+
+gamelog_data = logs_do_jogador(base_elenco, player_id)
 
 # Gerar análises para estatísticas selecionadas
 if not gamelog_data.empty:
@@ -125,3 +140,38 @@ if not gamelog_data.empty:
         st.write("Gráfico com frêquencias  de 3 PONTOS")
         st.bar_chart(gamelog_data['FG3M'].value_counts())
 
+    # Todas as linhas da estatística de uma vez, sem precisar trocar a linha definida acima
+    st.subheader(f"Todas as linhas de {analyze_statistic} para {selected_player}")
+    st.dataframe(linhas_do_mercado(gamelog_data, analyze_statistic), hide_index=True)
+
+
+# Tabela de props do elenco: os jogos de todos os jogadores saem da base local da liga (ou do elenco em cache)
+st.header(f"Props do Elenco - {selected_team}")
+if base_elenco['logs'].empty:
+    st.info("Nenhum jogo do elenco disponível para a temporada.")
+elif st.checkbox("Analisar todo o elenco"):
+    stat_elenco = st.selectbox("Estatística do elenco", options=['PTS', 'REB', 'AST', 'FG3M'], key='stat_elenco')
+    linha_elenco = st.number_input("Linha do elenco (valor mínimo)", min_value=0, value=10, max_value=150, key='linha_elenco')
+
+    gamelogs_elenco = logs_do_elenco(base_elenco, roster_data['PLAYER_ID'])
+    st.dataframe(jogadores_acima_da_linha(base_elenco, stat_elenco, linha_elenco, 0, player_ids=roster_data['PLAYER_ID']), hide_index=True)
+
+    # Probabilidades pela distribuição ajustada de cada jogador (peso maior para os jogos recentes),
+    # calculadas para o elenco inteiro em uma única chamada
+    st.subheader(f"Probabilidades Ajustadas - {stat_elenco} {linha_elenco}+ (Poisson / Binomial Negativa)")
+    logs_elenco = [logs for logs in gamelogs_elenco.values() if not logs.empty]
+    if logs_elenco:
+        projecao = precificar_linha(pd.concat(logs_elenco, ignore_index=True), stat_elenco, linha_elenco - 0.5)
+        projecao.insert(0, 'Jogador', projecao['PLAYER_ID'].map(nomes_elenco))
+        st.dataframe(projecao.drop(columns='PLAYER_ID').sort_values('Over (%)', ascending=False), hide_index=True)
+
+# Busca na liga inteira: jogadores com a estatística acima da linha em boa parte dos jogos
+st.header("Scanner da Liga")
+if league_gamelogs is None:
+    st.info("O scanner precisa da base da liga da temporada.")
+elif st.checkbox("Buscar em todos os jogadores da liga"):
+    stat_liga = st.selectbox("Estatística da liga", options=['PTS', 'REB', 'AST', 'FG3M'], key='stat_liga')
+    linha_liga = st.number_input("Linha da liga (valor mínimo)", min_value=0, value=25, max_value=150, key='linha_liga')
+    pct_liga = st.slider("Porcentagem mínima de jogos", min_value=0, max_value=100, value=60, key='pct_liga')
+    jogos_liga = st.number_input("Mínimo de jogos disputados", min_value=1, value=10, key='jogos_liga')
+    st.dataframe(jogadores_acima_da_linha(league_gamelogs, stat_liga, linha_liga, pct_liga, jogos_liga), hide_index=True)
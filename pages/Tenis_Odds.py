@@ -1,21 +1,13 @@
 import streamlit as st
 import pandas as pd
+import numpy as np
+from data_index import positions_in_odds_range, filter_positions
+from tennis_data import get_tennis_dataset, get_tennis_odds_index
+from cards import card_html, exibir_grade, exibir_total
 
-# Carregar os dados do arquivo CSV
-@st.cache_data
-def load_data(file):
-    data = pd.read_csv(file)
-    return data
-
-data = load_data('tennisdata.csv')
-
-# Substituir vírgulas por pontos nas colunas de odds
-data['B365W'] = data['B365W'].str.replace(',', '.')
-data['B365L'] = data['B365L'].str.replace(',', '.')
-
-# Converter as colunas de odds para tipo numérico
-data['B365W'] = data['B365W'].astype(float)
-data['B365L'] = data['B365L'].astype(float)
+# Dataset tipado (odds já numéricas, textos categóricos) e índice de odds, compartilhados entre sessões
+data = get_tennis_dataset()
+odds_index = get_tennis_odds_index()
 
 # Título da aplicação
 st.subheader("Análise de Odds em Partidas de Tênis - ATP (2010-2023)")
@@ -49,29 +41,24 @@ round_filter = st.sidebar.multiselect(
     default=['Todos']
 )
 
-# Ajustar os filtros para incluir "Todos"
-if 'Todos' in surface_filter:
-    surface_filter = data['Surface'].unique()
-if 'Todos' in series_filter:
-    series_filter = data['Series'].unique()
-if 'Todos' in round_filter:
-    round_filter = data['Round'].unique()
-
-# Filtrar os dados com base nos filtros adicionais
-filtered_data = data[
-    (data['Surface'].isin(surface_filter)) &
-    (data['Series'].isin(series_filter)) &
-    (data['Round'].isin(round_filter))
-]
-
-filtered_data = filtered_data[
-    ((filtered_data['B365W'] >= odd_min) & (filtered_data['B365W'] <= odd_max)) |
-    ((filtered_data['B365L'] >= odd_min) & (filtered_data['B365L'] <= odd_max))
-]
+# Posições das partidas em que a odd do vencedor ou do perdedor está na faixa (índice ordenado)
+posicoes_vitorias = positions_in_odds_range(odds_index, 'B365W', odd_min, odd_max)
+posicoes_derrotas = positions_in_odds_range(odds_index, 'B365L', odd_min, odd_max)
+posicoes = np.union1d(posicoes_vitorias, posicoes_derrotas)
+
+# Cruzar com os filtros adicionais ("Todos" mantém todas as partidas)
+if 'Todos' not in surface_filter:
+    posicoes = filter_positions(data, posicoes, 'Surface', surface_filter)
+if 'Todos' not in series_filter:
+    posicoes = filter_positions(data, posicoes, 'Series', series_filter)
+if 'Todos' not in round_filter:
+    posicoes = filter_positions(data, posicoes, 'Round', round_filter)
+
+filtered_data = data.iloc[posicoes]
 
 # Filtrar os dados para vitórias e derrotas com base nas odds
-filterVitorias = filtered_data[(filtered_data['B365W'] >= odd_min) & (filtered_data['B365W'] <= odd_max)]
-filterDerrotas = filtered_data[(filtered_data['B365L'] >= odd_min) & (filtered_data['B365L'] <= odd_max)]
+filterVitorias = data.iloc[np.intersect1d(posicoes, posicoes_vitorias)]
+filterDerrotas = data.iloc[np.intersect1d(posicoes, posicoes_derrotas)]
 
 # Cálculo da frequência de vitórias e derrotas
 vitorias = len(filterVitorias)
@@ -96,38 +83,13 @@ else:
     vitorias_pct = derrotas_pct = 0
     odd_vitoria = odd_derrota = 0
 
-# Exibir o total de partidas analisadas acima das colunas
-st.markdown(f"""
-    <div style='text-align: center;'>
-        <div style='background-color: #061c96; padding: 20px; border-radius: 10px; margin-bottom: 20px;'>
-            <h4 style='font-size: 22px; color: white;'>Total de Partidas Analisadas</h4>
-            <p style='font-size: 22px; color: white;'>{total_partidas}</p>
-        </div>
-    </div>
-""", unsafe_allow_html=True)
-
-# Criar duas colunas para vitórias e derrotas
-col1, col2 = st.columns(2)
-
-# Exibir vitórias na primeira coluna
-with col1:
-    st.markdown(f"""
-        <div style='background-color: green; padding: 20px; border-radius: 10px; margin-bottom: 10px; text-align: center;'>
-            <h4 style='color: white;'>Vitórias</h4>
-            <p style='font-size: 22px; color: white;'>{vitorias} ({vitorias_pct:.2f}%)</p>
-            <p style='font-size: 22px; color: white;'>Odd: {odd_vitoria:.2f}</p>
-        </div>
-    """, unsafe_allow_html=True)
-
-# Exibir derrotas na segunda coluna
-with col2:
-    st.markdown(f"""
-        <div style='background-color: red; padding: 20px; border-radius: 10px; margin-bottom: 10px;text-align: center;'>
-            <h4 style='color: white;'>Derrotas</h4>
-            <p style='font-size: 22px; color: white;'>{derrotas} ({derrotas_pct:.2f}%)</p>
-            <p style='font-size: 22px; color: white;'>Odd: {odd_derrota:.2f}</p>
-        </div>
-    """, unsafe_allow_html=True)
+# Exibir o total de partidas analisadas acima dos cards de vitórias e derrotas
+exibir_total('Total de Partidas Analisadas', total_partidas, raio='10px')
+
+exibir_grade([
+    card_html('Vitórias', [f"{vitorias} ({vitorias_pct:.2f}%)", f"Odd: {odd_vitoria:.2f}"], cor='green', raio='10px'),
+    card_html('Derrotas', [f"{derrotas} ({derrotas_pct:.2f}%)", f"Odd: {odd_derrota:.2f}"], cor='red', raio='10px'),
+], 2)
 
 # st.subheader("Dados Filtrados")
 # st.write(filtered_data)
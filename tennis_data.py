@@ -0,0 +1,72 @@
+import os
+
+import pandas as pd
+import streamlit as st
+
+from data_index import build_odds_index
+
+# Arquivos de dados do tênis (ATP, 2010-2023)
+ARQUIVO_CSV = 'tennisdata.csv'
+ARQUIVO_PARQUET = 'tennisdata.parquet'
+
+# Odds publicadas com vírgula decimal no CSV ("3,56")
+COLUNAS_ODDS = ['B365W', 'B365L']
+
+# Colunas com nomes de jogadores, que compartilham as mesmas categorias
+COLUNAS_JOGADORES = ['Winner', 'Loser']
+
+# Colunas de texto repetitivo guardadas como categorias
+COLUNAS_CATEGORICAS = ['Location', 'Tournament', 'Series', 'Court', 'Surface', 'Round']
+
+
+# Função para converter o CSV em um arquivo colunar e tipado (Parquet), normalizando as odds,
+# as datas e os textos uma única vez
+def converter_csv_para_parquet(arquivo_csv=ARQUIVO_CSV, arquivo_parquet=ARQUIVO_PARQUET):
+    data = pd.read_csv(arquivo_csv, low_memory=False)
+
+    # Odds em float64, exatamente como publicadas: os filtros comparam com os valores digitados na página
+    for coluna in COLUNAS_ODDS:
+        data[coluna] = pd.to_numeric(data[coluna].astype(str).str.replace(',', '.'), errors='coerce')
+
+    if 'Date' in data.columns:
+        data['Date'] = pd.to_datetime(data['Date'], dayfirst=True, errors='coerce')
+
+    # Vencedor e perdedor usam a mesma lista de categorias para que os códigos sejam comparáveis
+    # Nomes ausentes continuam como NaN (e não viram uma categoria 'nan')
+    jogadores = sorted(pd.Series(data[COLUNAS_JOGADORES].values.ravel('K')).dropna().astype(str).unique())
+    for coluna in COLUNAS_JOGADORES:
+        data[coluna] = pd.Categorical(data[coluna].astype(str).where(data[coluna].notna()), categories=jogadores)
+
+    for coluna in COLUNAS_CATEGORICAS:
+        if coluna in data.columns:
+            data[coluna] = data[coluna].astype('category')
+
+    data.to_parquet(arquivo_parquet, index=False)
+    return data
+
+
+# Função para carregar o dataset de tênis (conversão feita uma única vez ou quando o CSV for atualizado)
+def load_tennis_data(columns=None, arquivo_parquet=ARQUIVO_PARQUET, arquivo_csv=ARQUIVO_CSV):
+    if not os.path.exists(arquivo_parquet) or (
+        os.path.exists(arquivo_csv) and os.path.getmtime(arquivo_csv) > os.path.getmtime(arquivo_parquet)
+    ):
+        converter_csv_para_parquet(arquivo_csv, arquivo_parquet)
+
+    return pd.read_parquet(arquivo_parquet, columns=columns)
+
+
+# Função para carregar o dataset único do processo, compartilhado entre sessões (sem cópia).
+# O DataFrame retornado não deve ser modificado: a página sempre filtra para um novo DataFrame.
+@st.cache_resource
+def get_tennis_dataset():
+    return load_tennis_data()
+
+
+# Função para obter o índice ordenado das odds de vencedor e perdedor, montado uma vez por processo
+@st.cache_resource
+def get_tennis_odds_index():
+    return build_odds_index(get_tennis_dataset(), COLUNAS_ODDS)
+
+
+if __name__ == '__main__':
+    converter_csv_para_parquet()
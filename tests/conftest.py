@@ -0,0 +1,86 @@
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# Os módulos do projeto ficam na raiz do repositório
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from football_data import build_football_dataset  # noqa: E402
+
+
+# Função para gerar um CSV pequeno no formato do FootballData.csv (3 ligas, 8 equipes cada),
+# com datas, estatísticas e odds faltando em alguns jogos
+def gerar_csv_futebol(arquivo, total_jogos=900, semente=0):
+    rng = np.random.default_rng(semente)
+    ligas = np.array(['E0', 'SP1', 'D1'])
+    div = rng.choice(ligas, total_jogos)
+    numero_casa = rng.integers(0, 8, total_jogos)
+    numero_fora = (numero_casa + rng.integers(1, 8, total_jogos)) % 8
+    casa = np.char.add(np.char.add(div, '_T'), numero_casa.astype(str))
+    fora = np.char.add(np.char.add(div, '_T'), numero_fora.astype(str))
+
+    datas = pd.Timestamp('2019-08-01') + pd.to_timedelta(np.sort(rng.integers(0, 3 * 365, total_jogos)), 'D')
+    datas = pd.Series(datas.strftime('%d/%m/%Y'), dtype=object)
+    datas[rng.choice(total_jogos, 10, replace=False)] = None
+
+    hthg, htag = rng.poisson(0.7, total_jogos), rng.poisson(0.5, total_jogos)
+    fthg, ftag = hthg + rng.poisson(0.8, total_jogos), htag + rng.poisson(0.6, total_jogos)
+
+    # Odds com 2 casas decimais, muitas delas exatamente nas bordas das faixas (1.50, 2.00, ...)
+    p_casa = rng.uniform(0.1, 0.85, total_jogos)
+    p_empate = rng.uniform(0.15, 0.3, total_jogos)
+    p_fora = np.clip(1 - p_casa - p_empate, 0.03, None)
+    margem = (p_casa + p_empate + p_fora) * 1.05
+
+    data = pd.DataFrame({
+        'Div': div, 'Date': datas, 'HomeTeam': casa, 'AwayTeam': fora,
+        'FTHG': fthg, 'FTAG': ftag,
+        'FTR': np.where(fthg > ftag, 'H', np.where(fthg < ftag, 'A', 'D')),
+        'HTHG': hthg, 'HTAG': htag,
+        'HTR': np.where(hthg > htag, 'H', np.where(hthg < htag, 'A', 'D')),
+        'HS': rng.poisson(13, total_jogos).astype(float), 'AS': rng.poisson(10, total_jogos),
+        'HST': rng.poisson(5, total_jogos), 'AST': rng.poisson(4, total_jogos),
+        'HF': rng.poisson(11, total_jogos), 'AF': rng.poisson(12, total_jogos),
+        'HC': rng.poisson(5.5, total_jogos), 'AC': rng.poisson(4.5, total_jogos),
+        'HY': rng.poisson(1.5, total_jogos), 'AY': rng.poisson(1.8, total_jogos),
+        'HR': rng.poisson(0.05, total_jogos), 'AR': rng.poisson(0.07, total_jogos),
+        'B365H': np.round(margem / p_casa, 2), 'B365D': np.round(margem / p_empate, 2), 'B365A': np.round(margem / p_fora, 2),
+    })
+    data.loc[rng.choice(total_jogos, 15, replace=False), 'HS'] = np.nan
+    data.loc[rng.choice(total_jogos, 5, replace=False), 'B365D'] = np.nan
+    data.to_csv(arquivo, index=False)
+
+
+# Dataset de futebol montado pelo mesmo caminho das páginas (CSV -> Parquet -> colunas derivadas)
+@pytest.fixture(scope='session')
+def futebol(tmp_path_factory):
+    diretorio = tmp_path_factory.mktemp('futebol')
+    arquivo_csv = str(diretorio / 'FootballData.csv')
+    gerar_csv_futebol(arquivo_csv)
+    return build_football_dataset(arquivo_parquet=str(diretorio / 'FootballData.parquet'), arquivo_csv=arquivo_csv)
+
+
+# Jogos da liga no formato do LeagueGameLog (4 jogadores, 2 temporadas), com estatísticas em branco
+@pytest.fixture(scope='session')
+def nba_logs():
+    rng = np.random.default_rng(1)
+    partes = []
+    for player_id, nome, media in [(2544, 'LeBron James', 24), (203999, 'Nikola Jokić', 26), (1629029, 'Luka Dončić', 28), (7, 'Reserva', 4)]:
+        for ano in [2022, 2023]:
+            total = rng.integers(5, 40)
+            datas = pd.Timestamp(f'{ano}-10-20') + pd.to_timedelta(np.sort(rng.choice(170, total, replace=False)), 'D')
+            partes.append(pd.DataFrame({
+                'SEASON_ID': f'2{ano}', 'PLAYER_ID': player_id, 'PLAYER_NAME': nome, 'GAME_DATE': datas,
+                'MATCHUP': np.where(rng.random(total) < 0.5, 'LAL vs. BOS', 'LAL @ DEN'),
+                'PTS': rng.poisson(media, total).astype(float), 'REB': rng.poisson(7, total).astype(float),
+                'AST': rng.poisson(6, total).astype(float), 'FG3M': rng.poisson(2, total).astype(float),
+                'FG3A': rng.poisson(6, total).astype(float), 'STL': rng.poisson(1, total).astype(float),
+                'BLK': rng.poisson(1, total).astype(float), 'TOV': rng.poisson(3, total).astype(float),
+                'MIN': rng.uniform(10, 40, total).round(1),
+            }))
+    logs = pd.concat(partes, ignore_index=True)
+    logs.loc[rng.choice(len(logs), 6, replace=False), 'REB'] = np.nan
+    return logs
@@ -0,0 +1,199 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from backtest import (MERCADOS, calcular_backtest, backtest_agrupado, varredura_backtest, grade_de_odds,
+                      faixas_de_odds, probabilidade_por_faixa, simular_gestao, calcular_backtest_gestao)
+from football_data import odds_decimais
+
+
+# Cálculo original da página, aposta a aposta (referência para o backtest vetorizado)
+def backtest_linha_a_linha(data, mercado, banca_inicial, valor_aposta):
+    banca = banca_inicial
+    total_apostas = 0
+    apostas_ganhas = 0
+    apostas_perdidas = 0
+    evolucao_banca = [banca_inicial]
+
+    for index, row in data.iterrows():
+        odd = 0
+        resultado = row['FTR']
+
+        if mercado == '1 (Casa)':
+            odd = row['B365H']
+            aposta_vencedora = (resultado == 'H')
+        elif mercado == 'X (Empate)':
+            odd = row['B365D']
+            aposta_vencedora = (resultado == 'D')
+        elif mercado == '2 (Visitante)':
+            odd = row['B365A']
+            aposta_vencedora = (resultado == 'A')
+        elif mercado == '1X (Casa ou Empate)':
+            odd = row['B365_1X']
+            aposta_vencedora = (resultado == 'H' or resultado == 'D')
+        elif mercado == 'X2 (Empate ou Visitante)':
+            odd = row['B365_X2']
+            aposta_vencedora = (resultado == 'D' or resultado == 'A')
+        elif mercado == '12 (Casa ou Visitante)':
+            odd = row['B365_12']
+            aposta_vencedora = (resultado == 'H' or resultado == 'A')
+
+        if aposta_vencedora:
+            ganho = valor_aposta * (odd - 1)
+            banca += ganho
+            apostas_ganhas += 1
+        else:
+            banca -= valor_aposta
+            apostas_perdidas += 1
+
+        total_apostas += 1
+        evolucao_banca.append(banca)
+
+    roi = round(((banca - banca_inicial) / banca_inicial) * 100, 2)
+    return banca, total_apostas, apostas_ganhas, apostas_perdidas, roi, evolucao_banca
+
+
+# Odds em float64 como publicadas, que é o que o cálculo original recebia do CSV
+def com_odds_publicadas(data):
+    data = data.copy()
+    for odds_col, _ in MERCADOS.values():
+        data[odds_col] = odds_decimais(data[odds_col])
+    return data
+
+
+def mesmo_valor(a, b):
+    return a == b or (np.isnan(a) and np.isnan(b))
+
+
+@pytest.mark.parametrize('mercado', list(MERCADOS))
+def test_backtest_igual_ao_calculo_linha_a_linha(futebol, mercado):
+    esperado = backtest_linha_a_linha(com_odds_publicadas(futebol), mercado, 1000.0, 10.0)
+    obtido = calcular_backtest(futebol, mercado, 1000.0, 10.0)
+
+    assert obtido[1:4] == esperado[1:4]
+    assert mesmo_valor(obtido[0], esperado[0])
+    assert mesmo_valor(obtido[4], esperado[4])
+    np.testing.assert_array_equal(obtido[5], np.array(esperado[5]))
+
+
+def test_backtest_sem_odds_faltando_e_exato(futebol):
+    data = futebol[futebol['B365D'].notna()]
+    banca, total, ganhas, perdidas, roi, evolucao = calcular_backtest(data, 'X (Empate)', 500.0, 25.0)
+    esperado = backtest_linha_a_linha(com_odds_publicadas(data), 'X (Empate)', 500.0, 25.0)
+
+    assert (banca, total, ganhas, perdidas, roi) == esperado[:5]
+    assert not np.isnan(evolucao).any()
+
+
+@pytest.mark.parametrize('mercado', ['1 (Casa)', 'X (Empate)'])
+def test_backtest_agrupado_igual_ao_backtest_por_grupo(futebol, mercado):
+    agrupado = backtest_agrupado(futebol, mercado, 1000.0, 10.0, ['Div', 'Temporada']).set_index(['Div', 'Temporada'])
+
+    for (liga, temporada), grupo in futebol.groupby(['Div', 'Temporada'], observed=True):
+        banca, _, ganhas, perdidas, roi, evolucao = calcular_backtest(grupo, mercado, 1000.0, 10.0)
+        linha = agrupado.loc[(liga, temporada)]
+        assert linha['Apostas Ganhas'] == ganhas
+        assert linha['Apostas Perdidas'] == perdidas
+        assert mesmo_valor(linha['Banca Final'], banca)
+        assert mesmo_valor(linha['ROI'], roi)
+        assert linha['Zerou Banca'] == (np.nanmin(evolucao[1:]) <= 0)
+
+
+def test_backtest_agrupado_igual_ao_calculo_linha_a_linha_com_odds_repetidas():
+    # Odds repetidas sem representação exata em float: qualquer mudança na ordem das somas apareceria na banca
+    n = 600
+    data = pd.DataFrame({
+        'Div': np.tile(['E0', 'SP1', 'I1'], n // 3),
+        'FTR': np.where(np.arange(n) % 4 == 0, 'A', 'H'),
+        'B365H': np.tile([1.1, 1.3, 1.7], n // 3),
+        'B365D': 3.3,
+        'B365A': np.tile([2.9, 6.1, 3.7, 2.9, 6.1], n // 5),
+    })
+    data['B365_1X'] = data['B365_X2'] = data['B365_12'] = 1.1
+
+    for mercado in ['1 (Casa)', '2 (Visitante)']:
+        agrupado = backtest_agrupado(data, mercado, 1000.0, 10.0, 'Div').set_index('Div')
+        for liga, grupo in data.groupby('Div'):
+            banca, _, ganhas, perdidas, roi, _ = backtest_linha_a_linha(grupo, mercado, 1000.0, 10.0)
+            linha = agrupado.loc[liga]
+            assert linha['Banca Final'] == banca
+            assert linha['ROI'] == roi
+            assert (linha['Apostas Ganhas'], linha['Apostas Perdidas']) == (ganhas, perdidas)
+
+
+def test_varredura_igual_ao_backtest_filtrado(futebol):
+    grade = grade_de_odds(1.5, 3.0, 0.5)
+    varredura = varredura_backtest(futebol, ['1 (Casa)', '2 (Visitante)'], ['Todas', 'E0'], grade, 1000.0, 10.0)
+
+    for linha in varredura.to_dict('records'):
+        odds_col = MERCADOS[linha['Mercado']][0]
+        odds = odds_decimais(futebol[odds_col])
+        mascara = (odds >= linha['Odd Mínima']) & (odds <= linha['Odd Máxima'])
+        if linha['Liga'] != 'Todas':
+            mascara &= futebol['Div'] == linha['Liga']
+
+        banca, total, ganhas, perdidas, roi, _ = calcular_backtest(futebol[mascara], linha['Mercado'], 1000.0, 10.0)
+        assert (linha['Total de Apostas'], linha['Apostas Ganhas'], linha['Apostas Perdidas']) == (total, ganhas, perdidas)
+        assert linha['Banca Final'] == pytest.approx(banca)
+        assert linha['ROI'] == pytest.approx(roi, abs=0.011)
+
+
+def test_probabilidade_por_faixa_usa_apenas_apostas_anteriores(futebol):
+    mercado = '1 (Casa)'
+    probabilidades = probabilidade_por_faixa(futebol, mercado)
+    faixas = faixas_de_odds(futebol, mercado).to_numpy()
+    vitorias = futebol['FTR'].eq('H').to_numpy()
+
+    for i in range(len(futebol)):
+        anteriores = vitorias[:i][faixas[:i] == faixas[i]] if not pd.isna(faixas[i]) else []
+        if len(anteriores) == 0:
+            assert np.isnan(probabilidades[i])
+        else:
+            assert probabilidades[i] == pytest.approx(np.mean(anteriores))
+
+
+def test_gestao_aposta_fixa_igual_ao_backtest(futebol):
+    data = futebol[futebol['B365A'].notna()]
+    assert calcular_backtest_gestao(data, '2 (Visitante)', 1000.0, 'Aposta Fixa', valor_aposta=10.0)[:5] == \
+        calcular_backtest(data, '2 (Visitante)', 1000.0, 10.0)[:5]
+
+
+def test_gestao_percentual_igual_a_simulacao_sequencial():
+    rng = np.random.default_rng(3)
+    odds = np.round(rng.uniform(1.2, 4.0, 300), 2)
+    vitorias = rng.random(300) < 1 / odds
+
+    evolucao, apostas, corte = simular_gestao(odds, vitorias, 1000.0, '% da Banca', percentual=5.0)
+    assert corte is None
+
+    banca = 1000.0
+    for i, (odd, venceu) in enumerate(zip(odds, vitorias)):
+        aposta = banca * 0.05
+        assert apostas[i] == pytest.approx(aposta)
+        banca += aposta * (odd - 1) if venceu else -aposta
+        assert evolucao[i + 1] == pytest.approx(banca)
+
+
+def test_gestao_proporcional_para_no_limite_de_crescimento():
+    # Sequência só de vitórias: sem o limite a banca chegaria a inf
+    odds = np.full(5000, 3.0)
+    evolucao, apostas, corte = simular_gestao(odds, np.ones(5000, dtype=bool), 1000.0, '% da Banca', percentual=50.0)
+
+    assert np.isfinite(evolucao).all()
+    assert len(evolucao) == len(apostas) + 1 < 5001
+    assert corte == len(apostas)
+
+    # Uma parada antes do limite não conta como corte
+    vitorias = np.ones(5000, dtype=bool)
+    vitorias[:3] = False
+    evolucao, apostas, corte = simular_gestao(odds, vitorias, 1000.0, '% da Banca', percentual=50.0, stop_loss=70.0)
+    assert corte is None and len(apostas) < 3
+
+
+def test_martingale_dobra_apos_cada_derrota():
+    odds = np.full(6, 2.0)
+    vitorias = np.array([False, False, True, False, True, True])
+    evolucao, apostas, _ = simular_gestao(odds, vitorias, 1000.0, 'Martingale', valor_aposta=10.0)
+
+    np.testing.assert_array_equal(apostas, [10, 20, 40, 10, 20, 10])
+    np.testing.assert_array_equal(evolucao, [1000, 990, 970, 1010, 1000, 1020, 1030])
@@ -0,0 +1,40 @@
+import numpy as np
+import pytest
+
+from data_index import (build_odds_index, positions_in_odds_range, filter_positions, build_team_index, team_positions,
+                        fixture_positions, filter_positions_by_range)
+from football_data import COLUNAS_ODDS
+
+
+@pytest.mark.parametrize('odd_min, odd_max', [(1.01, 1000.0), (1.5, 2.0), (2.37, 2.37), (5.0, 2.0), (0.1, 1.0)])
+def test_faixa_de_odds_igual_a_mascara(futebol, odd_min, odd_max):
+    indice = build_odds_index(futebol, COLUNAS_ODDS)
+    for coluna in COLUNAS_ODDS:
+        tipo = futebol[coluna].dtype.type
+        mascara = (futebol[coluna] >= tipo(odd_min)) & (futebol[coluna] <= tipo(odd_max))
+        posicoes = positions_in_odds_range(indice, coluna, odd_min, odd_max)
+        np.testing.assert_array_equal(np.sort(posicoes), np.flatnonzero(mascara))
+
+        todas = np.arange(len(futebol))
+        np.testing.assert_array_equal(filter_positions_by_range(futebol, todas, coluna, odd_min, odd_max), np.flatnonzero(mascara))
+
+
+def test_filtro_de_ligas_igual_a_mascara(futebol):
+    posicoes = np.arange(len(futebol))
+    for ligas in [['E0'], ['SP1', 'D1'], ['Liga Inexistente'], []]:
+        np.testing.assert_array_equal(filter_positions(futebol, posicoes, 'Div', ligas), np.flatnonzero(futebol['Div'].isin(ligas)))
+
+
+def test_indice_de_equipes_igual_a_mascara(futebol):
+    indice = build_team_index(futebol)
+    for equipes in [['E0_T1'], ['E0_T1', 'SP1_T3'], ['Equipe Inexistente']]:
+        for coluna in ['HomeTeam', 'AwayTeam']:
+            np.testing.assert_array_equal(team_positions(indice, coluna, equipes), np.flatnonzero(futebol[coluna].isin(equipes)))
+
+
+def test_confrontos_igual_a_mascara(futebol):
+    indice = build_team_index(futebol)
+    for equipe_a, equipe_b in [('E0_T1', 'E0_T2'), ('D1_T7', 'D1_T0'), ('E0_T1', 'SP1_T1'), ('E0_T1', 'Equipe Inexistente')]:
+        mascara = ((futebol['HomeTeam'] == equipe_a) & (futebol['AwayTeam'] == equipe_b)) | \
+            ((futebol['HomeTeam'] == equipe_b) & (futebol['AwayTeam'] == equipe_a))
+        np.testing.assert_array_equal(np.sort(fixture_positions(indice, equipe_a, equipe_b)), np.flatnonzero(mascara))
@@ -0,0 +1,17 @@
+import pandas as pd
+
+from football_data import converter_csv_para_parquet
+
+
+def test_equipe_ausente_fica_em_branco_e_nao_vira_categoria(tmp_path):
+    pd.DataFrame({
+        'Div': ['E0', 'E0', 'E0'], 'Date': ['01/08/2020', '02/08/2020', '03/08/2020'],
+        'HomeTeam': ['Arsenal', 'Chelsea', None], 'AwayTeam': ['Chelsea', None, 'Arsenal'],
+        'FTHG': [1, 0, 2], 'FTAG': [0, 0, 1], 'FTR': ['H', 'D', 'H'],
+    }).to_csv(tmp_path / 'jogos.csv', index=False)
+    data = converter_csv_para_parquet(tmp_path / 'jogos.csv', tmp_path / 'jogos.parquet')
+
+    assert list(data['HomeTeam'].cat.categories) == ['Arsenal', 'Chelsea']
+    assert (data['HomeTeam'].cat.categories == data['AwayTeam'].cat.categories).all()
+    assert list(data['HomeTeam'].isna()) == [False, False, True]
+    assert list(data['AwayTeam'].cat.codes) == [1, -1, 0]
@@ -0,0 +1,55 @@
+import numpy as np
+import pytest
+
+from data_index import build_team_index, fixture_positions, filter_positions
+from football_h2h import SEM_LIGA, build_h2h_matrix, resultados_do_confronto, resumo_rodada, matriz_da_liga
+from football_stats import resumo_confrontos, resultados_de_contagens
+
+PARES = [('E0_T1', 'E0_T2'), ('SP1_T0', 'SP1_T5'), ('D1_T3', 'D1_T4'), ('E0_T1', 'SP1_T1')]
+
+
+@pytest.mark.parametrize('filtro_local', ['Todos', 'Casa/Fora'])
+def test_matriz_igual_aos_confrontos_filtrados(futebol, filtro_local):
+    h2h = build_h2h_matrix(futebol)
+    indice = build_team_index(futebol)
+
+    for equipe_a, equipe_b in PARES:
+        posicoes = fixture_positions(indice, equipe_a, equipe_b)
+        if filtro_local != 'Todos':
+            posicoes = filter_positions(futebol, posicoes, 'HomeTeam', [equipe_a])
+        jogos = futebol.iloc[posicoes]
+
+        esperado = resumo_confrontos(jogos, equipe_a, equipe_b)['por_mando'].drop(columns='Mando').sum()
+        obtido = resultados_do_confronto(h2h, equipe_a, equipe_b, filtro_local)
+        assert obtido['total'] == len(jogos)
+        assert obtido['resultados'] == resultados_de_contagens(
+            [esperado[f'Vitórias {equipe_a}'], esperado['Empates'], esperado[f'Vitórias {equipe_b}']], len(jogos)
+        )
+        assert obtido['gols'][equipe_a] == pytest.approx(esperado[f'Gols {equipe_a}'])
+        assert obtido['gols'][equipe_b] == pytest.approx(esperado[f'Gols {equipe_b}'])
+
+
+def test_rodada_e_matriz_da_liga(futebol):
+    h2h = build_h2h_matrix(futebol)
+    jogos = futebol[(futebol['HomeTeam'] == 'E0_T1') & (futebol['AwayTeam'] == 'E0_T2')]
+
+    rodada = resumo_rodada(h2h, [('E0_T1', 'E0_T2')], 'Casa/Fora').iloc[0]
+    assert rodada['Confrontos'] == len(jogos)
+    assert rodada['Over 2.5 (%)'] == round((jogos['FTHG'] + jogos['FTAG'] > 2.5).mean() * 100, 2)
+
+    matriz = matriz_da_liga(h2h, 'E0', 'Jogos')
+    assert matriz.loc['E0_T1', 'E0_T2'] == len(jogos)
+    assert matriz.to_numpy().sum() == (futebol['Div'] == 'E0').sum()
+    assert np.isnan(matriz_da_liga(h2h, 'E0', 'Média de Gols').loc['E0_T1', 'E0_T1'])
+
+
+def test_jogos_sem_liga_entram_na_matriz(futebol):
+    data = futebol.copy()
+    data.loc[data.index[:3], 'Div'] = np.nan
+    h2h = build_h2h_matrix(data)
+
+    assert h2h['ligas'][SEM_LIGA]['matriz'][..., 0].sum() == 3
+    assert sum(liga['matriz'][..., 0].sum() for liga in h2h['ligas'].values()) == len(data)
+    casa, fora = data.iloc[0]['HomeTeam'], data.iloc[0]['AwayTeam']
+    jogos = (futebol['HomeTeam'] == casa) & (futebol['AwayTeam'] == fora)
+    assert h2h['pares'][(casa, fora)][0] == jogos.sum()
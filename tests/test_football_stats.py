@@ -0,0 +1,108 @@
+import numpy as np
+import pytest
+
+from data_index import build_odds_index
+from football_data import COLUNAS_ODDS
+from football_stats import (build_stats_cube, consultar_cubo, resumir_jogos, total_de_jogos, resultados_do_resumo,
+                            medias_do_resumo, histograma_do_resumo, resumo_confrontos, ESTATISTICAS_LINHAS)
+
+
+@pytest.fixture(scope='module')
+def indice_odds(futebol):
+    return build_odds_index(futebol, COLUNAS_ODDS)
+
+
+# Filtro original das páginas: linhas com a odd entre odd_min e odd_max (no tipo da coluna) e a liga selecionada
+def filtrar_linhas(data, coluna_odds, ligas, odd_min, odd_max):
+    tipo = data[coluna_odds].dtype.type
+    mascara = (data[coluna_odds] >= tipo(odd_min)) & (data[coluna_odds] <= tipo(odd_max))
+    if ligas is not None:
+        mascara &= data['Div'].isin(ligas)
+    return data[mascara]
+
+
+# Consultas com bordas exatas das faixas do cubo, limites fora das faixas, faixa vazia e invertida
+CONSULTAS = [
+    (None, 1.01, 1000.0),
+    (None, 1.5, 2.0),
+    (['E0'], 1.55, 1.55),
+    (['SP1', 'D1'], 1.73, 3.37),
+    (['E0', 'Liga Inexistente'], 2.0, 6.5),
+    ([], 1.01, 1000.0),
+    (None, 5.0, 2.0),
+    (None, 0.5, 1.06),
+    (['D1'], 14.0, 200.0),
+]
+
+
+def consultas_aleatorias(total, semente=7):
+    rng = np.random.default_rng(semente)
+    for _ in range(total):
+        odd_min = round(rng.uniform(1.0, 8.0), 2)
+        odd_max = round(odd_min + rng.uniform(0.0, 6.0), 2)
+        ligas = None if rng.random() < 0.3 else list(rng.choice(['E0', 'SP1', 'D1'], rng.integers(1, 4), replace=False))
+        yield ligas, odd_min, odd_max
+
+
+@pytest.mark.parametrize('coluna_odds', ['B365H', 'B365A'])
+def test_cubo_igual_ao_filtro_por_linhas(futebol, indice_odds, coluna_odds):
+    cubo = build_stats_cube(futebol, coluna_odds)
+
+    for ligas, odd_min, odd_max in CONSULTAS + list(consultas_aleatorias(200)):
+        obtido = consultar_cubo(cubo, futebol, indice_odds, ligas, odd_min, odd_max)
+        esperado = resumir_jogos(filtrar_linhas(futebol, coluna_odds, ligas, odd_min, odd_max))
+
+        # Contagens exatas; somas das médias podem mudar na última casa pela ordem da soma
+        np.testing.assert_allclose(obtido, esperado, rtol=1e-12, atol=1e-9, err_msg=f'{ligas} {odd_min} {odd_max}')
+
+
+def test_resumo_igual_as_medidas_diretas(futebol):
+    resumo = resumir_jogos(futebol)
+
+    assert total_de_jogos(resumo) == len(futebol)
+    resultados = resultados_do_resumo(resumo)
+    assert resultados['Vitórias da Casa']['Contagem'] == (futebol['FTR'] == 'H').sum()
+    assert resultados['Empates']['Contagem'] == (futebol['FTR'] == 'D').sum()
+
+    medias = medias_do_resumo(resumo)
+    for coluna in ['FTHG', 'HS', 'AC']:
+        assert medias[coluna] == pytest.approx(futebol[coluna].astype('float64').mean())
+
+
+@pytest.mark.parametrize('estatistica', ESTATISTICAS_LINHAS)
+def test_histogramas_somam_todos_os_jogos_com_a_estatistica(futebol, estatistica):
+    histograma = histograma_do_resumo(resumir_jogos(futebol), estatistica)
+    # 'Finalizações' usa HS, que tem jogos em branco
+    esperado = futebol['HS'].notna().sum() if estatistica == 'Finalizações' else len(futebol)
+    assert histograma.sum() == esperado
+
+
+def test_histograma_de_gols_igual_a_contagem(futebol):
+    histograma = histograma_do_resumo(resumir_jogos(futebol), 'Gols')
+    gols = (futebol['FTHG'] + futebol['FTAG']).astype(int)
+    np.testing.assert_array_equal(histograma[:gols.max() + 1], np.bincount(gols))
+
+
+def test_resumo_confrontos_igual_a_contagem_por_jogo(futebol):
+    equipe_a, equipe_b = 'E0_T1', 'E0_T2'
+    jogos = futebol[futebol['HomeTeam'].isin([equipe_a, equipe_b]) & futebol['AwayTeam'].isin([equipe_a, equipe_b])]
+    confrontos = resumo_confrontos(jogos, equipe_a, equipe_b)
+
+    vitorias_a = ((jogos['HomeTeam'] == equipe_a) & (jogos['FTR'] == 'H')) | ((jogos['AwayTeam'] == equipe_a) & (jogos['FTR'] == 'A'))
+    totais = confrontos['por_mando'].drop(columns='Mando').sum()
+    assert totais[f'Vitórias {equipe_a}'] == vitorias_a.sum()
+    assert totais['Empates'] == (jogos['FTR'] == 'D').sum()
+    gols_a = np.where(jogos['HomeTeam'] == equipe_a, jogos['FTHG'], jogos['FTAG']).sum()
+    assert totais[f'Gols {equipe_a}'] == gols_a
+    assert confrontos['por_temporada']['Jogos'].sum() == len(jogos)
+    assert confrontos['por_mando']['Jogos'].sum() == len(jogos)
+
+
+def test_resumo_confrontos_rotula_jogos_sem_temporada(futebol):
+    jogos = futebol[futebol['Temporada'].isna()]
+    assert len(jogos) > 0
+
+    equipe_a, equipe_b = jogos.iloc[0]['HomeTeam'], jogos.iloc[0]['AwayTeam']
+    confrontos = resumo_confrontos(jogos.iloc[:1], equipe_a, equipe_b)
+    assert list(confrontos['por_temporada']['Temporada']) == ['Sem temporada']
+    assert 'nan' not in set(resumo_confrontos(futebol, equipe_a, equipe_b)['por_temporada']['Temporada'])
@@ -0,0 +1,19 @@
+import pandas as pd
+
+import functions
+from functions import get_roster_gamelogs
+
+
+def test_get_roster_gamelogs_busca_todo_o_elenco(monkeypatch):
+    def buscar(player_id, season):
+        if player_id == 3:
+            raise LookupError('sem resposta no cache')
+        return pd.DataFrame({'Player_ID': [player_id], 'SEASON_ID': [season]})
+
+    monkeypatch.setattr(functions, 'get_player_gamelog', buscar)
+    gamelogs = get_roster_gamelogs(pd.Series([1, 2, 3]), '2023-24')
+
+    assert list(gamelogs) == [1, 2, 3]
+    assert gamelogs[2]['Player_ID'].tolist() == [2] and gamelogs[2]['SEASON_ID'].tolist() == ['2023-24']
+    # Jogador com falha na busca fica vazio, sem derrubar o elenco
+    assert gamelogs[3].empty
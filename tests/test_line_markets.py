@@ -0,0 +1,42 @@
+import numpy as np
+
+from line_markets import mercado_de_linhas, odd_justa
+
+
+def test_linhas_iguais_a_contagem_direta():
+    rng = np.random.default_rng(5)
+    valores = rng.poisson(4, 500)
+    histograma = np.bincount(valores)
+    linhas = np.array([-1.5, -0.5, 0, 0.5, 2, 2.5, 3.5, 4, 7.5, len(histograma) - 1, len(histograma) - 0.5, len(histograma) + 10.5])
+
+    mercado = mercado_de_linhas(histograma, linhas)
+    for linha, over, devolucao, under in zip(linhas, mercado['Over'], mercado['Devolução'], mercado['Under']):
+        assert over == (valores > linha).sum()
+        assert devolucao == (valores == linha).sum()
+        assert under == (valores < linha).sum()
+
+
+def test_linhas_fora_do_histograma():
+    mercado = mercado_de_linhas(np.array([2, 3, 5]), [-0.5, 2.5, 10.5]).set_index('Linha')
+
+    assert mercado.loc[-0.5, 'Over (%)'] == 100.0
+    assert mercado.loc[2.5, 'Under (%)'] == 100.0
+    assert mercado.loc[10.5, 'Under (%)'] == 100.0
+    assert mercado.loc[10.5, 'Odd Over'] == 0
+
+
+def test_linhas_padrao_cobrem_o_histograma():
+    mercado = mercado_de_linhas(np.array([1, 0, 3, 1]))
+
+    np.testing.assert_array_equal(mercado['Linha'], [0.5, 1, 1.5, 2, 2.5])
+    np.testing.assert_array_equal(mercado['Under'], [1, 1, 1, 1, 4])
+    np.testing.assert_array_equal(mercado['Devolução'], [0, 0, 0, 3, 0])
+    np.testing.assert_array_equal(mercado['Odd Under'], [5.0, 5.0, 5.0, 2.0, 1.25])
+
+
+def test_odd_justa_desconsidera_a_devolucao():
+    # Linha 2 em [1, 0, 3, 1]: 1 over, 3 devoluções e 1 under -> odd 2.0 nos dois lados
+    mercado = mercado_de_linhas(np.array([1, 0, 3, 1]), [2]).iloc[0]
+    assert (mercado['Over'], mercado['Devolução'], mercado['Under']) == (1, 3, 1)
+    assert mercado['Odd Over'] == mercado['Odd Under'] == 2.0
+    assert odd_justa(0, 5) == 0 and np.isnan(odd_justa(0, 5, sem_odd=np.nan))
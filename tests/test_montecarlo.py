@@ -0,0 +1,64 @@
+import numpy as np
+import pytest
+
+from montecarlo import reamostrar_backtest, resumir_reamostragem, MIN_REAMOSTRAGENS
+
+
+# Drawdown máximo de um caminho calculado aposta a aposta
+def drawdown_sequencial(lucros, banca_inicial):
+    banca, pico, drawdown = banca_inicial, banca_inicial, 0.0
+    for lucro in lucros:
+        banca += lucro
+        pico = max(pico, banca)
+        drawdown = max(drawdown, pico - banca)
+    return drawdown
+
+
+@pytest.fixture
+def lucros():
+    rng = np.random.default_rng(11)
+    odds = np.round(rng.uniform(1.3, 3.5, 400), 2)
+    return np.where(rng.random(400) < 1 / odds, 10 * (odds - 1), -10.0)
+
+
+def test_ordem_embaralhada_mantem_roi(lucros):
+    resultado = reamostrar_backtest(lucros, 1000.0, reamostragens=300, metodo='Ordem Embaralhada', semente=1)
+    np.testing.assert_allclose(resultado['ROI'], lucros.sum() / 1000.0 * 100)
+    assert (resultado['Drawdown Máximo'] >= 0).all()
+
+
+def test_lotes_iguais_a_execucao_unica(lucros):
+    # O tamanho do lote só limita a memória: com a mesma semente os resultados não mudam
+    por_lote = reamostrar_backtest(lucros, 1000.0, reamostragens=250, limite_elementos=len(lucros) * 7, semente=3)
+    sem_lote = reamostrar_backtest(lucros, 1000.0, reamostragens=250, semente=3)
+    for chave in ['ROI', 'Drawdown Máximo', 'Quebrou']:
+        np.testing.assert_array_equal(por_lote[chave], sem_lote[chave])
+
+
+@pytest.mark.parametrize('metodo', ['Bootstrap', 'Ordem Embaralhada'])
+@pytest.mark.parametrize('lucro', [-7.0, 3.0])
+def test_drawdown_igual_ao_calculo_sequencial(metodo, lucro):
+    # Com lucros iguais toda reamostragem é o mesmo caminho
+    lucros = np.full(30, lucro)
+    resultado = reamostrar_backtest(lucros, 100.0, reamostragens=20, metodo=metodo, semente=0)
+    np.testing.assert_allclose(resultado['Drawdown Máximo'], drawdown_sequencial(lucros, 100.0))
+    np.testing.assert_allclose(resultado['ROI'], lucros.sum())
+    assert resultado['Quebrou'].all() == (100.0 + lucros.sum() <= 0)
+
+
+def test_orcamento_limita_reamostragens(lucros):
+    resultado = reamostrar_backtest(lucros, 1000.0, reamostragens=10000, orcamento_elementos=len(lucros) * 500)
+    assert resultado['Reamostragens'] == len(resultado['ROI']) == 500
+
+    minimo = reamostrar_backtest(lucros, 1000.0, reamostragens=10000, orcamento_elementos=1)
+    assert minimo['Reamostragens'] == MIN_REAMOSTRAGENS
+
+
+def test_quebra_e_resumo():
+    resultado = reamostrar_backtest(np.full(50, -10.0), 100.0, reamostragens=200, semente=0)
+    assert resultado['Quebrou'].all()
+
+    resumo = resumir_reamostragem(resultado)
+    assert resumo['Probabilidade de Quebra (%)'] == 100.0
+    assert resumo['Probabilidade de ROI Positivo (%)'] == 0.0
+    assert resumo['ROI Mediano'] == -500.0
@@ -0,0 +1,42 @@
+from nba_catalog import normalizar_nome, build_catalog, id_pelo_nome, buscar_por_prefixo, buscar_nomes
+
+REGISTROS = [
+    {'id': 1, 'full_name': 'Nikola Jokić', 'is_active': True},
+    {'id': 2, 'full_name': 'Nikola Jović', 'is_active': True},
+    {'id': 3, 'full_name': 'Jusuf Nurkić', 'is_active': True},
+    {'id': 4, 'full_name': 'Michael Jordan', 'is_active': False},
+    {'id': 5, 'full_name': 'Michael Jordan', 'is_active': True},
+    {'id': 6, 'full_name': 'LeBron James', 'is_active': True},
+]
+
+
+def test_normalizar_nome():
+    assert normalizar_nome('  Nikola JOKIĆ ') == 'nikola jokic'
+    assert normalizar_nome('Luka Dončić') == 'luka doncic'
+
+
+def test_id_pelo_nome_prefere_ativos():
+    catalogo = build_catalog(REGISTROS)
+    assert id_pelo_nome(catalogo, 'nikola jokic') == 1
+    assert id_pelo_nome(catalogo, 'Michael Jordan') == 5
+    assert id_pelo_nome(catalogo, 'Inexistente') is None
+
+
+def test_buscas_por_prefixo_e_aproximada():
+    catalogo = build_catalog(REGISTROS)
+    assert buscar_por_prefixo(catalogo, 'nik') == ['Nikola Jokić', 'Nikola Jović']
+    assert buscar_por_prefixo(catalogo, 'nik', limite=1) == ['Nikola Jokić']
+    assert buscar_por_prefixo(catalogo, 'michael', apenas_ativos=True) == ['Michael Jordan']
+
+    # Sobrenome e erro de digitação
+    assert buscar_nomes(catalogo, 'jokic')[0] == 'Nikola Jokić'
+    assert 'LeBron James' in buscar_nomes(catalogo, 'lebrom')
+    assert buscar_nomes(catalogo, 'xyzw') == []
+
+
+def test_registros_sem_nome_ficam_fora_da_busca():
+    catalogo = build_catalog(REGISTROS + [{'id': 7, 'full_name': None, 'is_active': True}])
+    assert 7 in catalogo['por_id']
+    assert catalogo['nomes'] == sorted(registro['full_name'] for registro in REGISTROS)
+    assert buscar_por_prefixo(catalogo, 'n') == ['Nikola Jokić', 'Nikola Jović']
+    assert id_pelo_nome(catalogo, 'None') is None
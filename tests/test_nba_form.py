@@ -0,0 +1,44 @@
+import numpy as np
+import pytest
+
+from nba_form import ESTATISTICAS_FORMA, preparar_carreira, medias_moveis, forma_exponencial, resumo_de_forma, divisoes
+
+
+@pytest.fixture
+def carreira(nba_logs):
+    return preparar_carreira(nba_logs[nba_logs['PLAYER_ID'] == 203999])
+
+
+def test_carreira_em_ordem_com_temporada_e_mando(carreira):
+    assert carreira['GAME_DATE'].is_monotonic_increasing
+    assert set(carreira['Temporada']) == {'2022-23', '2023-24'}
+    assert set(carreira['Mando']) == {'Casa', 'Fora'}
+    assert set(carreira['Adversário']) == {'BOS', 'DEN'}
+
+
+@pytest.mark.parametrize('janela', [1, 3, 10])
+def test_medias_moveis_iguais_ao_rolling(carreira, janela):
+    stats = ['PTS', 'AST', 'MIN']
+    obtido = medias_moveis(carreira, [janela], stats)[janela]
+    esperado = carreira[stats].astype('float64').rolling(janela).mean()
+    np.testing.assert_allclose(obtido.to_numpy(), esperado.to_numpy(), equal_nan=True)
+
+
+def test_janela_maior_que_a_carreira_fica_vazia(carreira):
+    assert medias_moveis(carreira, [len(carreira) + 1], ['PTS'])[len(carreira) + 1]['PTS'].isna().all()
+    assert resumo_de_forma(carreira, [len(carreira) + 1], ['PTS']).iloc[1].isna().all()
+
+
+def test_resumo_de_forma_usa_os_ultimos_jogos(carreira):
+    resumo = resumo_de_forma(carreira, [5], ['PTS', 'AST'])
+    assert resumo.loc['Temporada Total', 'PTS'] == round(carreira['PTS'].mean(), 1)
+    assert resumo.loc['Últimos 5 Jogos', 'AST'] == round(carreira['AST'].iloc[-5:].mean(), 1)
+
+
+def test_forma_exponencial_e_divisoes(carreira):
+    forma = forma_exponencial(carreira, 5, ['PTS'])
+    np.testing.assert_allclose(forma['PTS'], carreira['PTS'].ewm(halflife=5).mean())
+
+    por_mando = divisoes(carreira, 'Mando', ESTATISTICAS_FORMA)
+    assert por_mando['Jogos'].sum() == len(carreira)
+    assert por_mando.loc['Casa', 'PTS'] == round(carreira.loc[carreira['Mando'] == 'Casa', 'PTS'].mean(), 1)
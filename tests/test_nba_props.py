@@ -0,0 +1,65 @@
+import numpy as np
+import pytest
+from scipy import stats
+
+from nba_props import (MERCADOS_PROPS, COMBOS_PROPS, linhas_do_mercado, tabela_de_linhas, ajustar_distribuicoes,
+                       probabilidades_das_linhas, precificar_linha)
+
+
+@pytest.mark.parametrize('mercado', ['PTS', 'REB', 'PTS+REB+AST'])
+def test_linhas_iguais_a_contagem_direta(nba_logs, mercado):
+    jogos = nba_logs[nba_logs['PLAYER_ID'] == 2544]
+    # Jogos com alguma estatística do mercado em branco ficam de fora
+    valores = jogos[COMBOS_PROPS.get(mercado, [mercado])].sum(axis=1, skipna=False).dropna()
+
+    linhas = linhas_do_mercado(jogos, mercado, [0.5, 5, 5.5, 20, 20.5, 35.5, 500.5])
+    for linha, over, devolucao, under in zip(linhas['Linha'], linhas['Over'], linhas['Devolução'], linhas['Under']):
+        assert over == (valores > linha).sum()
+        assert devolucao == (valores == linha).sum()
+        assert under == (valores < linha).sum()
+
+
+def test_tabela_de_linhas_tem_todos_os_mercados(nba_logs):
+    tabela = tabela_de_linhas(nba_logs[nba_logs['PLAYER_ID'] == 7])
+    assert list(tabela['Mercado'].unique()) == MERCADOS_PROPS
+
+
+def test_ajuste_igual_as_medias_ponderadas_por_jogador(nba_logs):
+    ajustes = ajustar_distribuicoes(nba_logs, 'REB', meia_vida=4).set_index('PLAYER_ID')
+
+    for player_id, jogos in nba_logs.groupby('PLAYER_ID'):
+        jogos = jogos.dropna(subset=['REB']).sort_values('GAME_DATE', ascending=False)
+        pesos = 0.5 ** (np.arange(len(jogos)) / 4)
+        media = np.average(jogos['REB'], weights=pesos)
+
+        assert ajustes.loc[player_id, 'Jogos'] == len(jogos)
+        assert ajustes.loc[player_id, 'Média Ponderada'] == pytest.approx(media)
+
+
+def test_probabilidades_das_linhas_poisson_e_binomial_negativa(nba_logs):
+    ajustes = ajustar_distribuicoes(nba_logs, 'PTS')
+    over, devolucao, under = probabilidades_das_linhas(ajustes, [9.5, 25.5, 30.0])
+
+    for i, ajuste in ajustes.iterrows():
+        media, variancia = ajuste['Média Ponderada'], ajuste['Variância']
+        if ajuste['Distribuição'] == 'Poisson':
+            distribuicao = stats.poisson(media)
+        else:
+            r = media ** 2 / (variancia - media)
+            distribuicao = stats.nbinom(r, r / (r + media))
+        # Linha inteira 30: over = P(X > 30), devolução = P(X = 30) e under = P(X < 30)
+        np.testing.assert_allclose(over.loc[i].to_numpy(), distribuicao.sf([9, 25, 30]))
+        np.testing.assert_allclose(devolucao.loc[i].to_numpy(), [0, 0, distribuicao.pmf(30)], atol=1e-12)
+        np.testing.assert_allclose(under.loc[i].to_numpy(), distribuicao.cdf([9, 25, 29]))
+
+
+def test_precificar_linha_soma_100(nba_logs):
+    precos = precificar_linha(nba_logs, 'PTS+AST', 20.5)
+    np.testing.assert_allclose(precos['Over (%)'] + precos['Under (%)'], 100.0, atol=0.011)
+    assert (precos['Odd Over'].dropna() >= 1).all()
+
+    # Linha inteira: a devolução completa os 100% e a odd justa desconsidera a devolução
+    precos = precificar_linha(nba_logs, 'AST', 6)
+    np.testing.assert_allclose(precos['Over (%)'] + precos['Devolução (%)'] + precos['Under (%)'], 100.0, atol=0.016)
+    assert (precos['Devolução (%)'] > 0).all()
+    np.testing.assert_allclose(precos['Odd Over'], (precos['Over (%)'] + precos['Under (%)']) / precos['Over (%)'], atol=0.011)
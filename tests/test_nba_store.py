@@ -0,0 +1,98 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import nba_store
+from nba_store import (temporada_nba, get_league_gamelogs, base_dos_gamelogs, logs_do_jogador, logs_do_elenco, logs_da_carreira,
+                       jogadores_acima_da_linha)
+
+
+# Base da liga no formato de carregar_logs_da_liga: jogos ordenados por jogador e índice de PLAYER_ID
+@pytest.fixture
+def base(nba_logs):
+    logs = nba_logs.sort_values(['PLAYER_ID', 'GAME_DATE'], ascending=[True, False], kind='stable').reset_index(drop=True)
+    return {'logs': logs, 'ids': logs['PLAYER_ID'].to_numpy()}
+
+
+def test_temporada_nba():
+    assert temporada_nba(2023) == temporada_nba('2023') == temporada_nba('2023-24') == '2023-24'
+    assert temporada_nba(1999) == '1999-00'
+
+
+def test_logs_do_jogador_igual_ao_filtro(base, nba_logs):
+    for player_id in [7, 2544, 203999, 12345]:
+        esperado = nba_logs[nba_logs['PLAYER_ID'] == player_id]
+        obtido = logs_do_jogador(base, player_id)
+        assert len(obtido) == len(esperado)
+        assert (obtido['PLAYER_ID'] == player_id).all()
+
+    elenco = logs_do_elenco(base, [7, 12345])
+    assert elenco[12345].empty and len(elenco[7]) == (nba_logs['PLAYER_ID'] == 7).sum()
+
+
+def test_base_dos_gamelogs_igual_a_base_da_liga(base, nba_logs):
+    # Respostas do PlayerGameLog: sem PLAYER_NAME, com Player_ID e datas no formato da API
+    gamelogs = {
+        player_id: jogos.drop(columns='PLAYER_NAME').rename(columns={'PLAYER_ID': 'Player_ID'})
+        .assign(GAME_DATE=jogos['GAME_DATE'].dt.strftime('%b %d, %Y').str.upper())
+        for player_id, jogos in nba_logs.groupby('PLAYER_ID')
+    }
+    nomes = nba_logs.drop_duplicates('PLAYER_ID').set_index('PLAYER_ID')['PLAYER_NAME']
+    base_elenco = base_dos_gamelogs({**gamelogs, 12345: pd.DataFrame()}, nomes)
+
+    for player_id in [7, 2544, 12345]:
+        esperado = logs_do_jogador(base, player_id)
+        obtido = logs_do_jogador(base_dos_gamelogs(gamelogs, nomes), player_id)
+        assert list(obtido['GAME_DATE']) == list(esperado['GAME_DATE'])
+        assert list(obtido['PLAYER_NAME'].astype(str)) == list(esperado['PLAYER_NAME'])
+        assert len(logs_do_jogador(base_elenco, player_id)) == len(esperado)
+
+    assert base_dos_gamelogs({}, nomes)['logs'].empty
+
+    # Jogador sem nome no elenco: o nome fica em branco, sem virar a categoria 'nan'
+    sem_nome = base_dos_gamelogs({7: gamelogs[7]}, {})['logs']['PLAYER_NAME']
+    assert sem_nome.isna().all() and 'nan' not in sem_nome.cat.categories
+
+
+def test_jogadores_acima_da_linha_igual_a_contagem(base, nba_logs):
+    tabela = jogadores_acima_da_linha(base, 'PTS', 25, 0).set_index('Jogador')
+
+    for _, jogos in nba_logs.groupby('PLAYER_ID'):
+        linha = tabela.loc[jogos['PLAYER_NAME'].iloc[0]]
+        frequencia = (jogos['PTS'] >= 25).sum()
+        assert linha['Total Jogos'] == len(jogos)
+        assert linha['Frequência'] == frequencia
+        assert linha['Porcentagem'] == round(frequencia / len(jogos) * 100, 1)
+        assert linha['Desvio Padrão'] == round(jogos['PTS'].std(), 2)
+
+
+def test_jogadores_acima_da_linha_filtra_pct_jogos_e_elenco(base):
+    tabela = jogadores_acima_da_linha(base, 'PTS', 25, 0)
+
+    filtrada = jogadores_acima_da_linha(base, 'PTS', 25, 40, min_jogos=30)
+    esperado = tabela[(tabela['Porcentagem'] >= 40) & (tabela['Total Jogos'] >= 30)]
+    assert list(filtrada['Jogador']) == list(esperado['Jogador'])
+
+    elenco = jogadores_acima_da_linha(base, 'PTS', 25, 0, player_ids=[7, 2544, 12345])
+    assert set(elenco['Jogador']) == {'Reserva', 'LeBron James'}
+    # Sem nenhum jogo acima da linha a odd fica em branco
+    reserva = elenco.set_index('Jogador').loc['Reserva']
+    assert reserva['Frequência'] == 0 and np.isnan(reserva['Odds'])
+
+
+def test_carreira_le_apenas_temporadas_fora_do_cache(base, monkeypatch):
+    lidas = []
+
+    def carregar(season):
+        lidas.append(season)
+        return base
+
+    monkeypatch.setattr(nba_store, 'carregar_logs_da_liga', carregar)
+    monkeypatch.setattr(nba_store, '_temporadas_no_cache', {})
+    get_league_gamelogs.clear()
+
+    logs_da_carreira(2544, [2022])
+    carreira = logs_da_carreira(2544, ['2022-23', 2023])
+    assert lidas == ['2022-23', '2023-24']
+    assert len(carreira) == 2 * len(logs_do_jogador(base, 2544))
+    get_league_gamelogs.clear()